@@ -6,7 +6,7 @@ import Navbar from '../components/Navbar';
 import LoadingSpinner from '../components/LoadingSpinner';
 import { fetchDashboard, fetchStorageStats } from '../services/api';
 
-function StatCard({ icon: Icon, label, value, color }) {
+function StatCard({ icon: Icon, label, value, color, breakdown }) {
     return (
         <div className="card p-6 flex items-center gap-4">
             <div className={`w-12 h-12 rounded-xl flex items-center justify-center ${color}`}>
@@ -15,6 +15,11 @@ function StatCard({ icon: Icon, label, value, color }) {
             <div>
                 <p className="text-slate-400 text-sm">{label}</p>
                 <p className="text-3xl font-display font-bold text-white">{value}</p>
+                {breakdown && Object.keys(breakdown).length > 0 && (
+                    <p className="text-xs text-slate-500 mt-1">
+                        {Object.entries(breakdown).map(([key, count]) => `${key} ${count}`).join(' · ')}
+                    </p>
+                )}
             </div>
         </div>
     );
@@ -63,8 +68,8 @@ export default function DashboardPage() {
                 ) : (
                     <>
                         <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-5 mb-10">
-                            <StatCard icon={FolderOpen} label="Total Projects" value={data.total_projects} color="bg-brand-600" />
-                            <StatCard icon={Mail} label="Unread Inquiries" value={data.unread_inquiries} color="bg-amber-600" />
+                            <StatCard icon={FolderOpen} label="Total Projects" value={data.total_projects} color="bg-brand-600" breakdown={data.projects_by_category} />
+                            <StatCard icon={Mail} label="Unread Inquiries" value={data.unread_inquiries} color="bg-amber-600" breakdown={data.inquiries_by_status} />
                             <Link to="/inquiries" className="block">
                                 <div className="card p-6 flex items-center gap-4 hover:border-brand-500/40 transition-colors">
                                     <div className="w-12 h-12 rounded-xl flex items-center justify-center bg-purple-600">
@@ -19,7 +19,7 @@ export const adminLogin = (credentials) => api.post('/admin/login', credentials)
 
 // ── Dashboard ─────────────────────────────────────────────────────────────────
 export const fetchDashboard = () => api.get('/admin/dashboard');
-export const fetchStorageStats = () => api.get('/admin/stats/storage');
+export const fetchStorageStats = (refresh = false) => api.get('/admin/stats/storage', { params: refresh ? { refresh: 1 } : {} });
 
 // ── Projects ─────────────────────────────────────────────────────────────────
 export const fetchAdminProjects = () => api.get('/admin/projects');
@@ -27,11 +27,18 @@ export const fetchAdminProject = (id) => api.get(`/admin/projects/${id}`);
 export const createProject = (data) => api.post('/admin/projects', data);
 export const updateProject = (id, data) => api.put(`/admin/projects/${id}`, data);
 export const deleteProject = (id) => api.delete(`/admin/projects/${id}`);
+export const exportProjects = (params = {}) => api.get('/admin/projects/export', { params, responseType: 'blob' });
+export const bulkUpdateProjects = (target, changes) => api.post('/admin/projects/bulk', { ...target, set: changes });
+export const reorderProjectMedia = (id, mediaIds) => api.put(`/admin/projects/${id}/media/order`, { order: mediaIds });
 
 // ── Inquiries ─────────────────────────────────────────────────────────────────
 export const fetchInquiries = () => api.get('/admin/inquiries');
 export const updateInquiryStatus = (id, status) => api.patch(`/admin/inquiries/${id}`, { status });
 export const deleteInquiry = (id) => api.delete(`/admin/inquiries/${id}`);
+export const exportInquiries = (params = {}) => api.get('/admin/inquiries/export', { params, responseType: 'blob' });
+// target: { ids: [...] } or { filter: { status, older_than_days } }
+export const bulkInquiryStatus = (target, status) => api.post('/admin/inquiries/bulk', { ...target, action: 'status', status });
+export const bulkDeleteInquiries = (target) => api.post('/admin/inquiries/bulk', { ...target, action: 'delete' });
 
 // ── Settings ──────────────────────────────────────────────────────────────────
 export const fetchAdminSettings = () => api.get('/admin/settings');
@@ -54,4 +61,43 @@ export const uploadFile = (file, resourceType = 'image', folder = '', onProgress
     return api.post('/admin/upload', form, config);
 };
 
+// Background upload: returns a job right away; poll it until done/failed
+export const queueUpload = (file, resourceType = 'image', folder = '', onProgress = null) => {
+    const form = new FormData();
+    form.append('file', file);
+    form.append('resource_type', resourceType);
+    if (folder) form.append('folder', folder);
+    return api.post('/admin/upload', form, {
+        params: { async: 1 },
+        onUploadProgress: onProgress
+            ? (evt) => onProgress(Math.round((evt.loaded * 100) / evt.total))
+            : undefined,
+    });
+};
+export const fetchUploadJob = (jobId) => api.get(`/admin/upload/jobs/${jobId}`);
+
+// Direct-to-Cloudinary upload: the file bytes skip the Flask server entirely
+export const directUpload = async (file, resourceType = 'image', folder = '', onProgress = null) => {
+    const { data: sig } = await api.post('/admin/upload/signature', {
+        resource_type: resourceType,
+        ...(folder ? { folder } : {}),
+    });
+    if (file.size > sig.max_file_size) {
+        throw new Error('File exceeds the maximum upload size');
+    }
+
+    const form = new FormData();
+    form.append('file', file);
+    form.append('api_key', sig.api_key);
+    form.append('signature', sig.signature);
+    Object.entries(sig.params).forEach(([key, value]) => form.append(key, value));
+
+    const { data: result } = await axios.post(sig.upload_url, form, {
+        onUploadProgress: onProgress
+            ? (evt) => onProgress(Math.round((evt.loaded * 100) / evt.total))
+            : undefined,
+    });
+    return api.post('/admin/upload/complete', result);
+};
+
 export default api;
@@ -14,16 +14,68 @@ def create_app(env="development"):
     # Disable Flask's default static serving to manually handle the React SPA
     app = Flask(__name__, static_folder=None)
 
+    # Spool file uploads straight to disk, size-checked while streaming
+    from app.utils.upload_spool import SpoolingRequest
+    app.request_class = SpoolingRequest
+
     # Load config
     from app.config import config_map
     app.config.from_object(config_map.get(env, "development"))
 
+    from app.utils.structured_log import init_logging
+    init_logging(app)
+
+    # orjson-backed JSON responses when available
+    from app.utils.serializers import init_json
+    init_json(app)
+
     # Init extensions
     db.init_app(app)
-    migrate.init_app(app, db)
+    from app.utils.search import include_object
+    migrate.init_app(app, db, include_object=include_object)
     jwt.init_app(app)
     CORS(app, resources={r"/api/*": {"origins": app.config["FRONTEND_ORIGIN"]}})
 
+    # Count SQL queries per request and warn when one goes over budget
+    from app.utils.query_budget import init_query_budget
+    init_query_budget(app)
+
+    # Wall/SQL/Cloudinary time per request: Server-Timing + Prometheus histograms
+    from app.utils.metrics import init_metrics
+    init_metrics(app)
+
+    # gzip/brotli for JSON responses; runs before the metrics hook, so it is timed
+    from app.utils.compression import init_compression
+    init_compression(app)
+
+    # Cache for serialized public API responses
+    from app.utils.response_cache import init_response_cache
+    init_response_cache(app)
+
+    # Per-IP token buckets for /api/contact and /api/check-admin-email
+    from app.utils.rate_limit import init_rate_limit
+    init_rate_limit(app)
+
+    # Versioned in-memory snapshot of SiteSetting rows
+    from app.utils.settings_store import init_settings_store
+    init_settings_store(app)
+
+    # Background Cloudinary uploads with persisted job status
+    from app.utils.upload_jobs import init_upload_jobs
+    init_upload_jobs(app)
+
+    # Dashboard storage usage, refreshed in the background
+    from app.utils.storage_stats import init_storage_stats
+    init_storage_stats(app)
+
+    # Optional write-behind queue for contact-form inquiries
+    from app.utils.inquiry_buffer import init_inquiry_buffer
+    init_inquiry_buffer(app)
+
+    # Batched, retried Cloudinary deletes off the request path
+    from app.utils.media_cleanup import init_media_cleanup
+    init_media_cleanup(app)
+
     # Configure Cloudinary
     cloudinary.config(
         cloud_name=app.config["CLOUDINARY_CLOUD_NAME"],
@@ -31,9 +83,15 @@ def create_app(env="development"):
         api_secret=app.config["CLOUDINARY_API_SECRET"],
         secure=True,
     )
+    if app.config["CLOUDINARY_UPLOAD_PREFIX"]:
+        cloudinary.config(upload_prefix=app.config["CLOUDINARY_UPLOAD_PREFIX"])
 
     # Register models (so Flask-Migrate picks them up)
-    from app.models import user, project, inquiry, setting  # noqa: F401
+    from app.models import user, project, inquiry, setting, upload_job  # noqa: F401
+
+    # Full-text search index objects are created with the projects table
+    from app.utils.search import init_search
+    init_search()
 
     # Register blueprints
     from app.routes.public import public_bp
@@ -43,33 +101,30 @@ def create_app(env="development"):
     app.register_blueprint(admin_bp, url_prefix="/api/admin")
 
     # ── Static file serving ──────────────────────────────────────────────────
+    # Both dist folders are indexed once here; see app/utils/static_files.py
     import os
-    from flask import send_from_directory
+    from app.utils.static_files import StaticIndex
 
     # Public SPA — served at all non-API, non-admin routes
-    public_folder = os.path.abspath(
+    public_files = StaticIndex(os.path.abspath(
         os.path.join(os.path.dirname(__file__), '..', '..', 'frontend', 'dist')
-    )
+    ))
 
     # Admin SPA — served at /admin and /admin/*
-    admin_folder = os.path.abspath(
+    admin_files = StaticIndex(os.path.abspath(
         os.path.join(os.path.dirname(__file__), '..', '..', 'admin-frontend', 'dist')
-    )
+    ))
 
     @app.route("/admin", defaults={"path": ""})
     @app.route("/admin/<path:path>")
     def serve_admin(path):
         """Serve the standalone Admin SPA."""
-        if path and os.path.exists(os.path.join(admin_folder, path)):
-            return send_from_directory(admin_folder, path)
-        return send_from_directory(admin_folder, "index.html")
+        return admin_files.serve(path)
 
     @app.route("/", defaults={"path": ""})
     @app.route("/<path:path>")
     def serve_frontend(path):
         """Serve the public SPA — fallback to index.html for client-side routing."""
-        if path and os.path.exists(os.path.join(public_folder, path)):
-            return send_from_directory(public_folder, path)
-        return send_from_directory(public_folder, "index.html")
+        return public_files.serve(path)
 
     return app
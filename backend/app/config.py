@@ -17,10 +17,70 @@ class Config:
         "pool_recycle": 300,
     }
 
+    # Logging: "text" for terminals, "json" for log shippers
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+    LOG_FORMAT = os.environ.get("LOG_FORMAT", "text")
+
+    # JSON encoder for responses: "auto" (orjson when installed), "orjson" or "stdlib"
+    JSON_ENCODER = os.environ.get("JSON_ENCODER", "auto")
+
+    # gzip/brotli compression of JSON responses at or above COMPRESS_MIN_SIZE bytes
+    COMPRESS_RESPONSES = os.environ.get("COMPRESS_RESPONSES", "1") == "1"
+    COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", 1024))
+    COMPRESS_MIMETYPES = {"application/json"}
+    COMPRESS_GZIP_LEVEL = int(os.environ.get("COMPRESS_GZIP_LEVEL", 6))
+    COMPRESS_BROTLI_QUALITY = int(os.environ.get("COMPRESS_BROTLI_QUALITY", 5))
+
+    # Per-request instrumentation: Server-Timing header, slow-request log threshold
+    SERVER_TIMING = os.environ.get("SERVER_TIMING", "1") == "1"
+    SLOW_REQUEST_MS = int(os.environ.get("SLOW_REQUEST_MS", 1000))
+
+    # Max SQL queries per request before a warning is logged (development)
+    QUERY_BUDGET = int(os.environ.get("QUERY_BUDGET", 10))
+
+    # Cursor pagination (?limit= / ?cursor=) on list endpoints
+    PAGE_SIZE_DEFAULT = 50
+    PAGE_SIZE_MAX = 200
+
+    # Cache-Control for the public read API (responses also carry ETags)
+    PUBLIC_CACHE_CONTROL = os.environ.get(
+        "PUBLIC_CACHE_CONTROL", "public, max-age=0, must-revalidate"
+    )
+
+    # In-process cache of public API responses: "memory", "null" or an import path
+    RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", 256))
+    RESPONSE_CACHE_TTL = int(os.environ.get("RESPONSE_CACHE_TTL", 60))  # seconds
+
+    # How often each worker checks whether site settings changed (seconds)
+    SETTINGS_VERSION_TTL = int(os.environ.get("SETTINGS_VERSION_TTL", 5))
+
+    # Per-IP token buckets for public endpoints: "memory", "null" or an import path
+    RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_MAX_KEYS = int(os.environ.get("RATE_LIMIT_MAX_KEYS", 10000))
+    RATE_LIMIT_CONTACT = os.environ.get("RATE_LIMIT_CONTACT", "5/hour")
+    RATE_LIMIT_CHECK_EMAIL = os.environ.get("RATE_LIMIT_CHECK_EMAIL", "10/minute")
+    # Reverse proxies in front of the app that append to X-Forwarded-For: 0 when
+    # clients connect directly, 1 on Render. Unset, limits key on the connecting
+    # address, so behind a proxy every visitor shares one bucket.
+    TRUSTED_PROXY_COUNT = (
+        int(os.environ["TRUSTED_PROXY_COUNT"]) if os.environ.get("TRUSTED_PROXY_COUNT") else None
+    )
+
+    # Write-behind intake for /api/contact: queue inquiries, insert them in batches
+    INQUIRY_BUFFER = os.environ.get("INQUIRY_BUFFER", "0") == "1"
+    INQUIRY_BUFFER_SIZE = int(os.environ.get("INQUIRY_BUFFER_SIZE", 1000))  # full queue: write directly
+    INQUIRY_BUFFER_BATCH = int(os.environ.get("INQUIRY_BUFFER_BATCH", 100))
+    INQUIRY_BUFFER_WAIT = float(os.environ.get("INQUIRY_BUFFER_WAIT", 1.0))  # seconds
+
     # Cloudinary
     CLOUDINARY_CLOUD_NAME = os.environ.get("CLOUDINARY_CLOUD_NAME")
     CLOUDINARY_API_KEY = os.environ.get("CLOUDINARY_API_KEY")
     CLOUDINARY_API_SECRET = os.environ.get("CLOUDINARY_API_SECRET")
+    # Override the API host, e.g. to point uploads at a local fake store
+    CLOUDINARY_UPLOAD_PREFIX = os.environ.get("CLOUDINARY_UPLOAD_PREFIX")
+    # Lifetime of direct-upload signatures; Cloudinary itself caps this at 1 hour
+    SIGNED_UPLOAD_TTL = int(os.environ.get("SIGNED_UPLOAD_TTL", 3600))
 
     # CORS
     FRONTEND_ORIGIN = os.environ.get("FRONTEND_ORIGIN", "http://localhost:5173")
@@ -31,10 +91,34 @@ class Config:
     MAX_IMAGE_SIZE = 5 * 1024 * 1024         # 5 MB
     ALLOWED_VIDEO_EXTENSIONS = {"mp4", "mov", "avi", "mkv", "webm"}
     ALLOWED_IMAGE_EXTENSIONS = {"jpg", "jpeg", "png", "webp", "gif"}
+    # Where uploads are spooled while the request streams in (None = system temp)
+    UPLOAD_TMP_DIR = os.environ.get("UPLOAD_TMP_DIR")
+    # Resumable chunked uploads: spool directory, default chunk size, idle expiry
+    UPLOAD_SESSION_DIR = os.environ.get("UPLOAD_SESSION_DIR")
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024      # 8 MB
+    UPLOAD_SESSION_TTL = int(os.environ.get("UPLOAD_SESSION_TTL", 24 * 3600))  # seconds
+
+    # Background upload jobs (/api/admin/upload?async=1)
+    UPLOAD_WORKERS = int(os.environ.get("UPLOAD_WORKERS", 2))
+    UPLOAD_QUEUE_DEPTH = int(os.environ.get("UPLOAD_QUEUE_DEPTH", 8))
+    UPLOAD_JOB_DIR = os.environ.get("UPLOAD_JOB_DIR")
+    UPLOAD_JOB_STALE_SECONDS = int(os.environ.get("UPLOAD_JOB_STALE_SECONDS", 600))  # no heartbeat -> requeue
+
+    # Admin storage stats: background refresh period and plan limits shown on the dashboard
+    STORAGE_STATS_INTERVAL = int(os.environ.get("STORAGE_STATS_INTERVAL", 600))  # seconds
+    DATABASE_LIMIT_BYTES = int(os.environ.get("DATABASE_LIMIT_BYTES", 512 * 1024 * 1024))          # NeonDB free tier
+    CLOUDINARY_LIMIT_BYTES = int(os.environ.get("CLOUDINARY_LIMIT_BYTES", 25 * 1024 * 1024 * 1024))  # Cloudinary free tier
+
+    # Deferred Cloudinary deletes: batching window and retry schedule
+    MEDIA_DELETE_BATCH_WAIT = float(os.environ.get("MEDIA_DELETE_BATCH_WAIT", 2.0))  # seconds
+    MEDIA_DELETE_MAX_ATTEMPTS = int(os.environ.get("MEDIA_DELETE_MAX_ATTEMPTS", 5))
+    MEDIA_DELETE_BACKOFF = float(os.environ.get("MEDIA_DELETE_BACKOFF", 2.0))  # first retry delay, doubles
 
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    # The dev server is reached directly
+    TRUSTED_PROXY_COUNT = int(os.environ.get("TRUSTED_PROXY_COUNT") or 0)
 
 
 class ProductionConfig(Config):
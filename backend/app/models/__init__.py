@@ -2,6 +2,7 @@
 from app.models.user import AdminUser
 from app.models.project import Project, ProjectMedia
 from app.models.inquiry import Inquiry
-from app.models.setting import SiteSetting
+from app.models.setting import SiteSetting, SiteSettingsVersion
+from app.models.upload_job import UploadJob
 
-__all__ = ["AdminUser", "Project", "ProjectMedia", "Inquiry", "SiteSetting"]
+__all__ = ["AdminUser", "Project", "ProjectMedia", "Inquiry", "SiteSetting", "SiteSettingsVersion", "UploadJob"]
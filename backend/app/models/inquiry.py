@@ -4,6 +4,10 @@ from datetime import datetime, timezone
 
 class Inquiry(db.Model):
     __tablename__ = "inquiries"
+    __table_args__ = (
+        db.Index("ix_inquiries_created_at_id", "created_at", "id"),
+        db.Index("ix_inquiries_status_created_at", "status", "created_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False)
@@ -4,20 +4,28 @@ from datetime import datetime, timezone
 
 class Project(db.Model):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination / ordering: (release_date, id) and (created_at, id)
+        db.Index("ix_projects_release_date_id", "release_date", "id"),
+        db.Index("ix_projects_created_at_id", "created_at", "id"),
+        # Exact, case-insensitive ?category= filter
+        db.Index("ix_projects_category_lower", db.func.lower(db.text("category"))),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    category = db.Column(db.String(100), nullable=True)
+    category = db.Column(db.String(100), nullable=True, index=True)
     release_date = db.Column(db.Date, nullable=True)
     cloudinary_video_id = db.Column(db.String(255), nullable=True)
     cloudinary_thumbnail_id = db.Column(db.String(255), nullable=True)
-    is_featured = db.Column(db.Boolean, default=False)
+    is_featured = db.Column(db.Boolean, default=False, index=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(
         db.DateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
+        index=True,  # max(updated_at) is the public API's cache validator
     )
 
     media = db.relationship(
@@ -33,6 +41,9 @@ class Project(db.Model):
 
 class ProjectMedia(db.Model):
     __tablename__ = "project_media"
+    __table_args__ = (
+        db.Index("ix_project_media_project_id_order", "project_id", "order"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     project_id = db.Column(db.Integer, db.ForeignKey("projects.id"), nullable=False)
@@ -10,3 +10,15 @@ class SiteSetting(db.Model):
 
     def __repr__(self):
         return f"<SiteSetting {self.key}>"
+
+
+class SiteSettingsVersion(db.Model):
+    """Single-row counter bumped on every settings write, so workers can
+    detect a change with one indexed lookup instead of re-reading the table."""
+    __tablename__ = "site_settings_version"
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<SiteSettingsVersion {self.version}>"
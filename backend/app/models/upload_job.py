@@ -0,0 +1,32 @@
+from app import db
+from datetime import datetime, timezone
+
+
+class UploadJob(db.Model):
+    __tablename__ = "upload_jobs"
+
+    id = db.Column(db.String(32), primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default="queued", index=True)  # queued | running | done | failed
+    resource_type = db.Column(db.String(20), nullable=False)  # image | video
+    folder = db.Column(db.String(255), nullable=True)
+    filename = db.Column(db.String(255), nullable=False)
+    spool_path = db.Column(db.Text, nullable=False)
+    bytes_total = db.Column(db.BigInteger, default=0)
+    bytes_done = db.Column(db.BigInteger, default=0)
+    public_id = db.Column(db.String(255), nullable=True)
+    url = db.Column(db.Text, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    # Optional project link, applied when the upload finishes
+    project_id = db.Column(db.Integer, db.ForeignKey("projects.id", ondelete="SET NULL"), nullable=True)
+    link_target = db.Column(db.String(20), nullable=True)  # video | thumbnail | media
+    link_order = db.Column(db.Integer, nullable=True)
+    link_media_type = db.Column(db.String(50), nullable=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self):
+        return f"<UploadJob {self.id} ({self.status})>"
@@ -1,16 +1,38 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, url_for
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from app import db
 from app.models.user import AdminUser
 from app.models.project import Project, ProjectMedia
 from app.models.inquiry import Inquiry
-from app.models.setting import SiteSetting
-from app.utils.cloudinary_helper import upload_video, upload_image, delete_resource
-import cloudinary.api
-from sqlalchemy import text
-from datetime import datetime, date
+from app.utils.cloudinary_helper import upload_video, upload_image
+from app.utils.signed_upload import build_upload_signature, verify_upload
+from app.utils import chunked_upload
+from app.utils.export import stream_export
+from app.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics
+from app.utils.media_cleanup import project_assets, release_assets
+from app.utils.upload_jobs import UploadQueueFull, enqueue_upload, job_to_dict, link_job
+from app.models.upload_job import UploadJob
+from app.utils.query_budget import query_budget
+from app.utils.pagination import keyset_order, keyset_paginate, parse_page_args
+from app.utils.response_cache import get_response_cache, invalidate_project, invalidate_projects, invalidate_settings
+from app.utils.serializers import inquiry_to_dict, project_serializer, serialize_projects
+from app.utils.settings_store import get_settings_store
+from app.utils.storage_stats import get_storage_stats
+from sqlalchemy import delete, func, literal, literal_column, null, select, union_all, update
+from werkzeug.exceptions import RequestEntityTooLarge
+from sqlalchemy.orm import selectinload
+from datetime import datetime, date, timedelta
+import logging
 
 admin_bp = Blueprint("admin", __name__)
+logger = logging.getLogger(__name__)
+
+INQUIRY_STATUSES = ("unread", "read", "replied")
+
+
+def _is_id_list(value) -> bool:
+    """A JSON list of integer ids. ``true``/``false`` are rejected: bool is an int subclass."""
+    return isinstance(value, list) and all(type(i) is int for i in value)
 
 
 # ─── AUTH ────────────────────────────────────────────────────────────────────
@@ -37,29 +59,69 @@ def verify_token():
 
 # ─── DASHBOARD ───────────────────────────────────────────────────────────────
 
+def _dashboard_rows():
+    """
+    Recent inquiries, per-status and per-category counts and the project total
+    as one UNION ALL, so the dashboard costs a single round trip. Rows are
+    ``(kind, key, count, id, name, email, created_at)``.
+    """
+    # NULL and "" are both shown as Uncategorized, so they must be one group
+    # (inline literals: bound parameters would make the SELECT and GROUP BY
+    # expressions differ on PostgreSQL)
+    category = func.coalesce(func.nullif(Project.category, literal_column("''")),
+                             literal_column("'Uncategorized'"))
+    # The recent rows come first: a UNION takes its result types from its first SELECT
+    recent = (
+        select(Inquiry.id, Inquiry.name, Inquiry.email, Inquiry.status, Inquiry.created_at)
+        .order_by(Inquiry.created_at.desc())
+        .limit(5)
+        .subquery()
+    )
+    return db.session.execute(union_all(
+        select(literal("recent"), recent.c.status, literal(0),
+               recent.c.id, recent.c.name, recent.c.email, recent.c.created_at),
+        select(literal("status"), Inquiry.status, func.count(),
+               null(), null(), null(), null()).group_by(Inquiry.status),
+        select(literal("category"), category, func.count(),
+               null(), null(), null(), null()).group_by(category),
+        select(literal("projects"), null(), func.count(),
+               null(), null(), null(), null()).select_from(Project),
+    )).all()
+
+
 @admin_bp.route("/dashboard", methods=["GET"])
 @jwt_required()
+@query_budget(1)
 def dashboard():
-    total_projects = Project.query.count()
-    unread_inquiries = Inquiry.query.filter_by(status="unread").count()
-    recent = (
-        Inquiry.query.order_by(Inquiry.created_at.desc()).limit(5).all()
-    )
-    recent_list = [
-        {
-            "id": i.id,
-            "name": i.name,
-            "email": i.email,
-            "status": i.status,
-            "created_at": i.created_at.isoformat() if i.created_at else None,
-        }
-        for i in recent
-    ]
+    recent_list, by_status, by_category, total_projects = [], {}, {}, 0
+    for kind, key, count, id_, name, email, created_at in _dashboard_rows():
+        if kind == "recent":
+            recent_list.append({
+                "id": id_,
+                "name": name,
+                "email": email,
+                "status": key,
+                "created_at": created_at.isoformat() if created_at else None,
+            })
+        elif kind == "status":
+            # NULL and "" statuses both land on "unknown"
+            by_status[key or "unknown"] = by_status.get(key or "unknown", 0) + count
+        elif kind == "category":
+            by_category[key] = count
+        else:
+            total_projects = count
+
+    recent_list.sort(key=lambda i: i["created_at"] or "", reverse=True)
+    for status in INQUIRY_STATUSES:
+        by_status.setdefault(status, 0)
     return jsonify(
         {
             "total_projects": total_projects,
-            "unread_inquiries": unread_inquiries,
+            "unread_inquiries": by_status["unread"],
             "recent_inquiries": recent_list,
+            "total_inquiries": sum(by_status.values()),
+            "inquiries_by_status": by_status,
+            "projects_by_category": by_category,
         }
     ), 200
 
@@ -69,89 +131,116 @@ def dashboard():
 @admin_bp.route("/stats/storage", methods=["GET"])
 @jwt_required()
 def storage_stats():
-    # 1. Get database size (NeonDB PostgreSQL)
-    db_size_bytes = 0
-    try:
-        # PostgreSQL specific: get size of current database
-        result = db.session.execute(text("SELECT pg_database_size(current_database())"))
-        db_size_bytes = result.scalar() or 0
-    except Exception as e:
-        print("Error fetching DB size:", e)
+    """Cached database/Cloudinary usage; ``?refresh=1`` probes again before answering."""
+    refresh = request.args.get("refresh") in ("1", "true")
+    return jsonify(get_storage_stats().snapshot(refresh=refresh)), 200
 
-    # 2. Get Cloudinary usage
-    cloudinary_usage_bytes = 0
-    try:
-        # The admin API can fetch usage statistics. We'll try to get the bandwidth/storage usage.
-        # Note: Depending on the Cloudinary plan, `usage()` might require specific permissions.
-        # For a simple workaround if usage() fails, we might just return 0 or a placeholder,
-        # but let's attempt the official API first.
-        usage_res = cloudinary.api.usage()
-        # usage_res usually contains 'storage' with 'usage' in bytes
-        if "storage" in usage_res and "usage" in usage_res["storage"]:
-            cloudinary_usage_bytes = usage_res["storage"]["usage"]
-    except Exception as e:
-        print("Error fetching Cloudinary usage:", e)
 
-    return jsonify({
-        "database_bytes": db_size_bytes,
-        "cloudinary_bytes": cloudinary_usage_bytes,
-        "database_limit_bytes": 536870912,    # e.g., 500 MB Free Tier
-        "cloudinary_limit_bytes": 26843545600 # e.g., 25 GB Free Tier
-    }), 200
+@admin_bp.route("/stats/cache", methods=["GET"])
+@jwt_required()
+def cache_stats():
+    return jsonify(get_response_cache().stats()), 200
 
 
-# ─── PROJECTS ────────────────────────────────────────────────────────────────
+@admin_bp.route("/metrics", methods=["GET"])
+@jwt_required()
+def metrics():
+    """Request, SQL and Cloudinary timings for this worker, Prometheus text format."""
+    return render_metrics(), 200, {"Content-Type": METRICS_CONTENT_TYPE}
 
-def project_to_dict(p: Project, cloud_name: str) -> dict:
-    media_list = []
-    for m in p.media:
-        media_list.append({
-            "id": m.id,
-            "media_type": m.media_type,
-            "cloudinary_id": m.cloudinary_id,
-            "url": m.url,
-            "order": m.order
-        })
-
-    return {
-        "id": p.id,
-        "title": p.title,
-        "description": p.description,
-        "category": p.category,
-        "release_date": p.release_date.isoformat() if p.release_date else None,
-        "is_featured": p.is_featured,
-        "cloudinary_video_id": p.cloudinary_video_id,
-        "cloudinary_thumbnail_id": p.cloudinary_thumbnail_id,
-        "thumbnail_url": (
-            f"https://res.cloudinary.com/{cloud_name}/image/upload/w_400,h_300,c_fill/{p.cloudinary_thumbnail_id}.jpg"
-            if p.cloudinary_thumbnail_id
-            else None
-        ),
-        "video_url": (
-            f"https://res.cloudinary.com/{cloud_name}/video/upload/{p.cloudinary_video_id}.mp4"
-            if p.cloudinary_video_id
-            else None
-        ),
-        "media": media_list,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-        "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-    }
 
+# ─── PROJECTS ────────────────────────────────────────────────────────────────
 
 @admin_bp.route("/projects", methods=["GET"])
 @jwt_required()
+@query_budget(2)
 def list_projects():
-    from flask import current_app
-    cloud_name = current_app.config.get("CLOUDINARY_CLOUD_NAME", "")
-    projects = Project.query.order_by(Project.created_at.desc()).all()
-    return jsonify([project_to_dict(p, cloud_name) for p in projects]), 200
+    try:
+        page = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    query = Project.query.options(selectinload(Project.media))
+    if page is None:
+        projects = query.order_by(*keyset_order(Project.created_at, Project.id)).all()
+        return jsonify(serialize_projects(projects, "admin")), 200
+
+    cursor, limit = page
+    try:
+        projects, next_cursor = keyset_paginate(
+            query, Project.created_at, Project.id, cursor, limit
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({
+        "items": serialize_projects(projects, "admin"),
+        "next_cursor": next_cursor,
+    }), 200
+
+
+def _link_upload_jobs(project: Project, data: dict, media_jobs: list):
+    """
+    Attach background upload jobs referenced by a project payload. Finished
+    jobs fill in their public_id now; pending ones are applied on completion.
+    """
+    if data.get("video_job_id"):
+        link_job(data["video_job_id"], project, "video")
+    if data.get("thumbnail_job_id"):
+        link_job(data["thumbnail_job_id"], project, "thumbnail")
+    for job_id, order, media_type in media_jobs:
+        link_job(job_id, project, "media", order=order, media_type=media_type)
+
+
+def _sync_media(project: Project, items: list) -> list:
+    """
+    Bring ``project.media`` in line with ``items`` without rewriting it:
+    existing rows are matched by ``id``, then by ``cloudinary_id``, and only
+    new rows are inserted, missing rows deleted and moved rows renumbered
+    (one executemany UPDATE). Returns the ``(job_id, order, media_type)``
+    items still waiting on a background upload.
+    """
+    by_id = {m.id: m for m in project.media}
+    by_cloudinary_id = {}
+    for m in project.media:
+        by_cloudinary_id.setdefault(m.cloudinary_id, m)
+
+    kept, reorder, media_jobs = set(), [], []
+    for index, item in enumerate(items):
+        media_type = item.get("media_type", "standard_video")
+        existing = by_id.get(item.get("id"))
+        if existing is None or existing.id in kept:
+            existing = by_cloudinary_id.get(item.get("cloudinary_id"))
+        if existing is not None and existing.id not in kept and item.get("cloudinary_id") and item.get("url"):
+            kept.add(existing.id)
+            if existing.media_type != media_type:
+                existing.media_type = media_type
+            if existing.cloudinary_id != item["cloudinary_id"]:
+                existing.cloudinary_id = item["cloudinary_id"]
+            if existing.url != item["url"]:
+                existing.url = item["url"]
+            if existing.order != index:
+                reorder.append({"id": existing.id, "order": index})
+        elif item.get("cloudinary_id") and item.get("url"):
+            project.media.append(ProjectMedia(
+                media_type=media_type,
+                cloudinary_id=item["cloudinary_id"],
+                url=item["url"],
+                order=index
+            ))
+        elif item.get("job_id"):
+            media_jobs.append((item["job_id"], index, media_type))
+
+    for m in list(project.media):
+        if m.id is not None and m.id not in kept:
+            project.media.remove(m)  # delete-orphan cascade
+    if reorder:
+        db.session.execute(update(ProjectMedia), reorder)
+    return media_jobs
 
 
 @admin_bp.route("/projects", methods=["POST"])
 @jwt_required()
 def create_project():
-    from flask import current_app
-    cloud_name = current_app.config.get("CLOUDINARY_CLOUD_NAME", "")
     data = request.get_json(silent=True) or {}
     title = (data.get("title") or "").strip()
     if not title:
@@ -175,6 +264,7 @@ def create_project():
     )
     
     # Process media array
+    media_jobs = []
     media_data = data.get("media", [])
     if isinstance(media_data, list):
         for index, item in enumerate(media_data):
@@ -186,27 +276,33 @@ def create_project():
                     order=index
                 )
                 project.media.append(pm)
+            elif item.get("job_id"):
+                media_jobs.append((item["job_id"], index, item.get("media_type", "standard_video")))
 
     db.session.add(project)
+    try:
+        _link_upload_jobs(project, data, media_jobs)
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 422
     db.session.commit()
-    return jsonify(project_to_dict(project, cloud_name)), 201
+    invalidate_project(project.id, project.category)
+    return jsonify(project_serializer("admin")(project)), 201
 
 
 @admin_bp.route("/projects/<int:project_id>", methods=["GET"])
 @jwt_required()
 def get_project(project_id):
-    from flask import current_app
-    cloud_name = current_app.config.get("CLOUDINARY_CLOUD_NAME", "")
     project = Project.query.get_or_404(project_id)
-    return jsonify(project_to_dict(project, cloud_name)), 200
+    return jsonify(project_serializer("admin")(project)), 200
 
 
 @admin_bp.route("/projects/<int:project_id>", methods=["PUT"])
 @jwt_required()
 def update_project(project_id):
-    from flask import current_app
-    cloud_name = current_app.config.get("CLOUDINARY_CLOUD_NAME", "")
     project = Project.query.get_or_404(project_id)
+    old_category = project.category
+    old_assets = project_assets(project)
     data = request.get_json(silent=True) or {}
 
     if "title" in data:
@@ -227,62 +323,178 @@ def update_project(project_id):
         except ValueError:
             return jsonify({"error": "Invalid release_date format"}), 422
 
+    media_jobs = []
     if "media" in data and isinstance(data["media"], list):
-        project.media.clear()  # Delete old media relationships
-        for index, item in enumerate(data["media"]):
-            if item.get("cloudinary_id") and item.get("url"):
-                pm = ProjectMedia(
-                    media_type=item.get("media_type", "standard_video"),
-                    cloudinary_id=item["cloudinary_id"],
-                    url=item["url"],
-                    order=index
-                )
-                project.media.append(pm)
+        media_jobs = _sync_media(project, data["media"])
 
+    try:
+        _link_upload_jobs(project, data, media_jobs)
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 422
     project.updated_at = datetime.utcnow()
     db.session.commit()
-    return jsonify(project_to_dict(project, cloud_name)), 200
+    invalidate_project(project.id, old_category, project.category)
+    # Replaced video/thumbnail and dropped media leave Cloudinary assets behind
+    release_assets(old_assets - project_assets(project))
+    return jsonify(project_serializer("admin")(project)), 200
+
+
+@admin_bp.route("/projects/export", methods=["GET"])
+@jwt_required()
+def export_projects():
+    """Stream every project as CSV (default) or ``?format=ndjson``; ``?gzip=1`` compresses."""
+    stmt = db.select(
+        Project.id, Project.title, Project.description, Project.category,
+        Project.release_date, Project.is_featured, Project.cloudinary_video_id,
+        Project.cloudinary_thumbnail_id, Project.created_at, Project.updated_at,
+    ).order_by(Project.id)
+    try:
+        return stream_export("projects", stmt, request.args.get("format", "csv"),
+                             request.args.get("gzip") in ("1", "true"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@admin_bp.route("/projects/bulk", methods=["POST"])
+@jwt_required()
+def bulk_update_projects():
+    """
+    Set ``is_featured`` and/or ``category`` on many projects in one UPDATE.
+    Target them with ``ids`` or a ``filter`` (``category``, ``is_featured``).
+    """
+    data = request.get_json(silent=True) or {}
+    changes = data.get("set")
+    if not isinstance(changes, dict):
+        return jsonify({"error": "set must be an object"}), 422
+    values = {}
+    if "is_featured" in changes:
+        values["is_featured"] = bool(changes["is_featured"])
+    if "category" in changes:
+        if not isinstance(changes["category"], (str, type(None))):
+            return jsonify({"error": "category must be a string or null"}), 422
+        values["category"] = changes["category"] or ""
+    if not values:
+        return jsonify({"error": "set must contain is_featured and/or category"}), 422
+
+    def build_filter(f):
+        conditions = []
+        if "category" in f:
+            if not isinstance(f["category"], (str, type(None))):
+                raise ValueError("category must be a string or null")
+            conditions.append(func.lower(Project.category) == (f["category"] or "").lower())
+        if "is_featured" in f:
+            conditions.append(Project.is_featured.is_(bool(f["is_featured"])))
+        return conditions
+
+    try:
+        conditions = _bulk_conditions(data, Project.id, build_filter)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 422
+
+    # Old categories are needed to invalidate the cached category lists
+    affected = db.session.execute(db.select(Project.id, Project.category).where(*conditions)).all()
+    if not affected:
+        return jsonify({"updated": 0}), 200
+    values["updated_at"] = datetime.utcnow()
+    updated = db.session.execute(
+        update(Project).where(*conditions).values(**values).execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    categories = {c for _, c in affected} | {values.get("category")}
+    invalidate_projects([i for i, _ in affected], categories)
+    return jsonify({"updated": updated}), 200
+
+
+@admin_bp.route("/projects/<int:project_id>/media/order", methods=["PUT"])
+@jwt_required()
+@query_budget(4)
+def reorder_project_media(project_id):
+    """Reorder a gallery from a list of media ids; only moved rows are written."""
+    data = request.get_json(silent=True) or {}
+    order = data.get("order")
+    if not _is_id_list(order):
+        return jsonify({"error": "order must be a list of media ids"}), 422
+
+    project = db.session.get(Project, project_id)
+    if project is None:
+        return jsonify({"error": "Project not found"}), 404
+    current = dict(db.session.execute(
+        db.select(ProjectMedia.id, ProjectMedia.order).where(ProjectMedia.project_id == project_id)
+    ).all())
+    if sorted(order) != sorted(current):
+        return jsonify({"error": "order must list each of the project's media ids exactly once"}), 422
+
+    moved = [{"id": media_id, "order": index}
+             for index, media_id in enumerate(order) if current[media_id] != index]
+    if moved:
+        category = project.category
+        db.session.execute(update(ProjectMedia), moved)
+        project.updated_at = datetime.utcnow()
+        db.session.commit()
+        invalidate_project(project_id, category)
+    return jsonify({"order": order, "updated": len(moved)}), 200
 
 
 @admin_bp.route("/projects/<int:project_id>", methods=["DELETE"])
 @jwt_required()
 def delete_project(project_id):
     project = Project.query.get_or_404(project_id)
-    # Optionally delete from Cloudinary
-    if project.cloudinary_video_id:
-        try:
-            delete_resource(project.cloudinary_video_id, resource_type="video")
-        except Exception:
-            pass
-    if project.cloudinary_thumbnail_id:
-        try:
-            delete_resource(project.cloudinary_thumbnail_id, resource_type="image")
-        except Exception:
-            pass
+    assets = project_assets(project)
     db.session.delete(project)
     db.session.commit()
+    invalidate_project(project_id, project.category)
+    # Cloudinary deletes are batched in the background
+    release_assets(assets)
     return jsonify({"message": "Project deleted"}), 200
 
 
 # ─── INQUIRIES ───────────────────────────────────────────────────────────────
 
-def inquiry_to_dict(i: Inquiry) -> dict:
-    return {
-        "id": i.id,
-        "name": i.name,
-        "email": i.email,
-        "message": i.message,
-        "budget": i.budget,
-        "status": i.status,
-        "created_at": i.created_at.isoformat() if i.created_at else None,
-    }
-
 
 @admin_bp.route("/inquiries", methods=["GET"])
 @jwt_required()
 def list_inquiries():
-    inquiries = Inquiry.query.order_by(Inquiry.created_at.desc()).all()
-    return jsonify([inquiry_to_dict(i) for i in inquiries]), 200
+    try:
+        page = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if page is None:
+        inquiries = Inquiry.query.order_by(*keyset_order(Inquiry.created_at, Inquiry.id)).all()
+        return jsonify([inquiry_to_dict(i) for i in inquiries]), 200
+
+    cursor, limit = page
+    try:
+        inquiries, next_cursor = keyset_paginate(
+            Inquiry.query, Inquiry.created_at, Inquiry.id, cursor, limit
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({
+        "items": [inquiry_to_dict(i) for i in inquiries],
+        "next_cursor": next_cursor,
+    }), 200
+
+
+@admin_bp.route("/inquiries/export", methods=["GET"])
+@jwt_required()
+def export_inquiries():
+    """Stream inquiries (optionally ``?status=``) as CSV or NDJSON, oldest first."""
+    stmt = db.select(
+        Inquiry.id, Inquiry.name, Inquiry.email, Inquiry.message,
+        Inquiry.budget, Inquiry.status, Inquiry.created_at,
+    ).order_by(Inquiry.id)
+    status = request.args.get("status")
+    if status:
+        if status not in INQUIRY_STATUSES:
+            return jsonify({"error": "Invalid status. Use: unread, read, replied"}), 400
+        stmt = stmt.where(Inquiry.status == status)
+    try:
+        return stream_export("inquiries", stmt, request.args.get("format", "csv"),
+                             request.args.get("gzip") in ("1", "true"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
 
 @admin_bp.route("/inquiries/<int:inquiry_id>", methods=["PATCH"])
@@ -291,7 +503,7 @@ def update_inquiry(inquiry_id):
     inquiry = Inquiry.query.get_or_404(inquiry_id)
     data = request.get_json(silent=True) or {}
     status = data.get("status")
-    if status not in ("unread", "read", "replied"):
+    if status not in INQUIRY_STATUSES:
         return jsonify({"error": "Invalid status. Use: unread, read, replied"}), 422
     inquiry.status = status
     db.session.commit()
@@ -307,32 +519,95 @@ def delete_inquiry(inquiry_id):
     return jsonify({"message": "Inquiry deleted"}), 200
 
 
+def _bulk_conditions(data: dict, id_column, build_filter) -> list:
+    """
+    WHERE clauses for a bulk request: either ``ids`` (a list of ints) or a
+    non-empty ``filter`` handed to ``build_filter``. Raises ValueError.
+    """
+    ids, filters = data.get("ids"), data.get("filter")
+    if (ids is None) == (filters is None):
+        raise ValueError("Send either ids or filter")
+    if ids is not None:
+        if not ids or not _is_id_list(ids):
+            raise ValueError("ids must be a non-empty list of integers")
+        return [id_column.in_(ids)]
+    if not isinstance(filters, dict):
+        raise ValueError("filter must be an object")
+    conditions = build_filter(filters)
+    if not conditions:
+        raise ValueError("filter must contain at least one supported field")
+    return conditions
+
+
+@admin_bp.route("/inquiries/bulk", methods=["POST"])
+@jwt_required()
+def bulk_inquiries():
+    """
+    Apply ``{"action": "status", "status": ...}`` or ``{"action": "delete"}``
+    to inquiries selected by ``ids`` or a ``filter`` (``status``,
+    ``older_than_days``) in a single statement.
+    """
+    data = request.get_json(silent=True) or {}
+    action = data.get("action")
+    if action not in ("status", "delete"):
+        return jsonify({"error": "Invalid action. Use: status, delete"}), 422
+    if action == "status" and data.get("status") not in INQUIRY_STATUSES:
+        return jsonify({"error": "Invalid status. Use: unread, read, replied"}), 422
+
+    def build_filter(f):
+        conditions = []
+        if "status" in f:
+            if f["status"] not in INQUIRY_STATUSES:
+                raise ValueError("Invalid status. Use: unread, read, replied")
+            conditions.append(Inquiry.status == f["status"])
+        if "older_than_days" in f:
+            days = f["older_than_days"]
+            if type(days) is not int or days < 0:
+                raise ValueError("older_than_days must be a non-negative integer")
+            conditions.append(Inquiry.created_at < datetime.utcnow() - timedelta(days=days))
+        return conditions
+
+    try:
+        conditions = _bulk_conditions(data, Inquiry.id, build_filter)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 422
+
+    if action == "delete":
+        stmt = delete(Inquiry).where(*conditions)
+    else:
+        stmt = update(Inquiry).where(*conditions).values(status=data["status"])
+    count = db.session.execute(stmt.execution_options(synchronize_session=False)).rowcount
+    db.session.commit()
+    return jsonify({"deleted" if action == "delete" else "updated": count}), 200
+
+
 # ─── SETTINGS ────────────────────────────────────────────────────────────────
 
 @admin_bp.route("/settings", methods=["GET"])
 @jwt_required()
 def get_settings():
-    settings = SiteSetting.query.all()
-    return jsonify({s.key: s.value for s in settings}), 200
+    return jsonify(dict(get_settings_store().get(force_check=True).values)), 200
 
 
 @admin_bp.route("/settings", methods=["PUT"])
 @jwt_required()
 def update_settings():
     data = request.get_json(silent=True) or {}
-    for key, value in data.items():
-        setting = SiteSetting.query.filter_by(key=key).first()
-        if setting:
-            setting.value = value
-        else:
-            db.session.add(SiteSetting(key=key, value=value))
-    db.session.commit()
-    settings = SiteSetting.query.all()
-    return jsonify({s.key: s.value for s in settings}), 200
+    if not isinstance(data, dict):
+        return jsonify({"error": "Expected a JSON object of key/value pairs"}), 422
+    snapshot = get_settings_store().write(data)
+    invalidate_settings()
+    return jsonify(dict(snapshot.values)), 200
 
 
 # ─── UPLOAD ──────────────────────────────────────────────────────────────────
 
+@admin_bp.errorhandler(RequestEntityTooLarge)
+def upload_too_large(e):
+    # Raised while the multipart body is still streaming to disk
+    return jsonify({"error": "File exceeds the maximum upload size"}), 413
+
+
 @admin_bp.route("/upload", methods=["POST"])
 @jwt_required()
 def upload_file():
@@ -342,6 +617,18 @@ def upload_file():
     if not file or not file.filename:
         return jsonify({"error": "No file provided"}), 400
 
+    if request.args.get("async") in ("1", "true"):
+        # Hand the spooled file to a background worker and return right away
+        try:
+            job = enqueue_upload(file, resource_type, folder)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 422
+        except UploadQueueFull as e:
+            return jsonify({"error": str(e)}), 503, {"Retry-After": "30"}
+        body = job_to_dict(job)
+        body["status_url"] = url_for("admin.get_upload_job", job_id=job.id)
+        return jsonify(body), 202
+
     try:
         if resource_type == "video":
             result = upload_video(file, folder_name=folder) if folder else upload_video(file)
@@ -352,3 +639,107 @@ def upload_file():
         return jsonify({"error": str(e)}), 422
     except Exception as e:
         return jsonify({"error": f"Upload failed: {str(e)}"}), 500
+
+
+@admin_bp.route("/upload/jobs/<job_id>", methods=["GET"])
+@jwt_required()
+def get_upload_job(job_id):
+    """Poll a background upload: status, byte progress, then public_id/url or error."""
+    job = db.session.get(UploadJob, job_id)
+    if job is None:
+        return jsonify({"error": "Upload job not found"}), 404
+    return jsonify(job_to_dict(job)), 200
+
+
+@admin_bp.route("/upload/signature", methods=["POST"])
+@jwt_required()
+def upload_signature():
+    """Signed parameters for uploading straight from the browser to Cloudinary."""
+    data = request.get_json(silent=True) or {}
+    try:
+        return jsonify(
+            build_upload_signature(data.get("resource_type", "image"), data.get("folder"))
+        ), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 422
+
+
+@admin_bp.route("/upload/complete", methods=["POST"])
+@jwt_required()
+def upload_complete():
+    """Verify a direct upload's Cloudinary response before its public_id is used."""
+    data = request.get_json(silent=True) or {}
+    try:
+        return jsonify(verify_upload(data)), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 422
+    except Exception as e:
+        return jsonify({"error": f"Upload verification failed: {str(e)}"}), 500
+
+
+# ─── RESUMABLE UPLOADS ───────────────────────────────────────────────────────
+
+@admin_bp.route("/upload/sessions", methods=["POST"])
+@jwt_required()
+def create_upload_session():
+    data = request.get_json(silent=True) or {}
+    try:
+        session = chunked_upload.create_session(
+            filename=data.get("filename"),
+            size=data.get("size"),
+            folder=data.get("folder"),
+            chunk_size=data.get("chunk_size"),
+            sha256=data.get("sha256"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 422
+    return jsonify(session), 201
+
+
+@admin_bp.route("/upload/sessions/<session_id>", methods=["GET"])
+@jwt_required()
+def get_upload_session(session_id):
+    try:
+        return jsonify(chunked_upload.session_status(session_id)), 200
+    except chunked_upload.UploadSessionNotFound:
+        return jsonify({"error": "Upload session not found"}), 404
+
+
+@admin_bp.route("/upload/sessions/<session_id>/chunks/<int:index>", methods=["PUT"])
+@jwt_required()
+def put_upload_chunk(session_id, index):
+    """Raw chunk body; optional X-Chunk-SHA256 header with its hex digest."""
+    try:
+        chunk = chunked_upload.write_chunk(
+            session_id, index, request.stream, request.headers.get("X-Chunk-SHA256")
+        )
+    except chunked_upload.UploadSessionNotFound:
+        return jsonify({"error": "Upload session not found"}), 404
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 422
+    return jsonify(chunk), 200
+
+
+@admin_bp.route("/upload/sessions/<session_id>/complete", methods=["POST"])
+@jwt_required()
+def complete_upload_session(session_id):
+    try:
+        return jsonify(chunked_upload.finalize(session_id)), 200
+    except chunked_upload.UploadSessionNotFound:
+        return jsonify({"error": "Upload session not found"}), 404
+    except chunked_upload.UploadSessionBusy:
+        return jsonify({"error": "Upload session is already being finalized"}), 409
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 422
+    except Exception as e:
+        return jsonify({"error": f"Upload failed: {str(e)}"}), 500
+
+
+@admin_bp.route("/upload/sessions/<session_id>", methods=["DELETE"])
+@jwt_required()
+def delete_upload_session(session_id):
+    try:
+        chunked_upload.abort_session(session_id)
+    except chunked_upload.UploadSessionNotFound:
+        return jsonify({"error": "Upload session not found"}), 404
+    return jsonify({"message": "Upload session deleted"}), 200
@@ -2,81 +2,157 @@ from flask import Blueprint, request, jsonify
 from app import db
 from app.models.project import Project
 from app.models.inquiry import Inquiry
-from app.models.setting import SiteSetting
-from datetime import datetime
+from app.utils.inquiry_buffer import buffer_inquiry
+from app.utils.query_budget import query_budget
+from app.utils.rate_limit import rate_limit
+from app.utils.pagination import keyset_order, keyset_paginate, parse_page_args
+from app.utils.http_cache import make_etag
+from app.utils.response_cache import (
+    CATEGORIES_KEY, cached_json, project_key, projects_key, settings_key,
+)
+from app.utils.search import apply_search
+from app.utils.serializers import PROJECT_VIEWS, project_columns, project_serializer, serialize_projects
+from app.utils.settings_store import get_settings_store
+from sqlalchemy import exists, func
+from sqlalchemy.orm import load_only, selectinload
+from datetime import datetime, timezone
 import re
 
 public_bp = Blueprint("public", __name__)
 
 
-def project_to_dict(p: Project, cloud_name: str, detail: bool = False) -> dict:
-    media_list = []
-    for m in p.media:
-        media_list.append({
-            "id": m.id,
-            "media_type": m.media_type,
-            "cloudinary_id": m.cloudinary_id,
-            "url": m.url,
-            "order": m.order
-        })
-
-    base = {
-        "id": p.id,
-        "title": p.title,
-        "category": p.category,
-        "release_date": p.release_date.isoformat() if p.release_date else None,
-        "is_featured": p.is_featured,
-        "thumbnail_url": (
-            f"https://res.cloudinary.com/{cloud_name}/image/upload/w_400,h_300,c_fill/{p.cloudinary_thumbnail_id}.jpg"
-            if p.cloudinary_thumbnail_id
-            else None
-        ),
-        "media": media_list,
-    }
-    if detail:
-        base.update(
-            {
-                "description": p.description,
-                "video_url": (
-                    f"https://res.cloudinary.com/{cloud_name}/video/upload/{p.cloudinary_video_id}.mp4"
-                    if p.cloudinary_video_id
-                    else None
-                ),
-                "cloudinary_video_id": p.cloudinary_video_id,
-                "cloudinary_thumbnail_id": p.cloudinary_thumbnail_id,
-                "created_at": p.created_at.isoformat() if p.created_at else None,
-            }
-        )
-    return base
+def _projects_validator():
+    # Any create/update/delete moves max(updated_at) or count(*)
+    last_updated, total = db.session.query(
+        func.max(Project.updated_at), func.count(Project.id)
+    ).one()
+    return make_etag(last_updated, total), None
+
+
+def _list_shape(args) -> tuple:
+    """
+    ``(fields, include_media)`` from ``?fields=`` and ``?include=``. Without
+    either parameter the full list view is returned, media included. Raises
+    ValueError for unknown names.
+    """
+    fields = include = None
+    if "fields" in args:
+        fields = tuple(f.strip() for f in args["fields"].split(",") if f.strip())
+    if "include" in args:
+        include = {i.strip() for i in args["include"].split(",") if i.strip()}
+        if include - {"media"}:
+            raise ValueError("include supports: media")
+    if fields is None and include is None:
+        return None, True
+
+    include_media = "media" in (include or ()) or "media" in (fields or ())
+    fields = tuple(f for f in fields or PROJECT_VIEWS["list"] if f != "media")
+    unknown = set(fields) - set(PROJECT_VIEWS["list"])
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return fields + ("media",) if include_media else fields, include_media
+
+
+def _bool_arg(args, name: str):
+    value = args.get(name)
+    if value is None:
+        return None
+    if value.lower() in ("1", "true"):
+        return True
+    if value.lower() in ("0", "false"):
+        return False
+    raise ValueError(f"{name} must be 1 or 0")
 
 
 @public_bp.route("/projects", methods=["GET"])
+@query_budget(3)
 def get_projects():
-    from flask import current_app
-    cloud_name = current_app.config.get("CLOUDINARY_CLOUD_NAME", "")
     category = request.args.get("category")
-    query = Project.query.order_by(Project.release_date.desc())
-    if category:
-        query = query.filter(Project.category.ilike(f"%{category}%"))
-    projects = query.all()
-    return jsonify([project_to_dict(p, cloud_name) for p in projects]), 200
+    q = (request.args.get("q") or "").strip()
+    try:
+        page = parse_page_args(request.args)
+        fields, include_media = _list_shape(request.args)
+        featured = _bool_arg(request.args, "featured")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def build():
+        # Only the columns the fieldset reads (+ the keyset sort column);
+        # media in one extra SELECT, and only when asked for
+        columns = project_columns("list", fields) + ["release_date"]
+        query = Project.query.options(load_only(*(getattr(Project, c) for c in dict.fromkeys(columns))))
+        if include_media:
+            query = query.options(selectinload(Project.media))
+        if category:
+            # Exact, case-insensitive match — served by the lower(category) index
+            query = query.filter(func.lower(Project.category) == category.lower())
+        if featured is not None:
+            query = query.filter(Project.is_featured == featured)
+        if q:
+            query = apply_search(query, q, db.session.get_bind().dialect.name)
+
+        if page is None:
+            projects = query.order_by(*keyset_order(Project.release_date, Project.id)).all()
+            return serialize_projects(projects, "list", fields)
+
+        cursor, limit = page
+        projects, next_cursor = keyset_paginate(
+            query, Project.release_date, Project.id, cursor, limit
+        )
+        return {
+            "items": serialize_projects(projects, "list", fields),
+            "next_cursor": next_cursor,
+        }
+
+    key = projects_key(category, q, featured, fields, include_media)
+    try:
+        return cached_json(key, _projects_validator, build)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
 
 @public_bp.route("/projects/<int:project_id>", methods=["GET"])
 def get_project(project_id):
-    from flask import current_app
-    cloud_name = current_app.config.get("CLOUDINARY_CLOUD_NAME", "")
-    project = Project.query.get_or_404(project_id)
-    return jsonify(project_to_dict(project, cloud_name, detail=True)), 200
+
+    def validate():
+        row = db.session.query(Project.updated_at).filter_by(id=project_id).first_or_404()
+        return make_etag(row.updated_at), row.updated_at
+
+    def build():
+        project = db.session.get(Project, project_id, options=[selectinload(Project.media)])
+        return project_serializer("detail")(project)
+
+    return cached_json(project_key(project_id), validate, build)
+
+
+@public_bp.route("/categories", methods=["GET"])
+def get_categories():
+    """Category facets with project counts, for the portfolio filter chips."""
+    def build():
+        rows = (
+            db.session.query(Project.category, func.count(Project.id))
+            .filter(Project.category.isnot(None), Project.category != "")
+            .group_by(Project.category)
+            .order_by(func.count(Project.id).desc(), Project.category)
+            .all()
+        )
+        return [{"category": name, "count": count} for name, count in rows]
+
+    return cached_json(CATEGORIES_KEY, _projects_validator, build)
 
 
 @public_bp.route("/site-settings", methods=["GET"])
 def get_site_settings():
-    settings = SiteSetting.query.all()
-    return jsonify({s.key: s.value for s in settings}), 200
+    snapshot = get_settings_store().get()
+    return cached_json(
+        settings_key(snapshot.version),
+        lambda: (make_etag(snapshot.version), None),
+        lambda: dict(snapshot.values),
+    )
 
 
 @public_bp.route("/contact", methods=["POST"])
+@rate_limit("contact", "RATE_LIMIT_CONTACT")
 def submit_contact():
     data = request.get_json(silent=True)
     if not data:
@@ -97,13 +173,19 @@ def submit_contact():
     if errors:
         return jsonify({"errors": errors}), 422
 
-    inquiry = Inquiry(name=name, email=email, message=message, budget=budget)
-    db.session.add(inquiry)
+    row = {"name": name, "email": email, "message": message, "budget": budget,
+           "created_at": datetime.now(timezone.utc)}
+    if buffer_inquiry(row):
+        # Written by the background flusher within INQUIRY_BUFFER_WAIT seconds
+        return jsonify({"message": "Inquiry submitted successfully."}), 202
+
+    db.session.add(Inquiry(**row))
     db.session.commit()
     return jsonify({"message": "Inquiry submitted successfully."}), 201
 
 
 @public_bp.route("/check-admin-email", methods=["POST"])
+@rate_limit("check-admin-email", "RATE_LIMIT_CHECK_EMAIL")
 def check_admin_email():
     """
     Secret email-gate: checks if the supplied email belongs to an AdminUser.
@@ -111,14 +193,12 @@ def check_admin_email():
     Frontend shows admin portal link only when matched == true.
     """
     from app.models.user import AdminUser
-    import time, hmac
 
     data  = request.get_json(silent=True) or {}
     email = (data.get("email") or "").strip().lower()
 
-    user  = AdminUser.query.filter_by(email=email).first() if email else None
-
-    # Constant-time-ish response to resist timing attacks
-    time.sleep(0.2)
+    # Same indexed EXISTS for every input (even empty), so a hit and a miss do
+    # the same work; the per-IP rate limit caps how fast emails can be probed
+    matched = db.session.query(exists().where(AdminUser.email == email)).scalar()
 
-    return jsonify({"matched": bool(user)}), 200
+    return jsonify({"matched": bool(matched)}), 200
@@ -0,0 +1,266 @@
+"""
+Resumable, chunk-addressed uploads for large video files.
+
+A session is a directory under ``UPLOAD_SESSION_DIR``:
+
+    <session_id>/session.json   filename, size, chunk size, folder, ...
+    <session_id>/data           sparse file preallocated to the full size
+    <session_id>/chunks/<n>     marker holding chunk n's SHA-256
+
+Chunk ``n`` is written with ``pwrite`` at offset ``n * chunk_size`` through
+its own file descriptor, so chunks can arrive in any order and in parallel,
+on any worker sharing the directory. A chunk's marker is removed before its
+bytes are (re)written and only created again once they are on disk and the
+checksum matched, which makes "received ranges" a directory listing. ``finalize`` hands the assembled file to
+``upload_video``; idle sessions are removed by ``collect_idle_sessions``.
+"""
+import hashlib
+import json
+import os
+import re
+import secrets
+import shutil
+import tempfile
+import time
+
+from flask import current_app
+from werkzeug.datastructures import FileStorage
+
+from app.utils.cloudinary_helper import ALLOWED_VIDEO_EXT, STREAM_CHUNK_SIZE, _extension, upload_video
+
+SESSION_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+SHA256_RE = re.compile(r"^[0-9a-fA-F]{64}$")
+MIN_CHUNK_SIZE = 1024 * 1024          # 1 MB
+MAX_CHUNK_SIZE = 64 * 1024 * 1024     # 64 MB
+
+_last_gc = 0.0
+
+
+class UploadSessionNotFound(LookupError):
+    pass
+
+
+class UploadSessionBusy(RuntimeError):
+    pass
+
+
+def _root() -> str:
+    root = current_app.config.get("UPLOAD_SESSION_DIR") or os.path.join(
+        tempfile.gettempdir(), "videolozy-uploads"
+    )
+    os.makedirs(root, exist_ok=True)
+    return root
+
+
+def _session_dir(session_id: str) -> str:
+    if not SESSION_ID_RE.match(session_id or ""):
+        raise UploadSessionNotFound(session_id)
+    path = os.path.join(_root(), session_id)
+    if not os.path.isdir(path):
+        raise UploadSessionNotFound(session_id)
+    return path
+
+
+def _load_meta(path: str) -> dict:
+    with open(os.path.join(path, "session.json")) as f:
+        return json.load(f)
+
+
+def _chunk_length(meta: dict, index: int) -> int:
+    offset = index * meta["chunk_size"]
+    return min(meta["chunk_size"], meta["size"] - offset)
+
+
+def _received(path: str) -> list:
+    return sorted(int(name) for name in os.listdir(os.path.join(path, "chunks")) if name.isdigit())
+
+
+def _ranges(meta: dict, chunks: list) -> list:
+    """Collapse received chunk indexes into ``[start, end)`` byte ranges."""
+    ranges = []
+    for index in chunks:
+        start = index * meta["chunk_size"]
+        end = start + _chunk_length(meta, index)
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = end
+        else:
+            ranges.append([start, end])
+    return ranges
+
+
+def create_session(filename: str, size: int, folder: str = None,
+                   chunk_size: int = None, sha256: str = None) -> dict:
+    # Values come straight from JSON: type() rather than isinstance(), since
+    # bool is an int subclass and true would pass as 1
+    if not isinstance(filename, str):
+        raise ValueError("filename is required")
+    ext = _extension(filename)
+    if ext not in ALLOWED_VIDEO_EXT:
+        raise ValueError(f"Unsupported video format: .{ext}")
+    if type(size) is not int or size <= 0:
+        raise ValueError("size must be a positive integer")
+    if size > current_app.config["MAX_VIDEO_SIZE"]:
+        raise ValueError("Video file exceeds 1 GB limit.")
+    if chunk_size is None:
+        chunk_size = current_app.config["UPLOAD_CHUNK_SIZE"]
+    if type(chunk_size) is not int or not MIN_CHUNK_SIZE <= chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"chunk_size must be an integer between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE} bytes")
+    if folder is not None and not isinstance(folder, str):
+        raise ValueError("folder must be a string")
+    if sha256 is not None and not (isinstance(sha256, str) and SHA256_RE.match(sha256)):
+        raise ValueError("sha256 must be a 64-character hex digest")
+
+    collect_idle_sessions(throttle=True)
+
+    session_id = secrets.token_hex(16)
+    path = os.path.join(_root(), session_id)
+    os.makedirs(os.path.join(path, "chunks"))
+    meta = {
+        "session_id": session_id,
+        "filename": filename,
+        "size": size,
+        "chunk_size": chunk_size,
+        "total_chunks": -(-size // chunk_size),
+        "folder": folder,
+        "sha256": sha256,
+        "created_at": int(time.time()),
+    }
+    with open(os.path.join(path, "session.json"), "w") as f:
+        json.dump(meta, f)
+    with open(os.path.join(path, "data"), "wb") as f:
+        f.truncate(size)
+    return session_status(session_id)
+
+
+def session_status(session_id: str) -> dict:
+    path = _session_dir(session_id)
+    meta = _load_meta(path)
+    chunks = _received(path)
+    received = set(chunks)
+    return {
+        "session_id": session_id,
+        "filename": meta["filename"],
+        "size": meta["size"],
+        "chunk_size": meta["chunk_size"],
+        "total_chunks": meta["total_chunks"],
+        "received_ranges": _ranges(meta, chunks),
+        "missing_chunks": [i for i in range(meta["total_chunks"]) if i not in received],
+        "expires_at": int(os.path.getmtime(path)) + current_app.config["UPLOAD_SESSION_TTL"],
+    }
+
+
+def write_chunk(session_id: str, index: int, stream, checksum: str = None) -> dict:
+    """
+    Stream one chunk from ``stream`` into place. ``checksum`` is the client's
+    hex SHA-256 of the chunk; on mismatch nothing is marked as received.
+    """
+    path = _session_dir(session_id)
+    meta = _load_meta(path)
+    if not 0 <= index < meta["total_chunks"]:
+        raise ValueError(f"chunk index must be between 0 and {meta['total_chunks'] - 1}")
+    expected = _chunk_length(meta, index)
+    offset = index * meta["chunk_size"]
+
+    # A re-sent chunk overwrites the received bytes in place. Drop the marker
+    # first, so a re-send that then fails validation leaves the chunk missing,
+    # not marked as received over corrupted bytes.
+    marker = os.path.join(path, "chunks", str(index))
+    try:
+        os.unlink(marker)
+    except FileNotFoundError:
+        pass
+
+    digest = hashlib.sha256()
+    written = 0
+    fd = os.open(os.path.join(path, "data"), os.O_WRONLY)
+    try:
+        while True:
+            block = stream.read(STREAM_CHUNK_SIZE)
+            if not block:
+                break
+            written += len(block)
+            if written > expected:
+                raise ValueError(f"chunk {index} must be exactly {expected} bytes")
+            os.pwrite(fd, block, offset + written - len(block))
+            digest.update(block)
+    finally:
+        os.close(fd)
+
+    if written != expected:
+        raise ValueError(f"chunk {index} must be exactly {expected} bytes, got {written}")
+    if checksum and checksum.lower() != digest.hexdigest():
+        raise ValueError(f"checksum mismatch for chunk {index}")
+
+    with open(marker, "w") as f:
+        f.write(digest.hexdigest())
+    os.utime(path)  # keeps the session alive for the garbage collector
+    return {"index": index, "offset": offset, "length": written, "sha256": digest.hexdigest()}
+
+
+def finalize(session_id: str) -> dict:
+    """Check the session is complete and upload the assembled file."""
+    path = _session_dir(session_id)
+    meta = _load_meta(path)
+    missing = meta["total_chunks"] - len(_received(path))
+    if missing:
+        raise ValueError(f"{missing} chunk(s) still missing")
+
+    # Claim the session so a concurrent finalize can't upload it twice
+    claimed = f"{path}.finalizing"
+    try:
+        os.rename(path, claimed)
+    except OSError:
+        raise UploadSessionBusy(session_id)
+
+    try:
+        data_path = os.path.join(claimed, "data")
+        if meta.get("sha256"):
+            digest = hashlib.sha256()
+            with open(data_path, "rb") as f:
+                for block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+                    digest.update(block)
+            if digest.hexdigest() != meta["sha256"].lower():
+                raise ValueError("checksum mismatch for the assembled file")
+
+        file_storage = FileStorage(open(data_path, "rb"), filename=meta["filename"])
+        if meta.get("folder"):
+            result = upload_video(file_storage, folder_name=meta["folder"])
+        else:
+            result = upload_video(file_storage)
+    except Exception:
+        os.rename(claimed, path)  # leave it resumable
+        raise
+
+    shutil.rmtree(claimed, ignore_errors=True)
+    return result
+
+
+def abort_session(session_id: str):
+    shutil.rmtree(_session_dir(session_id), ignore_errors=True)
+
+
+def collect_idle_sessions(throttle: bool = False) -> int:
+    """
+    Delete sessions with no activity for ``UPLOAD_SESSION_TTL`` seconds.
+    With ``throttle`` it runs at most once a minute per worker.
+    """
+    global _last_gc
+    now = time.time()
+    if throttle and now - _last_gc < 60:
+        return 0
+    _last_gc = now
+
+    ttl = current_app.config["UPLOAD_SESSION_TTL"]
+    root = _root()
+    removed = 0
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        try:
+            idle = now - os.path.getmtime(path)
+        except OSError:
+            continue
+        # Stuck finalizations get the same grace period
+        if idle > ttl and SESSION_ID_RE.match(name.split(".")[0]):
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+    return removed
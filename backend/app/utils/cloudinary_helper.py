@@ -1,48 +1,117 @@
+import io
+import os
+import tempfile
+
 import cloudinary.uploader
 from flask import current_app
 
+from app.utils.metrics import external_call
+from app.utils.upload_spool import UploadSpool
+
 
 ALLOWED_VIDEO_EXT = {"mp4", "mov", "avi", "mkv", "webm"}
 ALLOWED_IMAGE_EXT = {"jpg", "jpeg", "png", "webp", "gif"}
+STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MB
 
 
 def _extension(filename: str) -> str:
     return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
 
 
-def upload_video(file_storage, folder_name: str = "videolozy/videos") -> dict:
-    """Upload a video file to Cloudinary. Returns {public_id, url}."""
+def _copy_limited(src, dst, limit: int, message: str) -> int:
+    """Copy ``src`` to ``dst`` in fixed-size chunks, failing once over ``limit``."""
+    copied = 0
+    while True:
+        chunk = src.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            return copied
+        copied += len(chunk)
+        if copied > limit:
+            raise ValueError(message)
+        dst.write(chunk)
+
+
+def _on_disk_size(stream):
+    """Size of a stream backed by a file on disk, or None if it must be copied."""
+    if isinstance(stream, UploadSpool):
+        return stream.size
+    if isinstance(stream, io.BufferedReader) and isinstance(stream.name, str) and os.path.isfile(stream.name):
+        return os.fstat(stream.fileno()).st_size
+    return None
+
+
+def upload_video(file_storage, folder_name: str = "videolozy/videos", progress=None) -> dict:
+    """
+    Upload a video file to Cloudinary. Returns {public_id, url}.
+    ``progress(bytes_sent, bytes_total)`` is called as upload_large reads each chunk.
+    """
     ext = _extension(file_storage.filename)
     if ext not in ALLOWED_VIDEO_EXT:
         raise ValueError(f"Unsupported video format: .{ext}")
 
-    file_storage.seek(0, 2)
-    size = file_storage.tell()
-    file_storage.seek(0)
-    if size > current_app.config["MAX_VIDEO_SIZE"]:
-        raise ValueError("Video file exceeds 1 GB limit.")
-
-    import tempfile
-    import os
-    
-    # Cloudinary upload_large requires a context-manager compliant file object
-    # like an open() handle, or a physical file path. We'll save it to a physical tmp file.
+    limit = current_app.config["MAX_VIDEO_SIZE"]
+    message = "Video file exceeds 1 GB limit."
+    stream = file_storage.stream
+
+    # Already on disk — Werkzeug's spool (see SpoolingRequest) or an assembled
+    # chunked upload — so hand that file to Cloudinary as-is.
+    size = _on_disk_size(stream)
+    if size is not None:
+        if size > limit:
+            raise ValueError(message)
+        stream.seek(0)
+        return _upload_large(stream, folder_name, progress)
+
+    # Any other stream: copy it to disk in chunks, enforcing the limit as we go.
+    # Cloudinary upload_large requires a real file handle or a path.
     fd, temp_path = tempfile.mkstemp(suffix=f".{ext}")
     try:
-        with os.fdopen(fd, 'wb') as f:
+        with os.fdopen(fd, "wb") as f:
             file_storage.seek(0)
-            f.write(file_storage.read())
+            _copy_limited(file_storage.stream, f, limit, message)
+        return _upload_large(temp_path, folder_name, progress)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class _ProgressReader:
+    """File wrapper reporting how far upload_large has read through it."""
+
+    def __init__(self, file, callback):
+        self._file = file
+        self._callback = callback
+        self._total = os.fstat(file.fileno()).st_size
+        self._sent = 0
+
+    def read(self, size=-1):
+        data = self._file.read(size)
+        self._sent += len(data)
+        if data:
+            self._callback(self._sent, self._total)
+        return data
+
+    def __getattr__(self, attr):
+        return getattr(self._file, attr)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+
+def _upload_large(source, folder_name: str, progress=None) -> dict:
+    if progress is not None:
+        source = _ProgressReader(open(source, "rb") if isinstance(source, str) else source, progress)
+    with external_call("cloudinary", "upload_large"):
         result = cloudinary.uploader.upload_large(
-            temp_path,
+            source,
             resource_type="video",
             folder=folder_name,
             chunk_size=6000000,
         )
-        return {"public_id": result["public_id"], "url": result["secure_url"]}
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+    return {"public_id": result["public_id"], "url": result["secure_url"]}
 
 
 def upload_image(file_storage, folder_name: str = "videolozy/thumbnails") -> dict:
@@ -51,23 +120,29 @@ def upload_image(file_storage, folder_name: str = "videolozy/thumbnails") -> dic
     if ext not in ALLOWED_IMAGE_EXT:
         raise ValueError(f"Unsupported image format: .{ext}")
 
-    file_storage.seek(0, 2)
-    size = file_storage.tell()
+    stream = file_storage.stream
+    if isinstance(stream, UploadSpool):
+        size = stream.size
+    else:
+        file_storage.seek(0, 2)
+        size = file_storage.tell()
     file_storage.seek(0)
     if size > current_app.config["MAX_IMAGE_SIZE"]:
         raise ValueError("Image file exceeds 5 MB limit.")
 
-    result = cloudinary.uploader.upload(
-        file_storage,
-        resource_type="image",
-        folder=folder_name,
-    )
+    with external_call("cloudinary", "upload"):
+        result = cloudinary.uploader.upload(
+            file_storage,
+            resource_type="image",
+            folder=folder_name,
+        )
     return {"public_id": result["public_id"], "url": result["secure_url"]}
 
 
 def delete_resource(public_id: str, resource_type: str = "image"):
     """Delete a resource from Cloudinary."""
-    cloudinary.uploader.destroy(public_id, resource_type=resource_type)
+    with external_call("cloudinary", "destroy"):
+        cloudinary.uploader.destroy(public_id, resource_type=resource_type)
 
 
 def build_video_url(public_id: str, cloud_name: str) -> str:
@@ -0,0 +1,94 @@
+"""
+Negotiated gzip / brotli compression of API responses.
+
+An ``after_request`` hook compresses JSON bodies of at least
+``COMPRESS_MIN_SIZE`` bytes with the best encoding the client accepts:
+brotli (when brotlicffi or brotli is installed), then gzip. It leaves alone:
+
+- streamed responses, such as CSV/NDJSON exports and ``send_file``;
+- responses that already have a ``Content-Encoding``, such as precompressed
+  static files;
+- anything other than ``200``, and anything marked ``no-transform``.
+
+Bodies served by ``cached_json`` keep their compressed forms on the cache
+entry, so an identical payload is compressed once per encoding instead of
+per request. A compressed response gets a weak ETag (``W/"..."``) because its
+bytes differ from the uncompressed representation. If-None-Match uses weak
+comparison, so conditional requests still get their 304.
+"""
+import gzip
+
+from flask import current_app, g, request
+
+try:
+    import brotlicffi as brotli
+except ImportError:
+    try:
+        import brotli
+    except ImportError:  # optional: gzip only
+        brotli = None
+
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    config = current_app.config
+    if encoding == "br":
+        return brotli.compress(body, quality=config["COMPRESS_BROTLI_QUALITY"])
+    return gzip.compress(body, compresslevel=config["COMPRESS_GZIP_LEVEL"], mtime=0)
+
+
+def negotiate() -> str:
+    """The accepted encoding with the highest quality; ties go to brotli."""
+    best, best_quality = None, 0
+    for encoding in ENCODINGS:
+        quality = request.accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _compressible(response) -> bool:
+    return (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and "Content-Encoding" not in response.headers
+        and response.mimetype in current_app.config["COMPRESS_MIMETYPES"]
+        and not response.cache_control.no_transform
+    )
+
+
+def init_compression(app):
+    if not app.config["COMPRESS_RESPONSES"]:
+        return
+
+    @app.after_request
+    def compress_response(response):
+        if not _compressible(response):
+            return response
+        # Representations vary by Accept-Encoding even when this one isn't compressed
+        response.vary.add("Accept-Encoding")
+        body = response.get_data()
+        if len(body) < current_app.config["COMPRESS_MIN_SIZE"]:
+            return response
+        encoding = negotiate()
+        if encoding is None:
+            return response
+
+        entry = g.get("response_cache_entry")  # set by cached_json
+        if entry is not None and entry.body == body:
+            compressed = entry.encoded.get(encoding)
+            if compressed is None:
+                compressed = entry.encoded[encoding] = compress(body, encoding)
+        else:
+            compressed = compress(body, encoding)
+        if len(compressed) >= len(body):
+            return response
+
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
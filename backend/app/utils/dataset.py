@@ -0,0 +1,103 @@
+"""
+Synthetic dataset for query-plan checks and benchmarks.
+
+Bulk-inserts ``projects × media_per_project`` media rows and ``inquiries``
+contact messages with a realistic spread of categories, dates and statuses.
+Only meant for scratch databases — never point it at production.
+"""
+import random
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, insert
+
+from app import db
+from app.models.inquiry import Inquiry
+from app.models.project import Project, ProjectMedia
+from app.models.setting import SiteSetting
+from app.models.user import AdminUser
+
+CATEGORIES = [
+    "Wedding Film", "Music Video", "Commercial", "Documentary",
+    "Short Film", "Corporate", "Travel", "Reel",
+]
+WORDS = (
+    "cinematic story colour grade edit rhythm pacing montage drone "
+    "interview brand launch festival trailer teaser sunset city"
+).split()
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "dataset-admin"
+ADMIN_EMAIL = "admin@example.com"
+BATCH = 5000
+
+
+def _insert_batches(model, rows):
+    for start in range(0, len(rows), BATCH):
+        db.session.execute(insert(model), rows[start:start + BATCH])
+
+
+def seed_dataset(projects: int = 2000, media_per_project: int = 10,
+                 inquiries: int = 20000, seed: int = 42) -> dict:
+    """Insert the dataset into the current app's database and commit."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    if not AdminUser.query.filter_by(username=ADMIN_USERNAME).first():
+        admin = AdminUser(username=ADMIN_USERNAME, email=ADMIN_EMAIL)
+        admin.set_password(ADMIN_PASSWORD)
+        db.session.add(admin)
+    for i in range(12):
+        db.session.add(SiteSetting(key=f"setting_{i}", value=" ".join(rng.sample(WORDS, 5))))
+    db.session.flush()
+
+    first_id = (db.session.query(func.max(Project.id)).scalar() or 0) + 1
+    project_rows, media_rows = [], []
+    for pid in range(first_id, first_id + projects):
+        created = now - timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60))
+        project_rows.append({
+            "id": pid,
+            "title": " ".join(rng.sample(WORDS, 3)).title(),
+            "description": " ".join(rng.choices(WORDS, k=40)),
+            "category": rng.choice(CATEGORIES),
+            "release_date": (
+                date(2019, 1, 1) + timedelta(days=rng.randint(0, 2500))
+                if rng.random() > 0.05 else None
+            ),
+            "cloudinary_video_id": f"videolozy/videos/v{pid}",
+            "cloudinary_thumbnail_id": f"videolozy/thumbnails/t{pid}",
+            "is_featured": rng.random() < 0.05,
+            "created_at": created,
+            "updated_at": created,
+        })
+        for order in range(media_per_project):
+            media_rows.append({
+                "project_id": pid,
+                "media_type": rng.choice(["standard_video", "short_reel", "image"]),
+                "cloudinary_id": f"videolozy/media/p{pid}_{order}",
+                "url": f"https://res.cloudinary.com/demo/video/upload/videolozy/media/p{pid}_{order}.mp4",
+                "order": order,
+                "created_at": created,
+            })
+    _insert_batches(Project, project_rows)
+    _insert_batches(ProjectMedia, media_rows)
+
+    inquiry_rows = [
+        {
+            "name": f"Client {i}",
+            "email": f"client{i}@example.com",
+            "message": " ".join(rng.choices(WORDS, k=30)),
+            "budget": rng.choice([None, "₹10k–25k", "₹25k–50k", "₹50k+"]),
+            "status": rng.choices(["unread", "read", "replied"], weights=[1, 7, 2])[0],
+            "created_at": now - timedelta(minutes=rng.randint(0, 2 * 365 * 24 * 60)),
+        }
+        for i in range(inquiries)
+    ]
+    _insert_batches(Inquiry, inquiry_rows)
+    db.session.commit()
+
+    return {
+        "projects": projects,
+        "media": len(media_rows),
+        "inquiries": inquiries,
+        "first_project_id": first_id,
+        "admin": {"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD},
+    }
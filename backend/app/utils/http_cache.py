@@ -0,0 +1,49 @@
+"""
+Conditional GET helpers for the public read API.
+
+A route first runs a cheap validator query (e.g. ``max(updated_at)``), turns
+it into a strong ETag and only builds the full JSON payload when the client's
+``If-None-Match`` / ``If-Modified-Since`` no longer matches. Matching
+requests get an empty ``304 Not Modified``. ``response_cache.cached_json``
+wraps these helpers for the public routes.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from flask import current_app, request
+from werkzeug.http import is_resource_modified
+
+
+def make_etag(*validators) -> str:
+    """Hash the validators together with the request URL (filters, cursor, ...)."""
+    raw = json.dumps([request.full_path, *validators], default=str, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _as_utc(value: datetime):
+    # Columns are stored as naive UTC timestamps
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def is_fresh(etag: str, last_modified: datetime = None) -> bool:
+    """True when the client's cached copy still matches these validators."""
+    return not is_resource_modified(
+        request.environ, etag=etag, last_modified=_as_utc(last_modified)
+    )
+
+
+def with_validators(response, etag: str, last_modified: datetime = None):
+    """Attach ETag, Last-Modified and the configured Cache-Control."""
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = _as_utc(last_modified)
+    response.headers["Cache-Control"] = current_app.config["PUBLIC_CACHE_CONTROL"]
+    return response
+
+
+def not_modified(etag: str, last_modified: datetime = None):
+    return with_validators(current_app.response_class(status=304), etag, last_modified)
+
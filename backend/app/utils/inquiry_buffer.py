@@ -0,0 +1,153 @@
+"""
+Write-behind intake for contact-form inquiries (``INQUIRY_BUFFER=1``).
+
+``submit_contact`` validates the form and hands the row to ``buffer_inquiry``,
+which puts it on a bounded in-process queue and returns. The request can then
+answer ``202`` without waiting for the database. A background thread collects
+up to ``INQUIRY_BUFFER_BATCH`` rows, or whatever arrived within
+``INQUIRY_BUFFER_WAIT`` seconds of the first one, and writes them with one
+multi-row ``INSERT`` and one commit.
+
+- When the queue already holds ``INQUIRY_BUFFER_SIZE`` rows, ``buffer_inquiry``
+  returns False and the caller writes the row itself, as it does with
+  buffering off.
+- A batch that fails to insert is retried with backoff. After the last
+  attempt its rows are logged at ERROR level with every field, so they can be
+  recovered from the logs.
+- Pending rows are flushed when the process exits normally (``atexit``). A
+  crash or ``SIGKILL`` loses at most one queue's worth, so leave buffering off
+  where that is unacceptable.
+
+Each worker process has its own queue. Buffered inquiries show up in the
+admin panel once their batch is written, usually within
+``INQUIRY_BUFFER_WAIT`` seconds.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import insert
+
+from app import db
+from app.models.inquiry import Inquiry
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5  # seconds before the first retry, doubles
+
+
+class InquiryBuffer:
+    def __init__(self, app):
+        self.app = app
+        self.batch_size = app.config["INQUIRY_BUFFER_BATCH"]
+        self.batch_wait = app.config["INQUIRY_BUFFER_WAIT"]
+        self._queue = queue.Queue(maxsize=app.config["INQUIRY_BUFFER_SIZE"])
+        self._thread = None
+        self._lock = threading.Lock()
+        self.counters = {"buffered": 0, "overflow": 0, "written": 0, "batches": 0, "retried": 0, "failed": 0}
+
+    def submit(self, row: dict) -> bool:
+        """Queue one row of ``Inquiry`` column values. False when the queue is full."""
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.counters["overflow"] += 1
+            return False
+        self.counters["buffered"] += 1
+        self._ensure_thread()
+        return True
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="inquiry-flush", daemon=True
+                )
+                self._thread.start()
+
+    def close(self, timeout: float = 10.0):
+        """Write everything queued now and stop the flusher."""
+        if self._thread is None:
+            return
+        # put() rather than put_nowait(): a full queue drains while we wait
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            rows, stop = self._collect()
+            if rows:
+                self._write(rows)
+            if stop:
+                return
+
+    def _collect(self) -> tuple:
+        """Block for the first row, then gather more until the batch is full or the wait is over."""
+        rows = []
+        deadline = None
+        while len(rows) < self.batch_size:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                break
+            try:
+                row = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if row is None:
+                # Shutting down: take everything already queued and stop
+                while True:
+                    try:
+                        row = self._queue.get_nowait()
+                    except queue.Empty:
+                        return rows, True
+                    if row is not None:
+                        rows.append(row)
+            rows.append(row)
+            if deadline is None:
+                deadline = time.monotonic() + self.batch_wait
+        return rows, False
+
+    def _write(self, rows: list):
+        for start in range(0, len(rows), self.batch_size):
+            self._write_batch(rows[start:start + self.batch_size])
+
+    def _write_batch(self, rows: list):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                with self.app.app_context():
+                    db.session.execute(insert(Inquiry), rows)
+                    db.session.commit()
+            except Exception as e:
+                logger.warning("Writing %d buffered inquiries failed (attempt %d): %s",
+                               len(rows), attempt, e)
+                if attempt < MAX_ATTEMPTS:
+                    self.counters["retried"] += 1
+                    time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+                continue
+            self.counters["written"] += len(rows)
+            self.counters["batches"] += 1
+            return
+        self.counters["failed"] += len(rows)
+        for row in rows:
+            logger.error("Dropped buffered inquiry after %d attempts", MAX_ATTEMPTS, extra={"inquiry": row})
+
+    def stats(self) -> dict:
+        return {**self.counters, "pending": self._queue.qsize()}
+
+
+def init_inquiry_buffer(app):
+    if not app.config["INQUIRY_BUFFER"]:
+        return
+    inquiry_buffer = InquiryBuffer(app)
+    app.extensions["inquiry_buffer"] = inquiry_buffer
+    atexit.register(inquiry_buffer.close)
+
+
+def buffer_inquiry(row: dict) -> bool:
+    """Hand a validated inquiry to the write-behind queue. False means write it now."""
+    inquiry_buffer = current_app.extensions.get("inquiry_buffer")
+    return inquiry_buffer is not None and inquiry_buffer.submit(row)
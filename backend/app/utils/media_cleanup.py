@@ -0,0 +1,250 @@
+"""
+Deferred Cloudinary deletion and orphan sweeping.
+
+Admin writes don't call the media store. They hand the assets they dropped to
+``release_assets``, which skips anything still referenced and queues the rest.
+A background thread collects the queue for up to ``MEDIA_DELETE_BATCH_WAIT``
+seconds and then sends one ``delete_resources`` call per resource type, with
+up to 100 public_ids per call. Failed ids are retried with exponential backoff
+(``MEDIA_DELETE_BACKOFF``, doubling) up to ``MEDIA_DELETE_MAX_ATTEMPTS`` times.
+
+The queue lives in memory, so anything lost to a crash or restart is left
+to ``find_orphans``. It pages through the remote folder listing and reports
+assets that nothing in the database references (see ``sweep_orphans.py``).
+"""
+import atexit
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import cloudinary.api
+from flask import current_app
+from sqlalchemy import select, union
+
+from app import db
+from app.models.project import Project, ProjectMedia
+from app.models.setting import SiteSetting
+from app.utils.metrics import external_call
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100      # Admin API limit per delete_resources call
+LIST_PAGE_SIZE = 500  # Admin API limit per resources call
+
+
+def resource_type_for(media_type: str) -> str:
+    return "image" if media_type == "image" else "video"
+
+
+def project_assets(project: Project) -> set:
+    """Every ``(resource_type, public_id)`` a project points at."""
+    assets = {
+        ("video", project.cloudinary_video_id),
+        ("image", project.cloudinary_thumbnail_id),
+    }
+    assets.update((resource_type_for(m.media_type), m.cloudinary_id) for m in project.media)
+    return {(rt, pid) for rt, pid in assets if pid}
+
+
+def referenced_ids(candidates=None) -> set:
+    """
+    public_ids still used by a project, a media row or a site setting
+    (settings such as ``showreel_video_id`` hold raw ids). With
+    ``candidates``, only those ids are looked up.
+    """
+    if candidates is not None:
+        candidates = list(candidates)
+    columns = (Project.cloudinary_video_id, Project.cloudinary_thumbnail_id,
+               ProjectMedia.cloudinary_id, SiteSetting.value)
+    selects = []
+    for column in columns:
+        stmt = select(column.label("public_id"))
+        if candidates is not None:
+            stmt = stmt.where(column.in_(candidates))
+        selects.append(stmt)
+    return {pid for pid in db.session.execute(union(*selects)).scalars() if pid}
+
+
+def delete_assets(assets) -> dict:
+    """
+    Delete ``(resource_type, public_id)`` pairs synchronously in API-sized
+    batches. Returns ``{"deleted": n, "not_found": n, "failed": [...]}``.
+    """
+    report = {"deleted": 0, "not_found": 0, "failed": []}
+    by_type = {}
+    for resource_type, public_id in assets:
+        by_type.setdefault(resource_type, []).append(public_id)
+    for resource_type, ids in by_type.items():
+        for start in range(0, len(ids), BATCH_SIZE):
+            batch = ids[start:start + BATCH_SIZE]
+            deleted, failed = _delete_batch(resource_type, batch)
+            report["deleted"] += sum(1 for s in deleted.values() if s == "deleted")
+            report["not_found"] += sum(1 for s in deleted.values() if s == "not_found")
+            report["failed"].extend((resource_type, pid) for pid in failed)
+    return report
+
+
+def _delete_batch(resource_type: str, ids: list) -> tuple:
+    """One delete_resources call. Returns ``({public_id: status}, failed_ids)``."""
+    try:
+        with external_call("cloudinary", "delete_resources"):
+            result = cloudinary.api.delete_resources(ids, resource_type=resource_type, type="upload")
+    except Exception as e:
+        logger.warning("Deleting %d %s asset(s) failed: %s", len(ids), resource_type, e)
+        return {}, list(ids)
+    statuses = result.get("deleted", {})
+    done = {pid: s for pid, s in statuses.items() if s in ("deleted", "not_found")}
+    return done, [pid for pid in ids if pid not in done]
+
+
+class DeletionQueue:
+    def __init__(self, app):
+        self.batch_wait = app.config["MEDIA_DELETE_BATCH_WAIT"]
+        self.max_attempts = app.config["MEDIA_DELETE_MAX_ATTEMPTS"]
+        self.backoff = app.config["MEDIA_DELETE_BACKOFF"]
+        self._queue = queue.Queue()
+        self._retry = []  # heap of (due, seq, (resource_type, public_id, attempt))
+        self._seq = itertools.count()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closing = False
+        self.counters = {"queued": 0, "deleted": 0, "not_found": 0, "retried": 0, "failed": 0}
+
+    def enqueue(self, assets):
+        for resource_type, public_id in assets:
+            self._queue.put((resource_type, public_id, 1))
+            self.counters["queued"] += 1
+        self._ensure_thread()
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="media-delete", daemon=True
+                )
+                self._thread.start()
+
+    def close(self, timeout: float = 10.0):
+        """Send whatever is queued now (retries still waiting are dropped)."""
+        self._closing = True
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            items, stop = self._collect()
+            if items:
+                self._send(items)
+            if stop:
+                return
+
+    def _collect(self) -> tuple:
+        """Block for the first item, then gather more until the batch is full or the wait is over."""
+        items = []
+        deadline = None
+        while len(items) < BATCH_SIZE:
+            now = time.monotonic()
+            while self._retry and self._retry[0][0] <= now and len(items) < BATCH_SIZE:
+                items.append(heapq.heappop(self._retry)[2])
+            if items and deadline is None:
+                deadline = now + self.batch_wait
+            if deadline is not None and now >= deadline:
+                break
+            waits = [t - now for t in (deadline, self._retry[0][0] if self._retry else None) if t is not None]
+            try:
+                item = self._queue.get(timeout=max(0.0, min(waits)) if waits else None)
+            except queue.Empty:
+                continue
+            if item is None:
+                # Shutting down: take everything already queued and stop
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        return items, True
+                    if item is not None:
+                        items.append(item)
+            items.append(item)
+        return items, False
+
+    def _send(self, items):
+        attempts = {}
+        by_type = {}
+        for resource_type, public_id, attempt in items:
+            attempts[(resource_type, public_id)] = attempt
+            by_type.setdefault(resource_type, []).append(public_id)
+
+        for resource_type, ids in by_type.items():
+            for start in range(0, len(ids), BATCH_SIZE):
+                self._send_batch(resource_type, ids[start:start + BATCH_SIZE], attempts)
+
+    def _send_batch(self, resource_type, ids, attempts):
+        deleted, failed = _delete_batch(resource_type, ids)
+        for status in deleted.values():
+            self.counters[status] += 1
+        for public_id in failed:
+            attempt = attempts[(resource_type, public_id)]
+            if attempt >= self.max_attempts or self._closing:
+                self.counters["failed"] += 1
+                logger.error("Giving up on deleting %s %s after %d attempt(s)",
+                             resource_type, public_id, attempt)
+                continue
+            self.counters["retried"] += 1
+            due = time.monotonic() + self.backoff * 2 ** (attempt - 1)
+            heapq.heappush(self._retry, (due, next(self._seq), (resource_type, public_id, attempt + 1)))
+
+    def stats(self) -> dict:
+        return {**self.counters, "pending": self._queue.qsize(), "waiting_retry": len(self._retry)}
+
+
+def init_media_cleanup(app):
+    deletion_queue = DeletionQueue(app)
+    app.extensions["media_cleanup"] = deletion_queue
+    atexit.register(deletion_queue.close)
+
+
+def get_deletion_queue() -> DeletionQueue:
+    return current_app.extensions["media_cleanup"]
+
+
+def release_assets(assets):
+    """Queue deletion of assets that are no longer referenced anywhere. Call after commit."""
+    assets = {(rt, pid) for rt, pid in assets if pid}
+    if not assets:
+        return
+    still_used = referenced_ids(pid for _, pid in assets)
+    orphaned = [asset for asset in assets if asset[1] not in still_used]
+    if orphaned:
+        get_deletion_queue().enqueue(orphaned)
+
+
+# ─── Sweeper ─────────────────────────────────────────────────────────────────
+
+def find_orphans(prefix: str = "videolozy/", min_age: timedelta = timedelta(hours=24)):
+    """
+    Yield ``(resource_type, public_id, bytes)`` for remote assets under
+    ``prefix`` that nothing references. Assets younger than ``min_age`` are
+    skipped: they may be uploads whose project hasn't been saved yet.
+    """
+    referenced = referenced_ids()
+    cutoff = datetime.now(timezone.utc) - min_age
+    for resource_type in ("image", "video"):
+        cursor = None
+        while True:
+            options = {"type": "upload", "prefix": prefix, "max_results": LIST_PAGE_SIZE}
+            if cursor:
+                options["next_cursor"] = cursor
+            with external_call("cloudinary", "resources"):
+                page = cloudinary.api.resources(resource_type=resource_type, **options)
+            for resource in page.get("resources", []):
+                created = datetime.fromisoformat(resource["created_at"].replace("Z", "+00:00"))
+                if resource["public_id"] not in referenced and created < cutoff:
+                    yield resource_type, resource["public_id"], resource.get("bytes", 0)
+            cursor = page.get("next_cursor")
+            if not cursor:
+                break
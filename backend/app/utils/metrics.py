@@ -0,0 +1,208 @@
+"""
+Per-request instrumentation and Prometheus metrics.
+
+Every request records wall time, time spent in SQL (timed with engine
+cursor events, counted by ``query_budget``) and time spent in external calls
+such as Cloudinary (wrap them in ``external_call``). The numbers are sent
+back as a ``Server-Timing`` header, so they show up in the browser's network
+panel:
+
+    Server-Timing: app;dur=41.2, db;dur=12.8;desc="3 queries", cloudinary;dur=20.1
+
+They are also aggregated into histograms that ``/api/admin/metrics`` renders
+in the Prometheus text format. The registry is per process, so each gunicorn
+worker reports its own series.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _labels(names, values) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for values, total in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labels, values)} {total:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self._series = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = self.labels + ("le",)
+        with self._lock:
+            for values, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    lines.append(f"{self.name}_bucket{_labels(names, values + (f'{bound:g}',))} {count}")
+                lines.append(f"{self.name}_bucket{_labels(names, values + ('+Inf',))} {series[-1]}")
+                lines.append(f"{self.name}_sum{_labels(self.labels, values)} {series[-2]:.6f}")
+                lines.append(f"{self.name}_count{_labels(self.labels, values)} {series[-1]}")
+        return lines
+
+
+REQUESTS = Counter("http_requests_total", "Requests handled.", ("endpoint", "method", "status"))
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "Wall time per request.", ("endpoint", "method"))
+DB_SECONDS = Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per request.", ("endpoint",))
+DB_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements per request.", ("endpoint",), QUERY_BUCKETS)
+EXTERNAL_SECONDS = Histogram(
+    "external_call_duration_seconds", "Calls to external services.", ("service", "operation"))
+EXTERNAL_ERRORS = Counter(
+    "external_call_errors_total", "External calls that raised.", ("service", "operation"))
+
+METRICS = [REQUESTS, REQUEST_SECONDS, DB_SECONDS, DB_QUERIES, EXTERNAL_SECONDS, EXTERNAL_ERRORS]
+
+
+# ─── Collection ──────────────────────────────────────────────────────────────
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_metrics_start", None)
+    if start is not None and has_request_context():
+        g.db_time = g.get("db_time", 0.0) + time.perf_counter() - start
+
+
+@contextmanager
+def external_call(service: str, operation: str):
+    """Time a call to an external service, for the histogram and Server-Timing."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        EXTERNAL_ERRORS.inc(service, operation)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        EXTERNAL_SECONDS.observe(elapsed, service, operation)
+        if has_request_context():
+            spent = g.setdefault("external_time", {})
+            spent[service] = spent.get(service, 0.0) + elapsed
+
+
+def _server_timing(total: float, db_time: float, queries: int, external: dict) -> str:
+    parts = [f"app;dur={total * 1000:.1f}", f'db;dur={db_time * 1000:.1f};desc="{queries} queries"']
+    parts += [f"{service};dur={spent * 1000:.1f}" for service, spent in sorted(external.items())]
+    return ", ".join(parts)
+
+
+def init_metrics(app):
+    for name, listener in (("before_cursor_execute", _before_cursor_execute),
+                           ("after_cursor_execute", _after_cursor_execute)):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        start = g.get("request_start")
+        if start is None:
+            return response
+        total = time.perf_counter() - start
+        endpoint = request.endpoint or "unmatched"  # keeps 404 paths out of the label set
+        db_time = g.get("db_time", 0.0)
+        queries = g.get("query_count", 0)
+        external = g.get("external_time", {})
+
+        REQUESTS.inc(endpoint, request.method, response.status_code)
+        REQUEST_SECONDS.observe(total, endpoint, request.method)
+        DB_SECONDS.observe(db_time, endpoint)
+        DB_QUERIES.observe(queries, endpoint)
+
+        if current_app.config["SERVER_TIMING"]:
+            response.headers["Server-Timing"] = _server_timing(total, db_time, queries, external)
+        if total * 1000 >= current_app.config["SLOW_REQUEST_MS"]:
+            logger.warning("Slow request", extra={
+                "method": request.method,
+                "path": request.path,
+                "endpoint": endpoint,
+                "status": response.status_code,
+                "duration_ms": round(total * 1000, 1),
+                "db_ms": round(db_time * 1000, 1),
+                "queries": queries,
+                **{f"{service}_ms": round(spent * 1000, 1) for service, spent in external.items()},
+            })
+        return response
+
+
+# ─── Exposition ──────────────────────────────────────────────────────────────
+
+def _gauges(name: str, help: str, values: dict) -> list:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+    lines += [f'{name}{{kind="{kind}"}} {value:g}' for kind, value in sorted(values.items())
+              if isinstance(value, (int, float))]
+    return lines
+
+
+def render_metrics() -> str:
+    """All metrics for this process in the Prometheus text exposition format."""
+    lines = []
+    for metric in METRICS:
+        lines += metric.render()
+    extensions = current_app.extensions
+    if "response_cache" in extensions:
+        lines += _gauges("response_cache", "Response cache counters.", extensions["response_cache"].stats())
+    if "media_cleanup" in extensions:
+        lines += _gauges("media_delete_queue", "Deferred Cloudinary delete counters.",
+                         extensions["media_cleanup"].stats())
+    if "inquiry_buffer" in extensions:
+        lines += _gauges("inquiry_buffer", "Write-behind inquiry intake counters.",
+                         extensions["inquiry_buffer"].stats())
+    if "rate_limiter" in extensions:
+        lines += _gauges("rate_limit", "Rate-limited vs allowed requests.", extensions["rate_limiter"].stats())
+    return "\n".join(lines) + "\n"
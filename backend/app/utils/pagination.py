@@ -0,0 +1,95 @@
+"""
+Keyset (cursor) pagination for the list endpoints.
+
+Rows are ordered newest-first on ``(sort_column, id)`` with NULL sort values
+last, and the cursor encodes the last row's pair. The next page is then a
+plain range filter on an index instead of an ever-growing OFFSET, so every
+page costs the same no matter how deep the client scrolls.
+
+Pagination is opt-in: endpoints only switch to the ``{items, next_cursor}``
+envelope when the client sends ``limit`` or ``cursor``.
+"""
+import base64
+import json
+from datetime import date, datetime
+
+from flask import current_app
+from sqlalchemy import Date, DateTime, and_, or_
+
+
+def keyset_order(sort_column, id_column) -> tuple:
+    """The stable ORDER BY shared by paginated and unpaginated listings."""
+    return sort_column.desc().nulls_last(), id_column.desc()
+
+
+def encode_cursor(value, row_id: int) -> str:
+    raw = json.dumps([value.isoformat() if value is not None else None, row_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column) -> tuple:
+    """Decode a cursor back into ``(sort_value, id)``. Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    if value is not None:
+        column_type = sort_column.property.columns[0].type
+        try:
+            if isinstance(column_type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column_type, Date):
+                value = date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+    return value, row_id
+
+
+def parse_page_args(args):
+    """
+    Read ``cursor`` and ``limit`` from the query string.
+    Returns None when the client did not ask for pagination, else ``(cursor, limit)``.
+    Raises ValueError on a bad limit.
+    """
+    if "cursor" not in args and "limit" not in args:
+        return None
+    default = current_app.config["PAGE_SIZE_DEFAULT"]
+    maximum = current_app.config["PAGE_SIZE_MAX"]
+    try:
+        limit = int(args.get("limit", default))
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return args.get("cursor") or None, min(limit, maximum)
+
+
+def keyset_paginate(query, sort_column, id_column, cursor: str = None, limit: int = 50):
+    """
+    Fetch one page of ``query``. Returns ``(rows, next_cursor)``;
+    ``next_cursor`` is None on the last page.
+    """
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_column)
+        if value is None:
+            # Already inside the trailing NULL block — only ids are left to walk
+            query = query.filter(sort_column.is_(None), id_column < last_id)
+        else:
+            query = query.filter(
+                or_(
+                    sort_column < value,
+                    and_(sort_column == value, id_column < last_id),
+                    sort_column.is_(None),
+                )
+            )
+
+    rows = query.order_by(*keyset_order(sort_column, id_column)).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
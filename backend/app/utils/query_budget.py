@@ -0,0 +1,97 @@
+"""
+SQL query counting and per-request query budgets.
+
+Every statement SQLAlchemy sends to the database bumps a counter for the
+current request. When a request goes over its budget (``QUERY_BUDGET`` from
+config, or a tighter one set with ``@query_budget(n)`` on the view) a warning
+is logged in development, so an N+1 regression shows up in the console
+instead of as slow pages against NeonDB.
+
+Scripts and tests can assert an exact budget with ``count_queries()``:
+
+    with count_queries() as counter:
+        client.get("/api/projects")
+    assert counter.count <= 2
+"""
+import logging
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class QueryCounter:
+    """Collects the statements executed inside a ``count_queries()`` block."""
+
+    def __init__(self):
+        self.queries = []  # (statement, parameters)
+
+    @property
+    def statements(self) -> list:
+        return [statement for statement, _ in self.queries]
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+
+def _active_counters() -> list:
+    if not hasattr(_local, "counters"):
+        _local.counters = []
+    return _local.counters
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.query_count = g.get("query_count", 0) + 1
+    for counter in _active_counters():
+        counter.queries.append((statement, parameters))
+
+
+@contextmanager
+def count_queries():
+    """Count every SQL statement executed on this thread inside the block."""
+    counter = QueryCounter()
+    counters = _active_counters()
+    counters.append(counter)
+    try:
+        yield counter
+    finally:
+        counters.remove(counter)
+
+
+def query_budget(limit: int):
+    """Set a per-view query budget, overriding ``QUERY_BUDGET`` for that route."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            g.query_budget = limit
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def init_query_budget(app):
+    """Hook the query counter into the engine and the request lifecycle."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+
+    @app.after_request
+    def check_query_budget(response):
+        count = g.get("query_count", 0)
+        budget = g.get("query_budget", current_app.config.get("QUERY_BUDGET"))
+        if current_app.debug or current_app.testing:
+            response.headers["X-Query-Count"] = str(count)
+        if budget is not None and count > budget and current_app.debug:
+            logger.warning(
+                "%s %s ran %d SQL queries (budget %d) — possible N+1",
+                request.method, request.path, count, budget,
+            )
+        return response
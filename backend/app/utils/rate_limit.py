@@ -0,0 +1,170 @@
+"""
+Token-bucket rate limiting for the public write/probe endpoints.
+
+Each (endpoint, client IP) pair has a bucket that holds up to ``capacity``
+tokens and refills continuously at ``capacity / period``. A request takes one
+token. Requests that find the bucket empty are rejected at once with
+``429 Too Many Requests`` and a ``Retry-After`` header, so abuse costs a dict
+lookup instead of a worker sleeping or a database write.
+
+Limits are ``"<count>/<period>"`` strings from config, e.g. ``"5/minute"``:
+
+    @public_bp.route("/contact", methods=["POST"])
+    @rate_limit("contact", "RATE_LIMIT_CONTACT")
+    def submit_contact(): ...
+
+Backends are chosen with ``RATE_LIMIT_BACKEND``: ``"memory"`` (default, per
+worker process), ``"null"`` (disabled) or an import path such as
+``"myapp.limits:RedisRateLimiter"`` to a ``RateLimitBackend`` subclass shared
+by all workers.
+
+The client IP is ``request.remote_addr``. Behind reverse proxies it is
+taken from ``X-Forwarded-For``, skipping ``TRUSTED_PROXY_COUNT`` entries. While
+``TRUSTED_PROXY_COUNT`` is unset, limits still apply to ``remote_addr`` and a
+warning is logged at startup: behind a proxy every visitor then shares the
+proxy's bucket, which closes the contact form for everyone after a handful of
+submissions rather than leaving it open to abuse.
+"""
+import logging
+import math
+import threading
+import time
+from functools import lru_cache, wraps
+
+from flask import current_app, jsonify, request
+from werkzeug.utils import import_string
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+@lru_cache(maxsize=32)
+def parse_limit(spec: str) -> tuple:
+    """``"5/minute"`` -> ``(capacity, refill per second)``. Raises ValueError."""
+    try:
+        count, period = spec.split("/")
+        capacity = int(count)
+        seconds = PERIODS[period.strip().rstrip("s")]
+    except (ValueError, KeyError):
+        raise ValueError(f"Invalid rate limit {spec!r}, expected e.g. '5/minute'")
+    if capacity < 1:
+        raise ValueError(f"Invalid rate limit {spec!r}, count must be positive")
+    return capacity, capacity / seconds
+
+
+class RateLimitBackend:
+    """Interface for bucket stores. ``consume`` must be atomic per key."""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self.allowed = 0
+        self.limited = 0
+
+    def consume(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Take one token. Returns 0 when allowed, else seconds until a token is available."""
+        raise NotImplementedError
+
+    def reset(self):
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {"backend": type(self).__name__, "allowed": self.allowed, "limited": self.limited}
+
+
+class NullRateLimiter(RateLimitBackend):
+    """Never limits."""
+
+    def consume(self, key, capacity, refill_rate):
+        self.allowed += 1
+        return 0.0
+
+    def reset(self):
+        pass
+
+
+class MemoryRateLimiter(RateLimitBackend):
+    """Buckets in a dict, local to this worker process."""
+
+    def __init__(self, max_keys: int = 10000):
+        super().__init__(max_keys)
+        self._buckets = {}  # key -> [tokens, last refill (monotonic), capacity, refill_rate]
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, refill_rate):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._prune(now)
+                bucket = self._buckets[key] = [float(capacity), now, capacity, refill_rate]
+            else:
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * refill_rate)
+                bucket[1] = now
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                self.allowed += 1
+                return 0.0
+            self.limited += 1
+            return (1 - bucket[0]) / refill_rate
+
+    def _prune(self, now: float):
+        """Drop buckets that have refilled completely; they carry no state."""
+        full = [key for key, (tokens, last, capacity, rate) in self._buckets.items()
+                if tokens + (now - last) * rate >= capacity]
+        for key in full:
+            del self._buckets[key]
+        # Still full of active clients: forget the oldest half rather than grow
+        if len(self._buckets) >= self.max_keys:
+            oldest = sorted(self._buckets, key=lambda k: self._buckets[k][1])
+            for key in oldest[: len(oldest) // 2]:
+                del self._buckets[key]
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+_BACKENDS = {"memory": MemoryRateLimiter, "null": NullRateLimiter}
+
+
+def init_rate_limit(app):
+    spec = app.config["RATE_LIMIT_BACKEND"]
+    if app.config["TRUSTED_PROXY_COUNT"] is None and spec != "null":
+        logger.warning("TRUSTED_PROXY_COUNT is not set, so rate limits key on the connecting "
+                       "address and all clients behind a proxy share one bucket. Set it to 0 "
+                       "when clients connect directly, 1 behind Render's proxy")
+    backend_cls = _BACKENDS.get(spec) or import_string(spec.replace(":", "."))
+    app.extensions["rate_limiter"] = backend_cls(max_keys=app.config["RATE_LIMIT_MAX_KEYS"])
+
+
+def get_rate_limiter() -> RateLimitBackend:
+    return current_app.extensions["rate_limiter"]
+
+
+def client_ip() -> str:
+    proxies = current_app.config["TRUSTED_PROXY_COUNT"]
+    if not proxies:
+        return request.remote_addr or "unknown"
+    # access_route is the X-Forwarded-For list; each trusted proxy appended one
+    # entry, so anything further left was written by the client and can be forged
+    route = request.access_route
+    return route[max(0, len(route) - proxies)] or "unknown"
+
+
+def rate_limit(name: str, config_key: str):
+    """Limit a view per client IP to the ``"<count>/<period>"`` in ``config[config_key]``."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            capacity, refill_rate = parse_limit(current_app.config[config_key])
+            retry_after = get_rate_limiter().consume(f"{name}|{client_ip()}", capacity, refill_rate)
+            if retry_after:
+                response = jsonify({"error": "Too many requests. Try again later."})
+                response.status_code = 429
+                response.headers["Retry-After"] = str(math.ceil(retry_after))
+                return response
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
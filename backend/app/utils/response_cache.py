@@ -0,0 +1,246 @@
+"""
+In-process cache for serialized public API responses.
+
+Entries hold the encoded JSON body together with its ETag, so a hit answers
+both full and conditional requests without touching SQLAlchemy. The admin
+blueprint invalidates the affected keys after every write; the TTL bounds
+staleness on other workers until a shared backend is configured.
+
+Backends are chosen with ``RESPONSE_CACHE_BACKEND``: ``"memory"`` (default),
+``"null"`` (disabled) or an import path such as ``"myapp.cache:RedisCache"``
+to a ``CacheBackend`` subclass.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from urllib.parse import quote, unquote
+
+from flask import current_app, g, request
+from werkzeug.utils import import_string
+
+from app.utils.http_cache import is_fresh, not_modified, with_validators
+
+PROJECTS_PREFIX = "projects|"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    last_modified: datetime = None
+    # Compressed copies of ``body`` by Content-Encoding, filled in by app.utils.compression
+    encoded: dict = field(default_factory=dict, compare=False)
+
+
+class CacheBackend:
+    """Interface for response cache stores. Subclasses must be thread-safe."""
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 60):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        raise NotImplementedError
+
+    def set(self, key: str, value, ttl: float = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def keys(self) -> list:
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.keys()),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.default_ttl,
+        }
+
+
+class NullCache(CacheBackend):
+    """Caches nothing — every lookup is a miss."""
+
+    def get(self, key):
+        self.misses += 1
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def keys(self):
+        return []
+
+    def clear(self):
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """Bounded LRU with per-entry expiry, local to this worker process."""
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 60):
+        super().__init__(max_entries, default_ttl)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] < time.monotonic():
+                del self._data[key]
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, value, ttl=None):
+        expires = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self):
+        with self._lock:
+            return list(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_BACKENDS = {"memory": MemoryCache, "null": NullCache}
+
+
+def init_response_cache(app):
+    spec = app.config["RESPONSE_CACHE_BACKEND"]
+    backend_cls = _BACKENDS.get(spec) or import_string(spec.replace(":", "."))
+    app.extensions["response_cache"] = backend_cls(
+        max_entries=app.config["RESPONSE_CACHE_MAX_ENTRIES"],
+        default_ttl=app.config["RESPONSE_CACHE_TTL"],
+    )
+
+
+def get_response_cache() -> CacheBackend:
+    return current_app.extensions["response_cache"]
+
+
+# ─── Keys ────────────────────────────────────────────────────────────────────
+
+def projects_key(category: str = None, q: str = None, featured: bool = None,
+                 fields: tuple = None, media: bool = True) -> str:
+    """List key: category filter, search string, featured filter, fieldset and paging arguments."""
+    return "|".join([
+        PROJECTS_PREFIX.rstrip("|"),
+        quote((category or "").lower(), safe=""),
+        quote(q or "", safe=""),
+        "" if featured is None else str(int(featured)),
+        ",".join(sorted(fields)) if fields else "",
+        "media" if media else "",
+        request.args.get("limit", ""),
+        request.args.get("cursor", ""),
+    ])
+
+
+def project_key(project_id: int) -> str:
+    return f"project|{project_id}"
+
+
+CATEGORIES_KEY = "categories"
+
+SETTINGS_PREFIX = "site-settings|"
+
+
+def settings_key(version: int) -> str:
+    """Keyed by settings version, so a write on another worker is a miss here."""
+    return f"{SETTINGS_PREFIX}{version}"
+
+
+# ─── Serving ─────────────────────────────────────────────────────────────────
+
+def cached_json(key: str, validate, build_payload):
+    """
+    Serve ``key`` from the cache, or on a miss run ``validate()`` (returning
+    ``(etag, last_modified)``), build the payload and store the encoded body.
+    """
+    cache = get_response_cache()
+    entry = cache.get(key)
+    status = "HIT"
+    if entry is None:
+        status = "MISS"
+        etag, last_modified = validate()
+        if is_fresh(etag, last_modified):
+            return not_modified(etag, last_modified)
+        body = current_app.json.response(build_payload()).get_data()
+        entry = CachedResponse(body, etag, last_modified)
+        cache.set(key, entry)
+
+    if is_fresh(entry.etag, entry.last_modified):
+        response = not_modified(entry.etag, entry.last_modified)
+    else:
+        response = with_validators(
+            current_app.response_class(entry.body, mimetype="application/json"),
+            entry.etag,
+            entry.last_modified,
+        )
+        g.response_cache_entry = entry  # lets compression reuse entry.encoded
+    response.headers["X-Cache"] = status
+    return response
+
+
+# ─── Invalidation (called by admin write paths) ──────────────────────────────
+
+def invalidate_project(project_id: int, *categories):
+    """
+    Drop a project's detail entry, the category facets and every list entry
+    it could appear in: unfiltered lists, searches, and lists filtered on
+    any of ``categories`` (old and new).
+    """
+    invalidate_projects([project_id], categories)
+
+
+def invalidate_projects(project_ids, categories):
+    """``invalidate_project`` for many projects at once (bulk admin writes)."""
+    cache = get_response_cache()
+    for project_id in project_ids:
+        cache.delete(project_key(project_id))
+    cache.delete(CATEGORIES_KEY)
+    names = {(c or "").lower() for c in categories}
+    for key in cache.keys():
+        if not key.startswith(PROJECTS_PREFIX):
+            continue
+        _, category, q = key.split("|")[:3]
+        if q or not category or unquote(category) in names:
+            cache.delete(key)
+
+
+def invalidate_settings():
+    cache = get_response_cache()
+    for key in cache.keys():
+        if key.startswith(SETTINGS_PREFIX):
+            cache.delete(key)
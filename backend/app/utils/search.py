@@ -0,0 +1,93 @@
+"""
+Indexed full-text search over project titles and descriptions.
+
+* PostgreSQL: a GIN index on ``to_tsvector('english', title || description)``,
+  queried with ``websearch_to_tsquery`` so any user input is valid syntax.
+* SQLite (local/dev): an external-content FTS5 table kept in sync by triggers.
+* Anything else falls back to ``ILIKE`` on both columns.
+
+The index objects are created alongside the ``projects`` table by
+``db.create_all()``; for an existing database run ``python create_search_index.py``.
+"""
+import re
+
+from sqlalchemy import event, or_, select, text
+
+from app.models.project import Project
+
+# Must match the indexed expression exactly for the planner to use the index
+PG_DOCUMENT = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+
+PG_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_projects_search ON projects USING gin ({PG_DOCUMENT})",
+]
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5("
+    "title, description, content='projects', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_ai AFTER INSERT ON projects BEGIN "
+    "INSERT INTO projects_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_ad AFTER DELETE ON projects BEGIN "
+    "INSERT INTO projects_fts(projects_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_au AFTER UPDATE ON projects BEGIN "
+    "INSERT INTO projects_fts(projects_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO projects_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')",
+]
+
+
+def create_search_index(connection):
+    """Create (or rebuild) the search index for the connection's dialect."""
+    dialect = connection.dialect.name
+    statements = {"postgresql": PG_DDL, "sqlite": SQLITE_DDL}.get(dialect, [])
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Alembic filter: keep autogenerate from dropping the search objects."""
+    if reflected and compare_to is None:
+        if type_ == "table" and name.startswith("projects_fts"):
+            return False
+        if type_ == "index" and name == "ix_projects_search":
+            return False
+    return True
+
+
+def _after_create(target, connection, **kw):
+    create_search_index(connection)
+
+
+def init_search():
+    if not event.contains(Project.__table__, "after_create", _after_create):
+        event.listen(Project.__table__, "after_create", _after_create)
+
+
+def _fts5_query(q: str) -> str:
+    # Quote every token so user input can never be parsed as FTS5 syntax;
+    # the trailing * makes the last word a prefix match for search-as-you-type.
+    tokens = re.findall(r"\w+", q)
+    if not tokens:
+        return '""'
+    quoted = [f'"{t}"' for t in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def apply_search(query, q: str, dialect: str):
+    """Restrict a ``Project`` query to rows matching the search string ``q``."""
+    if dialect == "postgresql":
+        return query.filter(
+            text(f"{PG_DOCUMENT} @@ websearch_to_tsquery('english', :q)").bindparams(q=q)
+        )
+    if dialect == "sqlite":
+        matches = select(text("rowid")).select_from(text("projects_fts")).where(
+            text("projects_fts MATCH :q").bindparams(q=_fts5_query(q))
+        )
+        return query.filter(Project.id.in_(matches))
+    pattern = f"%{q}%"
+    return query.filter(or_(Project.title.ilike(pattern), Project.description.ilike(pattern)))
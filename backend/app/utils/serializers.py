@@ -0,0 +1,232 @@
+"""
+One place that turns models into API dicts.
+
+A project is serialized through a *view*, the set of fields a caller gets:
+
+    list     public portfolio grid (/api/projects)
+    detail   public project page (/api/projects/<id>)
+    admin    every field, for the admin panel
+
+``project_serializer(view, fields)`` compiles a view (optionally narrowed to
+``fields``) into a plain function once per cloud name and caches it. Plain
+columns are read in one ``itemgetter`` call straight from the instance
+``__dict__``. Cloudinary URLs are built by concatenating onto precomputed
+prefixes instead of formatting per row:
+
+    serialize = project_serializer("list")
+    payload = [serialize(p) for p in projects]
+
+``project_columns(view, fields)`` names the columns a view reads, so the
+query can ``load_only()`` those and leave the rest (``description``, ...) in
+the database.
+
+Dicts are built in a fixed key order, so ``init_json(app)`` turns off key sorting,
+which took about a third of the stdlib encoder's time. It also installs orjson
+as Flask's JSON provider when it is installed (``JSON_ENCODER=auto``, the
+default). The stdlib provider is set to write UTF-8 rather than ASCII
+escapes, so both produce the same compact bodies; dates are left to
+Flask's own handling.
+"""
+from functools import lru_cache
+from operator import itemgetter
+
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+
+
+# ─── Fields ──────────────────────────────────────────────────────────────────
+
+# Output key -> model attribute, copied as-is
+PLAIN_FIELDS = {
+    "id": "id",
+    "title": "title",
+    "description": "description",
+    "category": "category",
+    "is_featured": "is_featured",
+    "cloudinary_video_id": "cloudinary_video_id",
+    "cloudinary_thumbnail_id": "cloudinary_thumbnail_id",
+}
+DATE_FIELDS = ("release_date", "created_at", "updated_at")
+# Output key -> (public_id attribute, URL template name)
+URL_FIELDS = {
+    "thumbnail_url": ("cloudinary_thumbnail_id", "thumbnail"),
+    "video_url": ("cloudinary_video_id", "video"),
+}
+MEDIA_FIELDS = ("id", "media_type", "cloudinary_id", "url", "order")
+
+PROJECT_VIEWS = {
+    "list": ("id", "title", "category", "release_date", "is_featured", "thumbnail_url", "media"),
+    "detail": (
+        "id", "title", "category", "release_date", "is_featured", "thumbnail_url", "media",
+        "description", "video_url", "cloudinary_video_id", "cloudinary_thumbnail_id", "created_at",
+    ),
+    "admin": (
+        "id", "title", "description", "category", "release_date", "is_featured",
+        "cloudinary_video_id", "cloudinary_thumbnail_id", "thumbnail_url", "video_url",
+        "media", "created_at", "updated_at",
+    ),
+}
+
+
+def url_templates(cloud_name: str) -> dict:
+    """``(prefix, suffix)`` per asset kind; a URL is ``prefix + public_id + suffix``."""
+    base = f"https://res.cloudinary.com/{cloud_name}"
+    return {
+        "thumbnail": (f"{base}/image/upload/w_400,h_300,c_fill/", ".jpg"),
+        "video": (f"{base}/video/upload/", ".mp4"),
+    }
+
+
+class _Attributes:
+    """Mapping view of an object through ``getattr`` (lets the ORM load expired columns)."""
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __getitem__(self, name):
+        return getattr(self.obj, name)
+
+
+def _getter(names):
+    """``itemgetter`` that always returns a tuple, even for one name."""
+    if len(names) == 1:
+        get = itemgetter(names[0])
+        return lambda row: (get(row),)
+    return itemgetter(*names)
+
+
+# ─── Projects ────────────────────────────────────────────────────────────────
+
+_get_media = itemgetter(*MEDIA_FIELDS)
+
+
+@lru_cache(maxsize=64)
+def _compile(cloud_name, fields: tuple):
+    plain_keys = tuple(f for f in fields if f in PLAIN_FIELDS)
+    get_plain = _getter([PLAIN_FIELDS[f] for f in plain_keys]) if plain_keys else None
+    dates = tuple(f for f in fields if f in DATE_FIELDS)
+    templates = url_templates(cloud_name)
+    urls = tuple((f, URL_FIELDS[f][0], *templates[URL_FIELDS[f][1]]) for f in fields if f in URL_FIELDS)
+    with_media = "media" in fields
+
+    def build(row, as_row) -> dict:
+        out = dict(zip(plain_keys, get_plain(row))) if get_plain else {}
+        for name in dates:
+            value = row[name]
+            out[name] = value.isoformat() if value else None
+        for name, column, prefix, suffix in urls:
+            public_id = row[column]
+            out[name] = prefix + public_id + suffix if public_id else None
+        if with_media:
+            out["media"] = [dict(zip(MEDIA_FIELDS, _get_media(as_row(m)))) for m in row["media"]]
+        return out
+
+    def serialize(p) -> dict:
+        # Loaded attributes sit in the instance __dict__; reading them there
+        # skips the ORM descriptors. Expired or unloaded ones go through getattr.
+        try:
+            return build(vars(p), vars)
+        except KeyError:
+            return build(_Attributes(p), _Attributes)
+
+    return serialize
+
+
+def project_serializer(view: str = "list", fields=None):
+    """
+    Function turning a ``Project`` into a dict for ``view``. ``fields`` keeps
+    only those keys of the view (``id`` is always kept); unknown names raise
+    ValueError.
+    """
+    available = PROJECT_VIEWS[view]
+    if fields:
+        unknown = set(fields) - set(available)
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+        selected = tuple(f for f in available if f == "id" or f in fields)
+    else:
+        selected = available
+    return _compile(current_app.config.get("CLOUDINARY_CLOUD_NAME", ""), selected)
+
+
+def project_columns(view: str = "list", fields=None) -> list:
+    """
+    ``Project`` attributes the serializer reads for ``view``/``fields``, for
+    ``load_only()``. ``media`` is a relationship and is loaded separately.
+    """
+    selected = fields or PROJECT_VIEWS[view]
+    columns = ["id"]
+    for name in selected:
+        if name in PLAIN_FIELDS:
+            columns.append(PLAIN_FIELDS[name])
+        elif name in DATE_FIELDS:
+            columns.append(name)
+        elif name in URL_FIELDS:
+            columns.append(URL_FIELDS[name][0])
+    return list(dict.fromkeys(columns))
+
+
+def serialize_projects(projects, view: str = "list", fields=None) -> list:
+    serialize = project_serializer(view, fields)
+    return [serialize(p) for p in projects]
+
+
+# ─── Inquiries ───────────────────────────────────────────────────────────────
+
+def inquiry_to_dict(i) -> dict:
+    return {
+        "id": i.id,
+        "name": i.name,
+        "email": i.email,
+        "message": i.message,
+        "budget": i.budget,
+        "status": i.status,
+        "created_at": i.created_at.isoformat() if i.created_at else None,
+    }
+
+
+# ─── JSON encoding ───────────────────────────────────────────────────────────
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson. Dates and datetimes still go through
+    Flask's ``default`` (HTTP dates), so responses match the stdlib provider.
+    Debug mode keeps the stdlib provider's indented output.
+    """
+
+    @property
+    def option(self) -> int:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        return option | orjson.OPT_SORT_KEYS if self.sort_keys else option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option), mimetype=self.mimetype
+        )
+
+
+def init_json(app):
+    encoder = app.config["JSON_ENCODER"]
+    if encoder == "orjson" and orjson is None:
+        raise RuntimeError("JSON_ENCODER=orjson but orjson is not installed")
+    if encoder != "stdlib" and orjson is not None:
+        app.json_provider_class = OrjsonProvider
+        app.json = OrjsonProvider(app)
+    app.json.sort_keys = False
+    app.json.ensure_ascii = False  # orjson never escapes non-ASCII
@@ -0,0 +1,140 @@
+"""
+Versioned, in-memory snapshot of the site settings.
+
+Reads are served from an immutable snapshot. Each worker re-checks the
+single-row version counter at most every ``SETTINGS_VERSION_TTL`` seconds and
+reloads the table only when another worker has bumped it. Writes are one
+bulk upsert plus a version bump in the same transaction.
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from flask import current_app
+from sqlalchemy import select, update
+
+from app import db
+from app.models.setting import SiteSetting, SiteSettingsVersion
+
+VERSION_ROW_ID = 1
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    version: int
+    values: MappingProxyType
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+class SettingsStore:
+    def __init__(self):
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def get(self, force_check: bool = False) -> SettingsSnapshot:
+        """Current snapshot, reloaded if the stored version has moved on."""
+        snapshot = self._snapshot
+        ttl = current_app.config["SETTINGS_VERSION_TTL"]
+        if snapshot is not None and not force_check and time.monotonic() - snapshot.checked_at < ttl:
+            return snapshot
+
+        with self._lock:
+            # Read the version before the rows: a concurrent write then only
+            # causes one extra reload, never stale rows under a newer version.
+            version = _read_version()
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = _load(version)
+            else:
+                snapshot = SettingsSnapshot(snapshot.version, snapshot.values)
+            self._snapshot = snapshot
+            return snapshot
+
+    def write(self, data: dict) -> SettingsSnapshot:
+        """Upsert ``data`` in one statement, bump the version and reload."""
+        with self._lock:
+            if data:
+                _bulk_upsert(data)
+            _bump_version()
+            db.session.commit()
+            self._snapshot = _load(_read_version())
+            return self._snapshot
+
+
+def _read_version() -> int:
+    return db.session.scalar(
+        select(SiteSettingsVersion.version).where(SiteSettingsVersion.id == VERSION_ROW_ID)
+    ) or 0
+
+
+def _load(version: int) -> SettingsSnapshot:
+    rows = db.session.execute(select(SiteSetting.key, SiteSetting.value)).all()
+    return SettingsSnapshot(version, MappingProxyType({k: v for k, v in rows}))
+
+
+def _bulk_upsert(data: dict):
+    rows = [{"key": k, "value": v} for k, v in data.items()]
+    insert = _upsert_insert()
+    if insert is not None:
+        stmt = insert(SiteSetting).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SiteSetting.key], set_={"value": stmt.excluded.value}
+        )
+        db.session.execute(stmt)
+        return
+
+    # Other backends: one lookup for all keys, then plain INSERT/UPDATE
+    existing = {
+        s.key: s for s in SiteSetting.query.filter(SiteSetting.key.in_(data)).all()
+    }
+    for key, value in data.items():
+        if key in existing:
+            existing[key].value = value
+        else:
+            db.session.add(SiteSetting(key=key, value=value))
+    db.session.flush()
+
+
+def _upsert_insert():
+    """The dialect's ``insert`` with ``on_conflict_do_update``, or None if it has none."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
+def _bump_version():
+    # An upsert, so two workers making the first write on a fresh database
+    # can't both try to INSERT the counter row
+    insert = _upsert_insert()
+    if insert is not None:
+        stmt = insert(SiteSettingsVersion).values(id=VERSION_ROW_ID, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SiteSettingsVersion.id],
+            set_={"version": SiteSettingsVersion.version + 1},
+        )
+        db.session.execute(stmt)
+        return
+
+    # Other backends: UPDATE, and INSERT the row the first time
+    result = db.session.execute(
+        update(SiteSettingsVersion)
+        .where(SiteSettingsVersion.id == VERSION_ROW_ID)
+        .values(version=SiteSettingsVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.session.add(SiteSettingsVersion(id=VERSION_ROW_ID, version=1))
+        db.session.flush()
+
+
+def init_settings_store(app):
+    app.extensions["settings_store"] = SettingsStore()
+
+
+def get_settings_store() -> SettingsStore:
+    return current_app.extensions["settings_store"]
@@ -0,0 +1,101 @@
+"""
+Signed direct-to-Cloudinary uploads.
+
+The admin UI asks for a short-lived signature, posts the file straight to
+the media store, then reports the store's response back. Flask only signs
+and verifies — the video bytes never pass through a worker.
+
+Point ``CLOUDINARY_UPLOAD_PREFIX`` at a local fake to exercise the flow
+without a real Cloudinary account.
+"""
+import time
+
+import cloudinary
+import cloudinary.api
+import cloudinary.exceptions
+import cloudinary.utils
+from flask import current_app
+
+from app.utils.cloudinary_helper import ALLOWED_IMAGE_EXT, ALLOWED_VIDEO_EXT, delete_resource
+from app.utils.metrics import external_call
+
+DEFAULT_FOLDERS = {"video": "videolozy/videos", "image": "videolozy/thumbnails"}
+
+
+def _rules(resource_type: str) -> tuple:
+    if resource_type == "video":
+        return ALLOWED_VIDEO_EXT, current_app.config["MAX_VIDEO_SIZE"]
+    if resource_type == "image":
+        return ALLOWED_IMAGE_EXT, current_app.config["MAX_IMAGE_SIZE"]
+    raise ValueError("resource_type must be 'image' or 'video'")
+
+
+def _check_folder(folder: str):
+    if not folder.startswith("videolozy/") or ".." in folder:
+        raise ValueError("folder must be inside videolozy/")
+
+
+def build_upload_signature(resource_type: str, folder: str = None) -> dict:
+    """Signed parameters for one browser-to-Cloudinary upload."""
+    formats, max_size = _rules(resource_type)
+    folder = folder or DEFAULT_FOLDERS[resource_type]
+    _check_folder(folder)
+
+    config = cloudinary.config()
+    timestamp = int(time.time())
+    params = {
+        "timestamp": timestamp,
+        "folder": folder,
+        "allowed_formats": ",".join(sorted(formats)),
+    }
+    signature = cloudinary.utils.api_sign_request(params, config.api_secret)
+    return {
+        "upload_url": cloudinary.utils.cloudinary_api_url("upload", resource_type=resource_type),
+        "api_key": config.api_key,
+        "cloud_name": config.cloud_name,
+        "resource_type": resource_type,
+        "params": params,
+        "signature": signature,
+        "max_file_size": max_size,
+        "expires_at": timestamp + current_app.config["SIGNED_UPLOAD_TTL"],
+    }
+
+
+def verify_upload(result: dict) -> dict:
+    """
+    Check a Cloudinary upload response reported by the browser. The response
+    signature proves it came from the store with our secret, but it only
+    covers ``public_id`` and ``version``. Format, size and URL are therefore
+    read from the stored asset through the Admin API, never from the
+    response. The asset must sit in our folder tree and match the allowed
+    formats and size limit. Returns ``{public_id, url}`` like
+    ``upload_video`` / ``upload_image``.
+    """
+    public_id = result.get("public_id")
+    version = result.get("version")
+    signature = result.get("signature")
+    resource_type = result.get("resource_type")
+    if not (public_id and version and signature):
+        raise ValueError("public_id, version and signature are required")
+    if not cloudinary.utils.verify_api_response_signature(public_id, version, signature):
+        raise ValueError("Upload signature does not match")
+
+    formats, max_size = _rules(resource_type)
+    _check_folder(public_id)
+    try:
+        with external_call("cloudinary", "resource"):
+            asset = cloudinary.api.resource(public_id, resource_type=resource_type, type="upload")
+    except cloudinary.exceptions.NotFound:
+        raise ValueError("Uploaded asset not found")
+
+    problem = None
+    if (asset.get("format") or "").lower() not in formats:
+        problem = f"Unsupported {resource_type} format: .{asset.get('format')}"
+    elif int(asset.get("bytes") or 0) > max_size:
+        problem = f"{resource_type.capitalize()} exceeds the {max_size // (1024 * 1024)} MB limit"
+    if problem:
+        # The asset is already stored — don't leave it behind
+        delete_resource(public_id, resource_type=resource_type)
+        raise ValueError(problem)
+
+    return {"public_id": public_id, "url": asset["secure_url"]}
@@ -0,0 +1,113 @@
+"""
+Serving the built SPAs (``frontend/dist`` and ``admin-frontend/dist``).
+
+Each dist directory is scanned once at startup into a ``StaticIndex``, so a
+request is a dict lookup, not filesystem probing. For every file the index
+keeps its size, mtime, MIME type, an ETag and any precompressed siblings
+written by ``compress_static.py`` (``app.js.br``, ``app.js.gz``):
+
+- The smallest variant the client accepts is sent, with ``Content-Encoding``
+  and ``Vary: Accept-Encoding``. Each encoding has its own ETag.
+- Vite's content-hashed bundles (``assets/index-B4x9kQ2a.js``) are cached
+  for a year as ``immutable``. Everything else, including the ``index.html``
+  fallback for client-side routes, must be revalidated (``no-cache``).
+- Range and conditional requests (``If-None-Match`` / ``If-Modified-Since``)
+  are handled by ``send_file``.
+
+Rebuilding a frontend therefore needs a restart to be picked up, which every
+deploy does anyway.
+"""
+import logging
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+
+from flask import abort, request, send_file
+
+logger = logging.getLogger(__name__)
+
+# Vite names bundled files <name>-<8+ char base64url hash>.<ext> under assets/
+HASHED_ASSET = re.compile(r"(^|/)assets/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+# Precompressed sibling suffix -> Content-Encoding
+ENCODINGS = ((".br", "br"), (".gz", "gzip"))
+
+
+@dataclass
+class StaticFile:
+    path: str
+    size: int
+    mtime: float
+    mimetype: str
+    etag: str
+    cache_control: str
+    variants: dict = field(default_factory=dict)  # encoding -> (path, size)
+
+
+class StaticIndex:
+    def __init__(self, root: str, fallback: str = "index.html"):
+        self.root = root
+        self.fallback = fallback
+        self.files = self._scan(root)
+        logger.info("Indexed static files", extra={"root": root, "files": len(self.files)})
+
+    @staticmethod
+    def _scan(root: str) -> dict:
+        files = {}
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                full = os.path.join(dirpath, filename)
+                rel = os.path.relpath(full, root).replace(os.sep, "/")
+                stem, ext = os.path.splitext(full)
+                if ext in dict(ENCODINGS) and os.path.exists(stem):
+                    continue  # a variant, attached to its original below
+                st = os.stat(full)
+                entry = StaticFile(
+                    path=full,
+                    size=st.st_size,
+                    mtime=st.st_mtime,
+                    mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+                    etag=f"{int(st.st_mtime)}-{st.st_size:x}",
+                    cache_control=IMMUTABLE if HASHED_ASSET.search(rel) else REVALIDATE,
+                )
+                for suffix, encoding in ENCODINGS:
+                    variant = full + suffix
+                    if os.path.isfile(variant):
+                        size = os.path.getsize(variant)
+                        if size < entry.size:
+                            entry.variants[encoding] = (variant, size)
+                files[rel] = entry
+        return files
+
+    def _choose(self, entry: StaticFile):
+        """``(encoding, path)`` of the smallest variant the client accepts."""
+        best = (None, entry.path, entry.size)
+        for encoding, (path, size) in entry.variants.items():
+            if request.accept_encodings[encoding] and size < best[2]:
+                best = (encoding, path, size)
+        return best[:2]
+
+    def serve(self, path: str):
+        """Serve ``path``, or the SPA fallback for paths that are not files."""
+        entry = self.files.get(path) if path else None
+        if entry is None:
+            entry = self.files.get(self.fallback)
+            if entry is None:
+                abort(404)
+
+        encoding, file_path = self._choose(entry)
+        response = send_file(
+            file_path,
+            mimetype=entry.mimetype,
+            etag=f"{entry.etag}-{encoding}" if encoding else entry.etag,
+            last_modified=entry.mtime,
+            conditional=True,
+        )
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        if entry.variants:
+            response.vary.add("Accept-Encoding")
+        response.headers["Cache-Control"] = entry.cache_control
+        return response
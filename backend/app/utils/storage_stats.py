@@ -0,0 +1,124 @@
+"""
+Storage usage for the admin dashboard, served from memory.
+
+The database size and the Cloudinary ``usage()`` call (slow and rate
+limited) barely move, so they are not probed per request. A background
+thread refreshes them every ``STORAGE_STATS_INTERVAL`` seconds, running both
+probes concurrently. Each value keeps the time it was measured. A failed
+probe keeps the last good value and reports the error, so the dashboard can
+show how stale the numbers are. ``snapshot(refresh=True)`` backs ``?refresh=1``.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import cloudinary.api
+from flask import current_app
+from sqlalchemy import text
+
+from app import db
+from app.utils.metrics import external_call
+
+logger = logging.getLogger(__name__)
+
+
+def _database_bytes() -> int:
+    if db.engine.dialect.name == "postgresql":
+        return db.session.execute(text("SELECT pg_database_size(current_database())")).scalar() or 0
+    if db.engine.dialect.name == "sqlite":
+        pages = db.session.execute(text("PRAGMA page_count")).scalar()
+        return pages * db.session.execute(text("PRAGMA page_size")).scalar()
+    raise NotImplementedError(f"No size probe for {db.engine.dialect.name}")
+
+
+def _cloudinary_bytes() -> int:
+    with external_call("cloudinary", "usage"):
+        usage = cloudinary.api.usage()
+    return usage.get("storage", {}).get("usage", 0)
+
+
+PROBES = {"database": _database_bytes, "cloudinary": _cloudinary_bytes}
+
+
+class StorageStats:
+    def __init__(self, app):
+        self.app = app
+        self.interval = app.config["STORAGE_STATS_INTERVAL"]
+        self.values = {}    # probe -> (bytes, measured_at epoch seconds)
+        self.errors = {}    # probe -> message from the last failed attempt
+        self._refresh_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._attempted = False
+
+    def _probe(self, name):
+        with self.app.app_context():
+            return PROBES[name]()
+
+    def refresh(self):
+        """Run every probe concurrently. Concurrent callers wait for the same refresh."""
+        if not self._refresh_lock.acquire(blocking=False):
+            with self._refresh_lock:  # someone else is refreshing; wait for it
+                return
+        try:
+            self._attempted = True
+            with ThreadPoolExecutor(max_workers=len(PROBES), thread_name_prefix="storage-probe") as pool:
+                futures = {name: pool.submit(self._probe, name) for name in PROBES}
+            for name, future in futures.items():
+                try:
+                    self.values[name] = (future.result(), time.time())
+                    self.errors.pop(name, None)
+                except Exception as e:
+                    self.errors[name] = str(e)
+                    logger.warning("Storage probe failed", extra={"probe": name, "error": str(e)})
+        finally:
+            self._refresh_lock.release()
+
+    def _loop(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Storage stats refresh crashed")
+
+    def _ensure_refresher(self):
+        # Started lazily so it runs in the serving process, not a pre-fork parent
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="storage-stats", daemon=True)
+                self._thread.start()
+
+    def snapshot(self, refresh: bool = False) -> dict:
+        self._ensure_refresher()
+        if refresh or not self._attempted:
+            self.refresh()
+
+        now = time.time()
+        measured = [at for _, at in self.values.values()]
+        oldest = min(measured) if measured else None
+        config = current_app.config
+        return {
+            "database_bytes": self.values.get("database", (0, None))[0],
+            "cloudinary_bytes": self.values.get("cloudinary", (0, None))[0],
+            "database_limit_bytes": config["DATABASE_LIMIT_BYTES"],
+            "cloudinary_limit_bytes": config["CLOUDINARY_LIMIT_BYTES"],
+            "checked_at": {
+                name: datetime.fromtimestamp(at, timezone.utc).isoformat(timespec="seconds")
+                for name, (_, at) in self.values.items()
+            },
+            "age_seconds": round(now - oldest) if oldest else None,
+            # Missed at least one scheduled refresh, or a probe is failing
+            "stale": bool(self.errors) or oldest is None or now - oldest > 2 * self.interval,
+            "errors": dict(self.errors),
+        }
+
+
+def init_storage_stats(app):
+    app.extensions["storage_stats"] = StorageStats(app)
+
+
+def get_storage_stats() -> StorageStats:
+    return current_app.extensions["storage_stats"]
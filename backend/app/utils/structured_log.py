@@ -0,0 +1,55 @@
+"""
+Logging setup. ``LOG_FORMAT=json`` writes one JSON object per line (for log
+shippers); the default ``text`` format stays readable in a terminal. Either
+way, fields passed with ``extra={...}`` are kept as separate fields:
+
+    logger.warning("Slow request", extra={"endpoint": "public.get_projects", "duration_ms": 812.4})
+"""
+import json
+import logging
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else came in through ``extra``
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _extras(record: logging.LogRecord) -> dict:
+    return {k: v for k, v in vars(record).items() if k not in _RESERVED and not k.startswith("_")}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **_extras(record),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        fields = _extras(record)
+        if fields:
+            line += " " + " ".join(f"{k}={v}" for k, v in fields.items())
+        return line
+
+
+def init_logging(app):
+    """Give the root logger one formatted handler (once per process)."""
+    root = logging.getLogger()
+    root.setLevel(app.config["LOG_LEVEL"])
+    if any(getattr(h, "_videolozy", False) for h in root.handlers):
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter() if app.config["LOG_FORMAT"] == "json" else TextFormatter())
+    handler._videolozy = True
+    root.addHandler(handler)
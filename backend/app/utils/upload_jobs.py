@@ -0,0 +1,330 @@
+"""
+Background upload jobs for ``/api/admin/upload?async=1``.
+
+The request only persists the spooled file and an ``UploadJob`` row, then
+returns a job id; a bounded thread pool (``UPLOAD_WORKERS`` threads, at most
+``UPLOAD_QUEUE_DEPTH`` waiting jobs) does the Cloudinary transfer and writes
+progress back to the row.
+
+Jobs survive a restart: the first request a worker serves requeues jobs
+left ``queued``, or ``running`` without a heartbeat for
+``UPLOAD_JOB_STALE_SECONDS``. Workers claim a job with a conditional UPDATE,
+so several processes recovering the same table never run a job twice.
+
+A project save can reference a pending job (``video_job_id``,
+``thumbnail_job_id``, or a media item with ``job_id``); the link is applied
+when the job finishes.
+"""
+import logging
+import os
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import and_, or_, update
+from werkzeug.datastructures import FileStorage
+
+from app import db
+from app.models.project import Project, ProjectMedia
+from app.models.upload_job import UploadJob
+from app.utils.cloudinary_helper import (
+    ALLOWED_IMAGE_EXT, ALLOWED_VIDEO_EXT, STREAM_CHUNK_SIZE, _extension, upload_image, upload_video,
+)
+from app.utils.response_cache import invalidate_project
+from app.utils.upload_spool import UploadSpool
+
+logger = logging.getLogger(__name__)
+
+ACTIVE = ("queued", "running")
+LINK_TARGETS = ("video", "thumbnail", "media")
+PROGRESS_INTERVAL = 1.0  # seconds between progress writes
+
+
+class UploadQueueFull(RuntimeError):
+    pass
+
+
+class UploadJobRunner:
+    def __init__(self, app):
+        self.app = app
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._recovered = False
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.app.config["UPLOAD_WORKERS"],
+                    thread_name_prefix="upload-job",
+                )
+            return self._executor
+
+    def reserve(self):
+        """Take a queue slot, or raise UploadQueueFull."""
+        limit = self.app.config["UPLOAD_WORKERS"] + self.app.config["UPLOAD_QUEUE_DEPTH"]
+        with self._lock:
+            if self._pending >= limit:
+                raise UploadQueueFull("Upload queue is full, try again shortly")
+            self._pending += 1
+
+    def release(self):
+        with self._lock:
+            self._pending -= 1
+
+    def submit(self, job_id: str, reserved: bool = False):
+        if not reserved:
+            with self._lock:
+                self._pending += 1
+        self._pool().submit(self._run, job_id)
+
+    def _run(self, job_id: str):
+        try:
+            with self.app.app_context():
+                run_job(job_id)
+        except Exception:
+            logger.exception("Upload job %s crashed", job_id)
+        finally:
+            self.release()
+
+    def recover_once(self):
+        if self._recovered:
+            return
+        self._recovered = True
+        self._pool().submit(self._recover)
+
+    def _recover(self):
+        with self.app.app_context():
+            try:
+                stale = datetime.utcnow() - timedelta(
+                    seconds=current_app.config["UPLOAD_JOB_STALE_SECONDS"]
+                )
+                db.session.execute(
+                    update(UploadJob)
+                    .where(UploadJob.status == "running", UploadJob.updated_at < stale)
+                    .values(status="queued")
+                )
+                db.session.commit()
+                job_ids = [
+                    row.id for row in
+                    db.session.query(UploadJob.id).filter_by(status="queued").order_by(UploadJob.created_at)
+                ]
+            except Exception:
+                logger.exception("Could not recover upload jobs")
+                return
+        for job_id in job_ids:
+            self.submit(job_id)
+        if job_ids:
+            logger.info("Requeued %d upload job(s)", len(job_ids))
+
+
+def init_upload_jobs(app):
+    runner = UploadJobRunner(app)
+    app.extensions["upload_jobs"] = runner
+
+    @app.before_request
+    def recover_upload_jobs():
+        runner.recover_once()
+
+
+def get_runner() -> UploadJobRunner:
+    return current_app.extensions["upload_jobs"]
+
+
+# ─── Request side ────────────────────────────────────────────────────────────
+
+def _job_dir() -> str:
+    path = current_app.config.get("UPLOAD_JOB_DIR") or os.path.join(
+        tempfile.gettempdir(), "videolozy-jobs"
+    )
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _persist(file_storage, dest: str) -> int:
+    """Keep the upload on disk past the request; hard-link Werkzeug's spool when possible."""
+    stream = file_storage.stream
+    if isinstance(stream, UploadSpool):
+        stream.flush()
+        try:
+            os.link(stream.name, dest)
+            return stream.size
+        except OSError:
+            pass  # different filesystem — fall through to a copy
+    file_storage.seek(0)
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(file_storage.stream, f, STREAM_CHUNK_SIZE)
+    return os.path.getsize(dest)
+
+
+def enqueue_upload(file_storage, resource_type: str, folder: str = None) -> UploadJob:
+    """Persist the file and queue it. Format is checked now, size by the upload itself."""
+    resource_type = "video" if resource_type == "video" else "image"
+    ext = _extension(file_storage.filename)
+    if ext not in (ALLOWED_VIDEO_EXT if resource_type == "video" else ALLOWED_IMAGE_EXT):
+        raise ValueError(f"Unsupported {resource_type} format: .{ext}")
+
+    runner = get_runner()
+    runner.reserve()
+    try:
+        job_id = secrets.token_hex(16)
+        path = os.path.join(_job_dir(), f"{job_id}.{ext}")
+        size = _persist(file_storage, path)
+        job = UploadJob(
+            id=job_id,
+            resource_type=resource_type,
+            folder=folder,
+            filename=file_storage.filename,
+            spool_path=path,
+            bytes_total=size,
+        )
+        db.session.add(job)
+        db.session.commit()
+    except Exception:
+        runner.release()
+        raise
+    runner.submit(job_id, reserved=True)
+    return job
+
+
+def job_to_dict(job: UploadJob) -> dict:
+    return {
+        "id": job.id,
+        "status": job.status,
+        "resource_type": job.resource_type,
+        "filename": job.filename,
+        "bytes_total": job.bytes_total,
+        "bytes_done": job.bytes_done,
+        "progress": round(100 * job.bytes_done / job.bytes_total) if job.bytes_total else 0,
+        "public_id": job.public_id,
+        "url": job.url,
+        "error": job.error,
+        "project_id": job.project_id,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+    }
+
+
+def link_job(job_id: str, project: Project, target: str, order: int = None,
+             media_type: str = None) -> str:
+    """
+    Attach a job's result to ``project``. Returns the public_id when the job
+    has already finished (and applies it), or None if it will be applied on
+    completion. Raises ValueError for unknown or failed jobs.
+    """
+    if target not in LINK_TARGETS:
+        raise ValueError(f"Invalid link target: {target}")
+    if db.session.get(UploadJob, job_id) is None:
+        raise ValueError(f"Unknown upload job: {job_id}")
+    db.session.flush()  # the project needs an id
+
+    # Only link while the job is still active; otherwise it already finished.
+    # A pending job carries one link — re-saving the same link is fine.
+    result = db.session.execute(
+        update(UploadJob)
+        .where(
+            UploadJob.id == job_id,
+            UploadJob.status.in_(ACTIVE),
+            or_(
+                UploadJob.link_target.is_(None),
+                and_(UploadJob.project_id == project.id, UploadJob.link_target == target),
+            ),
+        )
+        .values(project_id=project.id, link_target=target, link_order=order,
+                link_media_type=media_type)
+    )
+    if result.rowcount:
+        return None
+
+    job = db.session.get(UploadJob, job_id, populate_existing=True)
+    if job.status in ACTIVE:
+        raise ValueError(f"Upload job {job_id} is already linked elsewhere")
+    if job.status != "done":
+        raise ValueError(f"Upload job {job_id} failed: {job.error}")
+    _apply_link(project, job.public_id, job.url, target, order, media_type)
+    return job.public_id
+
+
+def _apply_link(project, public_id, url, target, order=None, media_type=None):
+    if target == "video":
+        project.cloudinary_video_id = public_id
+    elif target == "thumbnail":
+        project.cloudinary_thumbnail_id = public_id
+    else:
+        project.media.append(ProjectMedia(
+            media_type=media_type or "standard_video",
+            cloudinary_id=public_id,
+            url=url,
+            order=len(project.media) if order is None else order,
+        ))
+
+
+# ─── Worker side ─────────────────────────────────────────────────────────────
+
+def run_job(job_id: str):
+    claimed = db.session.execute(
+        update(UploadJob)
+        .where(UploadJob.id == job_id, UploadJob.status == "queued")
+        .values(status="running", updated_at=datetime.utcnow())
+    ).rowcount
+    db.session.commit()
+    if not claimed:
+        return  # another worker has it, or it already finished
+
+    job = db.session.get(UploadJob, job_id)
+    last_write = 0.0
+
+    def progress(sent, total):
+        nonlocal last_write
+        now = time.monotonic()
+        if now - last_write >= PROGRESS_INTERVAL or sent >= total:
+            last_write = now
+            job.bytes_done = sent  # also refreshes updated_at, the heartbeat
+            db.session.commit()
+
+    try:
+        file_storage = FileStorage(open(job.spool_path, "rb"), filename=job.filename)
+        kwargs = {"folder_name": job.folder} if job.folder else {}
+        if job.resource_type == "video":
+            result = upload_video(file_storage, progress=progress, **kwargs)
+        else:
+            with file_storage.stream:
+                result = upload_image(file_storage, **kwargs)
+    except Exception as e:
+        db.session.rollback()
+        job = db.session.get(UploadJob, job_id)
+        job.status = "failed"
+        job.error = str(e)
+        db.session.commit()
+        _remove(job.spool_path)
+        return
+
+    # Lock the row so a concurrent link_job either lands before this commit
+    # (and is applied here) or sees the job as finished and applies it itself.
+    job = db.session.get(UploadJob, job_id, with_for_update=True, populate_existing=True)
+    job.status = "done"
+    job.public_id = result["public_id"]
+    job.url = result["url"]
+    job.bytes_done = job.bytes_total
+    project = db.session.get(Project, job.project_id) if job.project_id else None
+    if project is not None:
+        _apply_link(project, job.public_id, job.url, job.link_target, job.link_order,
+                    job.link_media_type)
+        project.updated_at = datetime.utcnow()
+    db.session.commit()
+    if project is not None:
+        invalidate_project(project.id, project.category)
+    _remove(job.spool_path)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,56 @@
+"""
+Disk spooling for multipart file uploads.
+
+Werkzeug's default stream factory keeps small files in memory and puts large
+ones in an anonymous temp file. ``SpoolingRequest`` instead writes every file
+part straight into a named temp file, counting bytes as the parser writes its
+chunks, so:
+
+* the size limit is enforced while the body streams in (413 as soon as it is
+  exceeded, no seek-to-end afterwards), and
+* ``upload_video`` can hand that same file to Cloudinary instead of copying it.
+"""
+import os
+import tempfile
+
+from flask import Request, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+
+
+class UploadSpool:
+    """Named temp file that tracks how many bytes have been written to it."""
+
+    def __init__(self, max_size: int, suffix: str = "", dir: str = None):
+        self._file = tempfile.NamedTemporaryFile(prefix="upload-", suffix=suffix, dir=dir)
+        self.name = self._file.name
+        self.max_size = max_size
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise RequestEntityTooLarge("Uploaded file is too large.")
+        return self._file.write(data)
+
+    def __getattr__(self, attr):
+        return getattr(self._file, attr)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self):
+        return iter(self._file)
+
+
+class SpoolingRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        suffix = os.path.splitext(filename or "")[1][:16]
+        return UploadSpool(
+            max_size=current_app.config["MAX_VIDEO_SIZE"],
+            suffix=suffix,
+            dir=current_app.config.get("UPLOAD_TMP_DIR"),
+        )
@@ -0,0 +1,4 @@
+"""
+Performance benchmarks. Run from backend/ directory:
+  python -m benchmarks.endpoints --help
+"""
@@ -0,0 +1,108 @@
+"""
+Compression benchmarks — bytes on the wire and CPU cost of the JSON list
+endpoints with no compression, gzip and brotli, against a seeded dataset.
+
+For each endpoint and encoding it reports the response size, the ratio to the
+uncompressed size, the request latency and the CPU time per request. Public
+reads are measured uncached, where every request builds and compresses the
+body, and from the response cache, where the compressed body is reused.
+
+Run from backend/ directory:
+  python -m benchmarks.compression
+  python -m benchmarks.compression --projects 1000 -n 100
+"""
+import argparse
+import sys
+import time
+
+from benchmarks.harness import bench_app, environment, percentile, write_results
+
+ENCODINGS = ("identity", "gzip", "br")
+ENDPOINTS = [
+    ("GET /api/projects", "/api/projects", False),
+    ("GET /api/projects [cached]", "/api/projects", True),
+    ("GET /api/projects?limit=50 [cached]", "/api/projects?limit=50", True),
+    ("GET /api/projects/<id>", "/api/projects/1", False),
+    ("GET /api/admin/projects", "/api/admin/projects", False),
+    ("GET /api/admin/inquiries?limit=200", "/api/admin/inquiries?limit=200", False),
+]
+
+
+def measure(client, cache, path: str, headers: dict, cached: bool, iterations: int, warmup: int) -> dict:
+    def once():
+        if not cached:
+            cache.clear()
+        return client.get(path, headers=headers)
+
+    for _ in range(warmup):
+        once()
+    wall, cpu, size, encoding = [], [], 0, None
+    for _ in range(iterations):
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        response = once()
+        cpu.append(time.process_time() - start_cpu)
+        wall.append(time.perf_counter() - start_wall)
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} -> {response.status_code}")
+        size = len(response.data)
+        encoding = response.headers.get("Content-Encoding", "identity")
+    wall.sort()
+    return {
+        "bytes": size,
+        "encoding": encoding,
+        "p50_ms": round(percentile(wall, 50) * 1000, 3),
+        "p90_ms": round(percentile(wall, 90) * 1000, 3),
+        "cpu_ms": round(sum(cpu) / len(cpu) * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--media", type=int, default=10, help="media rows per project")
+    parser.add_argument("--inquiries", type=int, default=1000)
+    parser.add_argument("-n", "--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--output", default="compression-results.json")
+    args = parser.parse_args()
+
+    with bench_app(args.projects, args.media, args.inquiries) as (app, info):
+        from flask_jwt_extended import create_access_token
+        from app.utils.compression import ENCODINGS as AVAILABLE
+
+        if "br" not in AVAILABLE:
+            print("[warn] brotlicffi/brotli is not installed; br requests fall back", file=sys.stderr)
+        client = app.test_client()
+        with app.app_context():
+            auth = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+            cache = app.extensions["response_cache"]
+        results = {}
+        for name, path, cached in ENDPOINTS:
+            cache.clear()
+            for encoding in ENCODINGS:
+                headers = {"Accept-Encoding": encoding, **(auth if "/admin/" in path else {})}
+                results[f"{name} {encoding}"] = measure(
+                    client, cache, path, headers, cached, args.iterations, args.warmup)
+
+    meta = environment()
+    meta.update({
+        "dataset": {"projects": info["projects"], "media": info["media"], "inquiries": info["inquiries"]},
+        "iterations": args.iterations,
+        "min_size": app.config["COMPRESS_MIN_SIZE"],
+        "gzip_level": app.config["COMPRESS_GZIP_LEVEL"],
+        "brotli_quality": app.config["COMPRESS_BROTLI_QUALITY"],
+    })
+    write_results(args.output, meta, results)
+
+    print(f"{'benchmark':48} {'sent as':>8} {'bytes':>10} {'ratio':>6} {'p50':>8} {'p90':>8} {'cpu':>8}")
+    for name, path, cached in ENDPOINTS:
+        plain = results[f"{name} identity"]["bytes"]
+        for encoding in ENCODINGS:
+            r = results[f"{name} {encoding}"]
+            print(f"{f'{name} {encoding}'[:48]:48} {r['encoding']:>8} {r['bytes']:>10} "
+                  f"{r['bytes'] / plain if plain else 1:6.2f} {r['p50_ms']:8.2f} {r['p90_ms']:8.2f} {r['cpu_ms']:8.2f}")
+    print(f"[bench] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Endpoint benchmarks — drives every public_bp and admin_bp route through the
+test client against a seeded SQLite database with Cloudinary faked out, and
+records latency percentiles, throughput and SQL query counts per route.
+
+Run from backend/ directory:
+  python -m benchmarks.endpoints --output benchmarks/baseline.json
+  python -m benchmarks.endpoints --baseline benchmarks/baseline.json
+
+Exit code is 1 when --baseline is given and a benchmark regressed.
+"""
+import argparse
+import io
+import re
+import sys
+import time
+
+from benchmarks.harness import (
+    FAKE_CLOUDINARY, FakeCloudinary, bench_app, compare, environment, print_table,
+    summarize, write_results,
+)
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\0" * (100 * 1024)
+VIDEO_BYTES = b"\0" * (2 * 1024 * 1024)
+CHUNK = 1024 * 1024  # smallest chunk size a resumable session accepts
+
+
+class Scenario:
+    """
+    One benchmarked request. ``setup(bench, i)`` runs untimed before each
+    iteration and may return ``path``, ``json`` or ``data`` overrides.
+    """
+
+    def __init__(self, name, endpoint, method, path, json=None, data=None,
+                 setup=None, expect=(200,)):
+        self.name = name
+        self.endpoint = endpoint
+        self.method = method
+        self.path = path
+        self.json = json
+        self.data = data
+        self.setup = setup
+        self.expect = expect
+
+
+class Bench:
+    def __init__(self, app, info, fake):
+        from app import db
+        self.app = app
+        self.db = db
+        self.info = info
+        self.fake = fake
+        self.client = app.test_client()
+        token = self.client.post("/api/admin/login", json=info["admin"]).json["access_token"]
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.pid = info["first_project_id"] + 7
+
+    def clear_cache(self, *_):
+        self.app.extensions["response_cache"].clear()
+
+    # ── Untimed fixtures ──
+
+    def new_project(self, *_):
+        from app.models.project import Project, ProjectMedia
+        with self.app.app_context():
+            project = Project(title="Bench throwaway", category="Reel",
+                              cloudinary_video_id="videolozy/videos/x",
+                              cloudinary_thumbnail_id="videolozy/thumbnails/x")
+            project.media = [ProjectMedia(cloudinary_id=f"videolozy/media/x{i}", url="u", order=i)
+                             for i in range(5)]
+            self.db.session.add(project)
+            self.db.session.commit()
+            return project.id
+
+    def new_inquiry(self, *_):
+        from app.models.inquiry import Inquiry
+        with self.app.app_context():
+            inquiry = Inquiry(name="Bench", email="bench@example.com", message="Throwaway")
+            self.db.session.add(inquiry)
+            self.db.session.commit()
+            return inquiry.id
+
+    def media_ids(self, project_id):
+        from app.models.project import ProjectMedia
+        with self.app.app_context():
+            return [m.id for m in ProjectMedia.query.filter_by(project_id=project_id)
+                    .order_by(ProjectMedia.order)]
+
+    def upload_session(self, chunks_written=0, size=3 * CHUNK):
+        from app.utils import chunked_upload
+        with self.app.test_request_context():
+            session = chunked_upload.create_session("bench.mp4", size, chunk_size=CHUNK)
+            for index in range(chunks_written):
+                chunked_upload.write_chunk(session["session_id"], index, io.BytesIO(b"\0" * CHUNK))
+            return session["session_id"]
+
+    def upload_job(self):
+        from app.models.upload_job import UploadJob
+        with self.app.app_context():
+            job = UploadJob(id="b" * 32, status="done", resource_type="video", filename="b.mp4",
+                            spool_path="/nonexistent", bytes_total=10, bytes_done=10,
+                            public_id="videolozy/videos/b", url="https://x/b.mp4")
+            self.db.session.merge(job)
+            self.db.session.commit()
+            return job.id
+
+    def signed_result(self):
+        import cloudinary.utils
+        public_id = "videolozy/thumbnails/direct"
+        signature = cloudinary.utils.api_sign_request(
+            {"public_id": public_id, "version": 1}, FAKE_CLOUDINARY["CLOUDINARY_API_SECRET"]
+        )
+        return {"public_id": public_id, "version": 1, "signature": signature, "resource_type": "image",
+                "format": "png", "bytes": 1000, "secure_url": "https://x/direct.png"}
+
+
+def scenarios(bench: Bench) -> list:
+    pid = bench.pid
+    first = bench.info["first_project_id"]
+    page_cursor = bench.client.get("/api/projects?limit=20").json["next_cursor"]
+    inquiry_ids = iter(range(1, 10 ** 9))
+    job_id = bench.upload_job()
+    signed = bench.signed_result()
+
+    def image_form(*_):
+        return {"data": {"resource_type": "image", "file": (io.BytesIO(PNG_BYTES), "bench.png")}}
+
+    def video_form(*_):
+        return {"data": {"resource_type": "video", "file": (io.BytesIO(VIDEO_BYTES), "bench.mp4")}}
+
+    public = [
+        ("projects", "/api/projects"),
+        ("projects page", "/api/projects?limit=20"),
+        ("projects page 2", f"/api/projects?limit=20&cursor={page_cursor}"),
+        ("projects category", "/api/projects?category=music%20video&limit=20"),
+        ("projects search", "/api/projects?q=drone%20festival&limit=20"),
+        ("projects cards", "/api/projects?fields=title,category,release_date,is_featured,thumbnail_url"),
+        ("projects featured", "/api/projects?featured=1&fields=title,thumbnail_url"),
+    ]
+    result = []
+    for name, path in public:
+        result.append(Scenario(f"GET {name}", "public.get_projects", "GET", path, setup=Bench.clear_cache))
+        result.append(Scenario(f"GET {name} [cached]", "public.get_projects", "GET", path))
+    result += [
+        Scenario("GET project", "public.get_project", "GET", f"/api/projects/{pid}", setup=Bench.clear_cache),
+        Scenario("GET project [cached]", "public.get_project", "GET", f"/api/projects/{pid}"),
+        Scenario("GET categories", "public.get_categories", "GET", "/api/categories", setup=Bench.clear_cache),
+        Scenario("GET site-settings", "public.get_site_settings", "GET", "/api/site-settings",
+                 setup=Bench.clear_cache),
+        Scenario("POST contact", "public.submit_contact", "POST", "/api/contact",
+                 json={"name": "Bench", "email": "bench@example.com", "message": "Hello"},
+                 expect=(200, 201)),
+        Scenario("POST check-admin-email", "public.check_admin_email", "POST",
+                 "/api/check-admin-email", json={"email": "nobody@example.com"}),
+
+        Scenario("POST admin login", "admin.login", "POST", "/api/admin/login",
+                 json=bench.info["admin"]),
+        Scenario("GET admin verify_token", "admin.verify_token", "GET", "/api/admin/verify_token"),
+        Scenario("GET admin dashboard", "admin.dashboard", "GET", "/api/admin/dashboard"),
+        Scenario("GET admin stats/storage", "admin.storage_stats", "GET", "/api/admin/stats/storage"),
+        Scenario("GET admin stats/storage refresh", "admin.storage_stats", "GET",
+                 "/api/admin/stats/storage?refresh=1"),
+        Scenario("GET admin stats/cache", "admin.cache_stats", "GET", "/api/admin/stats/cache"),
+        Scenario("GET admin metrics", "admin.metrics", "GET", "/api/admin/metrics"),
+
+        Scenario("GET admin projects", "admin.list_projects", "GET", "/api/admin/projects"),
+        Scenario("GET admin projects page", "admin.list_projects", "GET", "/api/admin/projects?limit=50"),
+        Scenario("GET admin project", "admin.get_project", "GET", f"/api/admin/projects/{pid}"),
+        Scenario("POST admin project", "admin.create_project", "POST", "/api/admin/projects",
+                 json={"title": "Bench", "category": "Reel", "media": [
+                     {"cloudinary_id": f"videolozy/media/new{i}", "url": "u"} for i in range(5)
+                 ]}, expect=(201,)),
+        Scenario("PUT admin project", "admin.update_project", "PUT", f"/api/admin/projects/{pid}",
+                 json={"title": "Renamed", "category": "Reel"}),
+        Scenario("PUT admin project media reorder", "admin.update_project", "PUT", "",
+                 setup=lambda b, i: {"path": f"/api/admin/projects/{first + 3}", "json": {"media": [
+                     {"id": m} for m in reversed(b.media_ids(first + 3))]}}),
+        Scenario("PUT admin media/order", "admin.reorder_project_media", "PUT", "",
+                 setup=lambda b, i: {"path": f"/api/admin/projects/{first + 4}/media/order",
+                                     "json": {"order": b.media_ids(first + 4)[::-1]}}),
+        Scenario("DELETE admin project", "admin.delete_project", "DELETE", "",
+                 setup=lambda b, i: {"path": f"/api/admin/projects/{b.new_project()}"}),
+        Scenario("POST admin projects/bulk", "admin.bulk_update_projects", "POST",
+                 "/api/admin/projects/bulk",
+                 setup=lambda b, i: {"json": {"ids": list(range(first, first + 50)),
+                                              "set": {"is_featured": bool(i % 2)}}}),
+        Scenario("GET admin projects/export", "admin.export_projects", "GET", "/api/admin/projects/export"),
+
+        Scenario("GET admin inquiries", "admin.list_inquiries", "GET", "/api/admin/inquiries"),
+        Scenario("GET admin inquiries page", "admin.list_inquiries", "GET", "/api/admin/inquiries?limit=50"),
+        Scenario("PATCH admin inquiry", "admin.update_inquiry", "PATCH", "",
+                 setup=lambda b, i: {"path": f"/api/admin/inquiries/{next(inquiry_ids)}",
+                                     "json": {"status": "read"}}),
+        Scenario("DELETE admin inquiry", "admin.delete_inquiry", "DELETE", "",
+                 setup=lambda b, i: {"path": f"/api/admin/inquiries/{b.new_inquiry()}"}),
+        Scenario("POST admin inquiries/bulk", "admin.bulk_inquiries", "POST", "/api/admin/inquiries/bulk",
+                 json={"action": "status", "status": "read", "filter": {"status": "unread", "older_than_days": 400}}),
+        Scenario("GET admin inquiries/export", "admin.export_inquiries", "GET", "/api/admin/inquiries/export"),
+
+        Scenario("GET admin settings", "admin.get_settings", "GET", "/api/admin/settings"),
+        Scenario("PUT admin settings", "admin.update_settings", "PUT", "/api/admin/settings",
+                 setup=lambda b, i: {"json": {"setting_1": f"value {i}"}}),
+
+        Scenario("POST admin upload image", "admin.upload_file", "POST", "/api/admin/upload",
+                 setup=image_form),
+        Scenario("POST admin upload video", "admin.upload_file", "POST", "/api/admin/upload",
+                 setup=video_form),
+        Scenario("POST admin upload video async", "admin.upload_file", "POST",
+                 "/api/admin/upload?async=1", setup=video_form, expect=(202,)),
+        Scenario("GET admin upload job", "admin.get_upload_job", "GET", f"/api/admin/upload/jobs/{job_id}"),
+        Scenario("POST admin upload/signature", "admin.upload_signature", "POST",
+                 "/api/admin/upload/signature", json={"resource_type": "video"}),
+        Scenario("POST admin upload/complete", "admin.upload_complete", "POST",
+                 "/api/admin/upload/complete", json=signed),
+        Scenario("POST admin upload session", "admin.create_upload_session", "POST",
+                 "/api/admin/upload/sessions", json={"filename": "bench.mp4", "size": 3 * CHUNK},
+                 expect=(201,)),
+        Scenario("GET admin upload session", "admin.get_upload_session", "GET", "",
+                 setup=lambda b, i: {"path": f"/api/admin/upload/sessions/{b.upload_session(2)}"}),
+        Scenario("PUT admin upload chunk", "admin.put_upload_chunk", "PUT", "",
+                 setup=lambda b, i: {"path": f"/api/admin/upload/sessions/{b.upload_session()}/chunks/1",
+                                     "data": b"\0" * CHUNK}),
+        Scenario("POST admin upload session complete", "admin.complete_upload_session", "POST", "",
+                 setup=lambda b, i: {"path": f"/api/admin/upload/sessions/{b.upload_session(3)}/complete"}),
+        Scenario("DELETE admin upload session", "admin.delete_upload_session", "DELETE", "",
+                 setup=lambda b, i: {"path": f"/api/admin/upload/sessions/{b.upload_session(1)}"},
+                 expect=(200, 204)),
+    ]
+    return result
+
+
+def run(bench: Bench, scenario: Scenario, iterations: int, warmup: int) -> dict:
+    from app.utils.query_budget import count_queries
+
+    durations, queries, errors = [], [], 0
+    for i in range(warmup + iterations):
+        request = {"path": scenario.path, "json": scenario.json, "data": scenario.data}
+        if scenario.setup:
+            request.update(scenario.setup(bench, i) or {})
+        # A distinct client IP per request keeps the per-IP rate limits out of the timings
+        kwargs = {"headers": bench.headers, "environ_base": {"REMOTE_ADDR": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"}}
+        if request["json"] is not None:
+            kwargs["json"] = request["json"]
+        if request["data"] is not None:
+            kwargs["data"] = request["data"]
+
+        with count_queries() as counter:
+            start = time.perf_counter()
+            response = bench.client.open(request["path"], method=scenario.method, buffered=True, **kwargs)
+            elapsed = time.perf_counter() - start
+        if i < warmup:
+            continue
+        durations.append(elapsed)
+        queries.append(counter.count)
+        if response.status_code not in scenario.expect:
+            errors += 1
+            if errors == 1:
+                print(f"[warn] {scenario.name} -> {response.status_code} "
+                      f"{response.get_data(as_text=True)[:200]}", file=sys.stderr)
+
+    summary = summarize(durations, queries, errors)
+    summary["endpoint"] = scenario.endpoint
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--media", type=int, default=10, help="media rows per project")
+    parser.add_argument("--inquiries", type=int, default=5000)
+    parser.add_argument("-n", "--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", help="regex; run matching benchmark names only")
+    parser.add_argument("--cloudinary-latency", type=float, default=0.0,
+                        help="seconds added to every fake Cloudinary call")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed p50 slowdown as a fraction (default 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="ignore p50 changes smaller than this")
+    args = parser.parse_args()
+
+    with bench_app(args.projects, args.media, args.inquiries) as (app, info), \
+            FakeCloudinary(args.cloudinary_latency) as fake:
+        bench = Bench(app, info, fake)
+        selected = scenarios(bench)
+
+        routes = {r.endpoint for r in app.url_map.iter_rules()
+                  if r.endpoint.split(".")[0] in ("public", "admin")}
+        uncovered = sorted(routes - {s.endpoint for s in selected})
+        if uncovered:
+            print(f"[warn] Routes without a benchmark: {', '.join(uncovered)}", file=sys.stderr)
+
+        if args.only:
+            selected = [s for s in selected if re.search(args.only, s.name)]
+        results = {}
+        for scenario in selected:
+            results[scenario.name] = run(bench, scenario, args.iterations, args.warmup)
+        # Flush deferred deletes while Cloudinary is still faked (atexit would be too late)
+        app.extensions["media_cleanup"].close()
+
+    meta = environment()
+    meta.update({
+        "dataset": {"projects": info["projects"], "media": info["media"], "inquiries": info["inquiries"]},
+        "iterations": args.iterations,
+        "cloudinary_latency": args.cloudinary_latency,
+        "uncovered_routes": uncovered,
+    })
+    write_results(args.output, meta, results)
+    print_table(results)
+    print(f"[bench] Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance, args.min_delta_ms)
+        for message in regressions:
+            print(f"[REGRESSION] {message}")
+        if regressions:
+            sys.exit(1)
+        print("[ok] No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Shared benchmark plumbing: a seeded scratch app, a fake Cloudinary,
+timing/percentile helpers and baseline comparison.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+FAKE_CLOUDINARY = {
+    "CLOUDINARY_CLOUD_NAME": "bench",
+    "CLOUDINARY_API_KEY": "123456789012345",
+    "CLOUDINARY_API_SECRET": "bench-secret",
+}
+
+
+@contextmanager
+def bench_app(projects: int, media: int, inquiries: int, env: dict = None):
+    """
+    Yield ``(app, dataset_info)`` for a production-config app on a throwaway
+    SQLite file seeded with ``seed_dataset``. ``env`` overrides config
+    variables; it must be applied before the app config is first imported.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ.update(FAKE_CLOUDINARY)
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        os.environ["UPLOAD_TMP_DIR"] = tmpdir
+        os.environ["UPLOAD_SESSION_DIR"] = os.path.join(tmpdir, "sessions")
+        os.environ["UPLOAD_JOB_DIR"] = os.path.join(tmpdir, "jobs")
+        os.environ.update(env or {})
+
+        from app import create_app, db
+        from app.utils.dataset import seed_dataset
+
+        app = create_app("production")
+        with app.app_context():
+            db.create_all()
+            info = seed_dataset(projects, media, inquiries)
+            with db.engine.begin() as conn:
+                conn.exec_driver_sql("ANALYZE")
+        yield app, info
+        with app.app_context():
+            db.engine.dispose()
+
+
+class FakeCloudinary:
+    """
+    Patch the uploader and admin API functions the app calls. Uploads read
+    the whole file (the I/O is part of what is measured) and every call can
+    be given an artificial ``latency`` in seconds.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = {}
+        self._saved = []
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _result(self, folder, resource_type, size):
+        public_id = f"{folder or 'videolozy/bench'}/bench{sum(self.calls.values())}"
+        return {
+            "public_id": public_id,
+            "version": 1,
+            "resource_type": resource_type,
+            "bytes": size,
+            "secure_url": f"https://res.cloudinary.com/bench/{resource_type}/upload/{public_id}",
+        }
+
+    def upload(self, file, resource_type="image", folder=None, **kwargs):
+        self._count("upload")
+        size = 0
+        while True:
+            chunk = file.read(1024 * 1024)
+            if not chunk:
+                break
+            size += len(chunk)
+        return self._result(folder, resource_type, size)
+
+    def upload_large(self, file, resource_type="video", folder=None, **kwargs):
+        self._count("upload_large")
+        if isinstance(file, str):
+            with open(file, "rb") as f:
+                return self.upload(f, resource_type, folder)
+        return self.upload(file, resource_type, folder)
+
+    def destroy(self, public_id, **kwargs):
+        self._count("destroy")
+        return {"result": "ok"}
+
+    def delete_resources(self, public_ids, **kwargs):
+        self._count("delete_resources")
+        return {"deleted": {pid: "deleted" for pid in public_ids}}
+
+    def resources(self, **kwargs):
+        self._count("resources")
+        return {"resources": []}
+
+    def resource(self, public_id, resource_type="image", **kwargs):
+        self._count("resource")
+        return {
+            "public_id": public_id,
+            "resource_type": resource_type,
+            "format": "png" if resource_type == "image" else "mp4",
+            "bytes": 1000,
+            "secure_url": f"https://res.cloudinary.com/bench/{resource_type}/upload/{public_id}",
+        }
+
+    def usage(self, **kwargs):
+        self._count("usage")
+        return {"storage": {"usage": 123456789}}
+
+    def __enter__(self):
+        import cloudinary.api
+        import cloudinary.uploader
+        patches = [
+            (cloudinary.uploader, "upload"), (cloudinary.uploader, "upload_large"),
+            (cloudinary.uploader, "destroy"), (cloudinary.api, "delete_resources"),
+            (cloudinary.api, "resources"), (cloudinary.api, "resource"), (cloudinary.api, "usage"),
+        ]
+        for module, name in patches:
+            self._saved.append((module, name, getattr(module, name)))
+            setattr(module, name, getattr(self, name))
+        return self
+
+    def __exit__(self, *exc):
+        for module, name, original in self._saved:
+            setattr(module, name, original)
+        self._saved.clear()
+
+
+# ─── Statistics ──────────────────────────────────────────────────────────────
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(durations: list, queries: list = None, errors: int = 0) -> dict:
+    """Latency percentiles (ms), throughput and median query count."""
+    ordered = sorted(durations)
+    total = sum(ordered)
+    summary = {
+        "n": len(ordered),
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p90_ms": round(percentile(ordered, 90) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "mean_ms": round(total / len(ordered) * 1000, 3) if ordered else 0.0,
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        "rps": round(len(ordered) / total, 1) if total else 0.0,
+        "errors": errors,
+    }
+    if queries is not None:
+        summary["queries"] = sorted(queries)[len(queries) // 2] if queries else 0
+    return summary
+
+
+# ─── Results files ───────────────────────────────────────────────────────────
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import sqlalchemy
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def write_results(path: str, meta: dict, results: dict):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results: dict, baseline_path: str, tolerance: float, min_delta_ms: float) -> list:
+    """
+    Compare against a stored results file. A benchmark regresses when its
+    query count grows, or its p50 is more than ``tolerance`` (fraction) and
+    ``min_delta_ms`` slower than the baseline. Returns regression messages.
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if "queries" in current and "queries" in base and current["queries"] > base["queries"]:
+            regressions.append(f"{name}: {base['queries']} -> {current['queries']} queries")
+        delta = current["p50_ms"] - base["p50_ms"]
+        if delta > min_delta_ms and current["p50_ms"] > base["p50_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p50 {base['p50_ms']:.2f} -> {current['p50_ms']:.2f} ms "
+                f"(+{delta / base['p50_ms'] * 100 if base['p50_ms'] else 100:.0f}%)"
+            )
+    missing = sorted(set(baseline) - set(results))
+    if missing:
+        print(f"[warn] In baseline but not run: {', '.join(missing)}", file=sys.stderr)
+    return regressions
+
+
+def print_table(results: dict):
+    print(f"{'benchmark':48} {'p50':>8} {'p90':>8} {'p99':>8} {'rps':>8} {'sql':>4} {'err':>4}")
+    for name, r in results.items():
+        print(f"{name[:48]:48} {r['p50_ms']:8.2f} {r['p90_ms']:8.2f} {r['p99_ms']:8.2f} "
+              f"{r['rps']:8.1f} {r.get('queries', ''):>4} {r['errors']:>4}")
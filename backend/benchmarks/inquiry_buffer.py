@@ -0,0 +1,131 @@
+"""
+Contact intake benchmark — synchronous inserts vs the write-behind buffer
+during a burst of /api/contact submissions.
+
+Every SQL statement and commit is delayed by ``--db-latency`` ms to stand in
+for the round trip to a remote database. ``--requests`` inquiries are
+submitted through a pool of ``--workers`` threads, each from its own IP so
+the rate limit stays out of it. For each mode it reports request latency, how long
+until every row was in the database, and how many INSERT statements and
+commits that took. SQLite lets one writer in at a time, so synchronous tail
+latency (and the odd "database is locked" error) is worse here than on
+Postgres; compare p50 and the statement counts.
+
+Run from backend/ directory:
+  python -m benchmarks.inquiry_buffer
+  python -m benchmarks.inquiry_buffer --requests 2000 --db-latency 20
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import bench_app, environment, summarize, write_results
+
+MODES = ("sync", "buffered")
+
+
+def add_db_latency(engine, latency: float, counts: dict):
+    """Sleep ``latency`` seconds before every statement and commit, and count them."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO INQUIRIES"):
+            counts["inserts"] += 1
+        time.sleep(latency)
+
+    @event.listens_for(engine, "commit")
+    def commit(conn):
+        counts["commits"] += 1
+        time.sleep(latency)
+
+
+def run_mode(app, mode: str, counts: dict, args) -> dict:
+    from app.models.inquiry import Inquiry
+    from app.utils.inquiry_buffer import InquiryBuffer
+
+    inquiry_buffer = None
+    app.extensions.pop("inquiry_buffer", None)
+    if mode == "buffered":
+        inquiry_buffer = app.extensions["inquiry_buffer"] = InquiryBuffer(app)
+    with app.app_context():
+        before = Inquiry.query.count()
+    counts.update(inserts=0, commits=0)
+
+    local = threading.local()
+    lock = threading.Lock()
+    durations, errors = [], [0]
+
+    def submit(i: int):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        start = time.perf_counter()
+        ip = f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"
+        response = client.post("/api/contact", environ_base={"REMOTE_ADDR": ip},
+                               json={"name": f"Campaign {i}", "email": f"lead{i}@example.com",
+                                     "message": "Saw the reel, let's talk.", "budget": "5k"})
+        elapsed = time.perf_counter() - start
+        with lock:
+            durations.append(elapsed)
+            errors[0] += response.status_code not in (201, 202)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(submit, range(args.requests)))
+    answered = time.perf_counter() - started
+    if inquiry_buffer is not None:
+        inquiry_buffer.close()
+    durable = time.perf_counter() - started
+
+    with app.app_context():
+        written = Inquiry.query.count() - before
+    summary = summarize(durations, errors=errors[0])
+    summary["rps"] = round(args.requests / answered, 1)
+    summary.update({
+        "answered_s": round(answered, 3),
+        "durable_s": round(durable, 3),
+        "written": written,
+        "inserts": counts["inserts"],
+        "commits": counts["commits"],
+    })
+    if inquiry_buffer is not None:
+        summary["buffer"] = inquiry_buffer.stats()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8, help="simulated WSGI worker threads")
+    parser.add_argument("--db-latency", type=float, default=10.0, help="ms added per SQL statement and commit")
+    parser.add_argument("--output", default="inquiry-buffer-results.json")
+    args = parser.parse_args()
+
+    env = {"RATE_LIMIT_BACKEND": "null"}
+    with bench_app(0, 0, 0, env) as (app, info):
+        from app import db
+
+        counts = {}
+        with app.app_context():
+            add_db_latency(db.engine, args.db_latency / 1000, counts)
+        results = {mode: run_mode(app, mode, counts, args) for mode in MODES}
+        config = {key: app.config[key] for key in
+                  ("INQUIRY_BUFFER_SIZE", "INQUIRY_BUFFER_BATCH", "INQUIRY_BUFFER_WAIT")}
+
+    meta = environment()
+    meta.update({"requests": args.requests, "workers": args.workers,
+                 "db_latency_ms": args.db_latency, "config": config})
+    write_results(args.output, meta, results)
+
+    print(f"{'mode':10} {'p50':>8} {'p99':>8} {'rps':>9} {'answered':>9} {'durable':>8} "
+          f"{'written':>8} {'inserts':>8} {'commits':>8} {'errors':>7}")
+    for mode, r in results.items():
+        print(f"{mode:10} {r['p50_ms']:8.2f} {r['p99_ms']:8.2f} {r['rps']:9.1f} {r['answered_s']:8.2f}s "
+              f"{r['durable_s']:7.2f}s {r['written']:8} {r['inserts']:8} {r['commits']:8} {r['errors']:7}")
+    print(f"[bench] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
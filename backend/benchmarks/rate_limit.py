@@ -0,0 +1,154 @@
+"""
+Rate-limit load test — legitimate throughput while one client hammers
+/api/check-admin-email and /api/contact.
+
+A fixed pool of worker threads stands in for the sync WSGI workers. Legit
+clients (one IP each) browse the public API while abusive clients (one
+shared IP) send gate probes and contact spam as fast as the pool accepts
+them. Latency is measured from submission, so time spent queued behind an
+abusive request counts. Phases:
+
+  baseline       legit traffic only
+  sleep gate     abuse against the old tree: 200 ms sleeping gate, no limits
+  no limit       abuse against the current gate with the limiter disabled
+  rate limited   abuse against the current gate with the configured limits
+
+Run from backend/ directory:
+  python -m benchmarks.rate_limit
+  python -m benchmarks.rate_limit --workers 4 --abusers 8 --seconds 5
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import bench_app, environment, summarize, write_results
+
+ABUSE_IP = "203.0.113.7"
+LEGACY_GATE = "/bench/legacy-check-admin-email"
+PHASES = ("baseline", "sleep gate", "no limit", "rate limited")
+
+
+def add_legacy_gate(app):
+    """The pre-rate-limit email gate: a lookup followed by a 200 ms sleep."""
+    from flask import jsonify, request
+    from app.models.user import AdminUser
+
+    def legacy_check_admin_email():
+        email = ((request.get_json(silent=True) or {}).get("email") or "").strip().lower()
+        user = AdminUser.query.filter_by(email=email).first() if email else None
+        time.sleep(0.2)
+        return jsonify({"matched": bool(user)}), 200
+
+    app.add_url_rule(LEGACY_GATE, view_func=legacy_check_admin_email, methods=["POST"])
+
+
+def run_phase(app, phase: str, args) -> dict:
+    from app.models.inquiry import Inquiry
+    from app.utils.rate_limit import NullRateLimiter, init_rate_limit
+
+    if phase in ("sleep gate", "no limit"):
+        app.extensions["rate_limiter"] = NullRateLimiter()
+    else:
+        init_rate_limit(app)  # fresh buckets for every phase
+    with app.app_context():
+        inquiries_before = Inquiry.query.count()
+
+    local = threading.local()
+
+    def call(method: str, path: str, ip: str, json=None):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        return client.open(path, method=method, json=json,
+                           environ_base={"REMOTE_ADDR": ip}).status_code
+
+    pool = ThreadPoolExecutor(max_workers=args.workers)
+    deadline = time.perf_counter() + args.seconds
+    legit_durations, legit_errors, abuse_codes = [], [0], {}
+    lock = threading.Lock()
+
+    def legit(n: int):
+        ip, i = f"10.0.{n // 256}.{n % 256}", 0
+        while time.perf_counter() < deadline:
+            path = "/api/projects" if i % 2 else f"/api/projects/{i % 20 + 1}"
+            start = time.perf_counter()
+            status = pool.submit(call, "GET", path, ip).result()
+            elapsed = time.perf_counter() - start
+            with lock:
+                legit_durations.append(elapsed)
+                legit_errors[0] += status != 200
+            i += 1
+            time.sleep(args.think)
+
+    def abuse(n: int):
+        gate = LEGACY_GATE if phase == "sleep gate" else "/api/check-admin-email"
+        i = 0
+        while time.perf_counter() < deadline:
+            if i % 2:
+                request = ("POST", "/api/contact", ABUSE_IP,
+                           {"name": "Spam", "email": f"spam{n}-{i}@example.com", "message": "Buy now"})
+            else:
+                request = ("POST", gate, ABUSE_IP, {"email": f"guess{n}-{i}@example.com"})
+            status = pool.submit(call, *request).result()
+            with lock:
+                abuse_codes[status] = abuse_codes.get(status, 0) + 1
+            i += 1
+
+    threads = [threading.Thread(target=legit, args=(n,)) for n in range(args.legit)]
+    if phase != "baseline":
+        threads += [threading.Thread(target=abuse, args=(n,)) for n in range(args.abusers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    pool.shutdown()
+
+    with app.app_context():
+        written = Inquiry.query.count() - inquiries_before
+    summary = summarize(legit_durations, errors=legit_errors[0])
+    summary["rps"] = round(len(legit_durations) / wall, 1)  # legit requests served per second of wall time
+    summary["abuse_allowed"] = sum(n for status, n in abuse_codes.items() if status != 429)
+    summary["abuse_limited"] = abuse_codes.get(429, 0)
+    summary["inquiries_written"] = written
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--media", type=int, default=5, help="media rows per project")
+    parser.add_argument("--workers", type=int, default=4, help="simulated WSGI worker threads")
+    parser.add_argument("--legit", type=int, default=8, help="legitimate clients")
+    parser.add_argument("--abusers", type=int, default=8, help="abusive clients sharing one IP")
+    parser.add_argument("--think", type=float, default=0.01, help="legit client pause between requests (s)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration of each phase")
+    parser.add_argument("--output", default="rate-limit-results.json")
+    args = parser.parse_args()
+
+    # Clients connect directly, so the limiter can key on REMOTE_ADDR
+    with bench_app(args.projects, args.media, 0, {"TRUSTED_PROXY_COUNT": "0"}) as (app, info):
+        add_legacy_gate(app)
+        results = {phase: run_phase(app, phase, args) for phase in PHASES}
+        limits = {key: app.config[key] for key in ("RATE_LIMIT_CONTACT", "RATE_LIMIT_CHECK_EMAIL")}
+
+    meta = environment()
+    meta.update({
+        "dataset": {"projects": info["projects"], "media": info["media"]},
+        "workers": args.workers, "legit": args.legit, "abusers": args.abusers,
+        "seconds": args.seconds, "limits": limits,
+    })
+    write_results(args.output, meta, results)
+
+    print(f"{'phase':14} {'legit rps':>10} {'p50':>8} {'p99':>8} {'errors':>7} "
+          f"{'abuse ok':>9} {'abuse 429':>10} {'inquiries':>10}")
+    for phase, r in results.items():
+        print(f"{phase:14} {r['rps']:10.1f} {r['p50_ms']:8.2f} {r['p99_ms']:8.2f} {r['errors']:7} "
+              f"{r['abuse_allowed']:9} {r['abuse_limited']:10} {r['inquiries_written']:10}")
+    print(f"[bench] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
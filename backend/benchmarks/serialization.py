@@ -0,0 +1,171 @@
+"""
+Serialization benchmarks — turns a seeded set of projects (1,000 with 10
+media each by default) into JSON with the old per-route ``project_to_dict``
+functions and with ``app.utils.serializers``, with the stdlib encoder and
+with orjson when it is installed. Rows are loaded once; only dict building
+and encoding are timed.
+
+Run from backend/ directory:
+  python -m benchmarks.serialization
+  python -m benchmarks.serialization --baseline benchmarks/serialization-baseline.json
+"""
+import argparse
+import gc
+import sys
+import time
+
+from benchmarks.harness import bench_app, compare, environment, print_table, summarize, write_results
+
+
+# The functions app/routes/public.py and app/routes/admin.py used before the
+# serializer module, kept here as the reference point.
+
+def legacy_public_project(p, cloud_name: str) -> dict:
+    media_list = []
+    for m in p.media:
+        media_list.append({
+            "id": m.id,
+            "media_type": m.media_type,
+            "cloudinary_id": m.cloudinary_id,
+            "url": m.url,
+            "order": m.order
+        })
+    return {
+        "id": p.id,
+        "title": p.title,
+        "category": p.category,
+        "release_date": p.release_date.isoformat() if p.release_date else None,
+        "is_featured": p.is_featured,
+        "thumbnail_url": (
+            f"https://res.cloudinary.com/{cloud_name}/image/upload/w_400,h_300,c_fill/{p.cloudinary_thumbnail_id}.jpg"
+            if p.cloudinary_thumbnail_id
+            else None
+        ),
+        "media": media_list,
+    }
+
+
+def legacy_admin_project(p, cloud_name: str) -> dict:
+    media_list = []
+    for m in p.media:
+        media_list.append({
+            "id": m.id,
+            "media_type": m.media_type,
+            "cloudinary_id": m.cloudinary_id,
+            "url": m.url,
+            "order": m.order
+        })
+    return {
+        "id": p.id,
+        "title": p.title,
+        "description": p.description,
+        "category": p.category,
+        "release_date": p.release_date.isoformat() if p.release_date else None,
+        "is_featured": p.is_featured,
+        "cloudinary_video_id": p.cloudinary_video_id,
+        "cloudinary_thumbnail_id": p.cloudinary_thumbnail_id,
+        "thumbnail_url": (
+            f"https://res.cloudinary.com/{cloud_name}/image/upload/w_400,h_300,c_fill/{p.cloudinary_thumbnail_id}.jpg"
+            if p.cloudinary_thumbnail_id
+            else None
+        ),
+        "video_url": (
+            f"https://res.cloudinary.com/{cloud_name}/video/upload/{p.cloudinary_video_id}.mp4"
+            if p.cloudinary_video_id
+            else None
+        ),
+        "media": media_list,
+        "created_at": p.created_at.isoformat() if p.created_at else None,
+        "updated_at": p.updated_at.isoformat() if p.updated_at else None,
+    }
+
+
+def cases(app, projects) -> dict:
+    """Benchmark name -> zero-argument function producing the encoded body."""
+    from flask.json.provider import DefaultJSONProvider
+    from app.utils.serializers import OrjsonProvider, orjson, serialize_projects
+
+    cloud_name = app.config.get("CLOUDINARY_CLOUD_NAME", "")
+    legacy_encoder = DefaultJSONProvider(app)  # sorted keys, as jsonify did before
+    encoders = {"stdlib": DefaultJSONProvider(app)}
+    if orjson is not None:
+        encoders["orjson"] = OrjsonProvider(app)
+    else:
+        print("[warn] orjson is not installed; skipping the orjson cases", file=sys.stderr)
+    for encoder in encoders.values():
+        encoder.sort_keys = False  # as configured by init_json
+        encoder.ensure_ascii = False
+
+    legacy = {"list": legacy_public_project, "admin": legacy_admin_project}
+    selected = {}
+    for view, legacy_fn in legacy.items():
+        selected[f"{view} legacy + stdlib"] = (
+            lambda fn=legacy_fn: legacy_encoder.dumps([fn(p, cloud_name) for p in projects]))
+        for name, encoder in encoders.items():
+            selected[f"{view} serializer + {name}"] = (
+                lambda v=view, e=encoder: e.dumps(serialize_projects(projects, v)))
+    selected["list serializer (dicts only)"] = lambda: serialize_projects(projects, "list")
+    selected["list legacy (dicts only)"] = lambda: [legacy_public_project(p, cloud_name) for p in projects]
+    return selected
+
+
+def run(fn, iterations: int, warmup: int) -> dict:
+    gc.collect()
+    for _ in range(warmup):
+        fn()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return summarize(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--media", type=int, default=10, help="media rows per project")
+    parser.add_argument("-n", "--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--output", default="serialization-results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed p50 slowdown as a fraction (default 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore p50 changes smaller than this")
+    args = parser.parse_args()
+
+    with bench_app(args.projects, args.media, 0) as (app, info), app.app_context():
+        from sqlalchemy.orm import selectinload
+        from app.models.project import Project
+
+        projects = Project.query.options(selectinload(Project.media)).order_by(Project.id).all()
+        with app.test_request_context():
+            results = {name: run(fn, args.iterations, args.warmup)
+                       for name, fn in cases(app, projects).items()}
+
+    meta = environment()
+    meta.update({
+        "dataset": {"projects": info["projects"], "media": info["media"]},
+        "iterations": args.iterations,
+    })
+    write_results(args.output, meta, results)
+    print_table(results)
+    for view in ("list", "admin"):
+        base = results[f"{view} legacy + stdlib"]["p50_ms"]
+        for name, r in results.items():
+            if name.startswith(f"{view} serializer +") and r["p50_ms"]:
+                print(f"[bench] {name}: {base / r['p50_ms']:.2f}x vs legacy")
+    print(f"[bench] Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance, args.min_delta_ms)
+        for message in regressions:
+            print(f"[REGRESSION] {message}")
+        if regressions:
+            sys.exit(1)
+        print("[ok] No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
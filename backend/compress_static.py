@@ -0,0 +1,78 @@
+"""
+Precompress the built SPAs — writes <file>.br and <file>.gz next to every
+compressible file in frontend/dist and admin-frontend/dist, so the app can
+serve them without compressing per request. A variant is only kept when it is
+smaller than the original. Run after `npm run build` (build.sh does).
+Run from backend/ directory:
+  python compress_static.py
+  python compress_static.py ../frontend/dist
+"""
+import argparse
+import gzip
+import os
+
+try:
+    import brotlicffi as brotli
+except ImportError:
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ROOTS = [
+    os.path.join(HERE, "..", "frontend", "dist"),
+    os.path.join(HERE, "..", "admin-frontend", "dist"),
+]
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".svg", ".json", ".map", ".txt", ".xml", ".ico", ".wasm"}
+MIN_SIZE = 1024  # below this the headers cost more than compression saves
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+parser.add_argument("roots", nargs="*", help="directories to compress (default: both dist folders)")
+args = parser.parse_args()
+
+if brotli is None:
+    print("[warn] brotlicffi/brotli not installed; writing .gz only")
+
+
+def write_variant(path: str, suffix: str, data: bytes, original_size: int) -> int:
+    variant = path + suffix
+    if len(data) >= original_size:
+        if os.path.exists(variant):
+            os.remove(variant)
+        return 0
+    with open(variant, "wb") as f:
+        f.write(data)
+    # Same mtime as the original, so the variant never looks newer than its source
+    st = os.stat(path)
+    os.utime(variant, (st.st_atime, st.st_mtime))
+    return 1
+
+
+for root in args.roots or DEFAULT_ROOTS:
+    root = os.path.abspath(root)
+    if not os.path.isdir(root):
+        print(f"[skip] {root} does not exist (run npm run build first)")
+        continue
+    files = written = before = after = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() not in COMPRESSIBLE:
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < MIN_SIZE:
+                continue
+            files += 1
+            before += len(data)
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            written += write_variant(path, ".gz", gz, len(data))
+            smallest = len(gz)
+            if brotli is not None:
+                br = brotli.compress(data, quality=11)
+                written += write_variant(path, ".br", br, len(data))
+                smallest = min(smallest, len(br))
+            after += min(smallest, len(data))
+    print(f"[ok] {root}: {files} files, {written} variants, "
+          f"{before / 1024:.1f} KB -> {after / 1024:.1f} KB smallest")
@@ -0,0 +1,18 @@
+"""
+Create (or rebuild) the full-text search index on an existing database.
+New databases get it automatically from db.create_all().
+Run from backend/ directory:  python create_search_index.py
+"""
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+from app import create_app, db
+from app.utils.search import create_search_index
+
+app = create_app(os.environ.get("FLASK_ENV", "development"))
+
+with app.app_context():
+    with db.engine.begin() as connection:
+        create_search_index(connection)
+    print(f"[ok] Search index ready ({db.engine.dialect.name}).")
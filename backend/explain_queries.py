@@ -0,0 +1,155 @@
+"""
+Query-plan check — runs EXPLAIN on every SQL statement the API blueprints
+issue against a seeded dataset and fails if any of them scans a whole table.
+
+Uses a throwaway SQLite file by default. To check PostgreSQL, pass an EMPTY
+scratch database (the script seeds it):
+  python explain_queries.py
+  python explain_queries.py --database-url postgresql://.../scratch --projects 5000
+
+Exit code is 1 when a sequential scan is found.
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+parser.add_argument("--database-url")
+parser.add_argument("--projects", type=int, default=2000)
+parser.add_argument("--media", type=int, default=10, help="media rows per project")
+parser.add_argument("--inquiries", type=int, default=20000)
+args = parser.parse_args()
+
+tmpdir = None
+if not args.database_url:
+    tmpdir = tempfile.TemporaryDirectory()
+    args.database_url = f"sqlite:///{os.path.join(tmpdir.name, 'explain.db')}"
+
+# Must be set before the app config is imported
+os.environ["DATABASE_URL"] = args.database_url
+os.environ["RESPONSE_CACHE_BACKEND"] = "null"   # every request must reach the DB
+
+from app import create_app, db  # noqa: E402
+from app.models.project import Project  # noqa: E402
+from app.utils.dataset import seed_dataset  # noqa: E402
+from app.utils.query_budget import count_queries  # noqa: E402
+
+# Scanning a table this small is the right plan (settings, the admin user)
+SMALL_TABLE_ROWS = 100
+
+app = create_app(os.environ.get("FLASK_ENV", "development"))
+app.testing = True
+
+
+def routes(first_id, page_cursor, inquiry_cursor):
+    """Every blueprint route that talks to the database, with sample input."""
+    pid = first_id + 7
+    return [
+        ("GET", "/api/projects?limit=20", None),
+        ("GET", f"/api/projects?limit=20&cursor={page_cursor}", None),
+        ("GET", "/api/projects?category=music%20video&limit=20", None),
+        ("GET", "/api/projects?q=drone%20festival&limit=20", None),
+        ("GET", "/api/projects?featured=1&fields=title,thumbnail_url&limit=20", None),
+        ("GET", f"/api/projects/{pid}", None),
+        ("GET", "/api/categories", None),
+        ("GET", "/api/site-settings", None),
+        ("POST", "/api/contact", {"name": "A", "email": "a@example.com", "message": "Hi"}),
+        ("POST", "/api/check-admin-email", {"email": "nobody@example.com"}),
+        ("GET", "/api/admin/dashboard", None),
+        ("GET", "/api/admin/projects?limit=20", None),
+        ("GET", f"/api/admin/projects/{pid}", None),
+        ("PUT", f"/api/admin/projects/{pid}", {"title": "Renamed", "category": "Reel"}),
+        ("GET", "/api/admin/inquiries?limit=50", None),
+        ("GET", f"/api/admin/inquiries?limit=50&cursor={inquiry_cursor}", None),
+        ("PATCH", "/api/admin/inquiries/10", {"status": "read"}),
+        ("DELETE", "/api/admin/inquiries/11", None),
+        ("GET", "/api/admin/settings", None),
+        ("PUT", "/api/admin/settings", {"setting_1": "changed"}),
+    ]
+
+
+def explain(connection, statement, parameters):
+    """Return the tables the plan reads with a full sequential scan."""
+    if connection.dialect.name == "postgresql":
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        scans = []
+
+        def walk(node):
+            if node.get("Node Type") == "Seq Scan":
+                scans.append(node["Relation Name"])
+            for child in node.get("Plans", []):
+                walk(child)
+
+        walk(plan[0]["Plan"])
+        return scans
+
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    scans = []
+    for row in rows:
+        detail = row[-1]
+        match = re.match(r"SCAN (\w+)", detail)
+        if match and " USING " not in detail and "VIRTUAL TABLE" not in detail:
+            scans.append(match.group(1))
+    return scans
+
+
+def main():
+    with app.app_context():
+        db.create_all()
+        if db.session.query(Project.id).first() is not None:
+            sys.exit("[error] Database is not empty — point --database-url at a scratch database.")
+        info = seed_dataset(args.projects, args.media, args.inquiries)
+        if db.engine.dialect.name == "postgresql":
+            with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("VACUUM ANALYZE")
+        else:
+            with db.engine.begin() as conn:
+                conn.exec_driver_sql("ANALYZE")
+        print(f"[explain] Seeded {info['projects']} projects, {info['media']} media, "
+              f"{info['inquiries']} inquiries on {db.engine.dialect.name}")
+
+    client = app.test_client()
+    token = client.post("/api/admin/login", json=info["admin"]).json["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    page_cursor = client.get("/api/projects?limit=20").json["next_cursor"]
+    inquiry_cursor = client.get("/api/admin/inquiries?limit=50", headers=headers).json["next_cursor"]
+
+    captured = {}
+    for method, url, body in routes(info["first_project_id"], page_cursor, inquiry_cursor):
+        with count_queries() as counter:
+            response = client.open(url, method=method, json=body, headers=headers)
+        if response.status_code >= 400:
+            print(f"[warn] {method} {url} -> {response.status_code}")
+        for statement, parameters in counter.queries:
+            if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+                if isinstance(parameters, list):  # executemany — one row is enough
+                    parameters = parameters[0]
+                captured.setdefault(statement, (f"{method} {url}", parameters))
+
+    failures = []
+    with app.app_context(), db.engine.connect() as connection:
+        sizes = {}
+        for statement, (route, parameters) in captured.items():
+            scans = []
+            for table in explain(connection, statement, parameters):
+                if table not in db.metadata.tables:
+                    continue  # a materialized subquery (anon_N), not a table
+                if table not in sizes:
+                    sizes[table] = connection.exec_driver_sql(f"SELECT count(*) FROM {table}").scalar()
+                if sizes[table] >= SMALL_TABLE_ROWS:
+                    scans.append(table)
+            if scans:
+                failures.append((route, scans, statement))
+
+    print(f"[explain] Checked {len(captured)} distinct statements")
+    for route, scans, statement in failures:
+        print(f"\n[FAIL] {route}: sequential scan on {', '.join(scans)}\n  {' '.join(statement.split())}")
+    if failures:
+        sys.exit(1)
+    print("[ok] No sequential scans.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""site settings version counter
+
+Revision ID: 0004_site_settings_version
+Revises: 0003_upload_jobs
+Create Date: 2026-10-18 11:02:14.512907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_site_settings_version'
+down_revision = '0003_upload_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases built from an earlier copy of 0001 already have the table
+    if sa.inspect(op.get_bind()).has_table('site_settings_version'):
+        return
+    op.create_table('site_settings_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('site_settings_version')
@@ -0,0 +1,42 @@
+"""
+Orphaned-asset sweeper — lists the Cloudinary folder page by page, diffs it
+against every public_id the database references and reclaims the rest.
+Dry run unless --delete is given.
+Run from backend/ directory:
+  python sweep_orphans.py
+  python sweep_orphans.py --delete --min-age-hours 48
+"""
+import argparse
+import os
+from datetime import timedelta
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app import create_app  # noqa: E402
+from app.utils.media_cleanup import delete_assets, find_orphans  # noqa: E402
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+parser.add_argument("--prefix", default="videolozy/", help="folder prefix to sweep")
+parser.add_argument("--min-age-hours", type=float, default=24,
+                    help="skip assets newer than this (uploads not yet saved to a project)")
+parser.add_argument("--delete", action="store_true", help="actually delete the orphans")
+args = parser.parse_args()
+
+app = create_app(os.environ.get("FLASK_ENV", "development"))
+
+with app.app_context():
+    orphans = []
+    total_bytes = 0
+    for resource_type, public_id, size in find_orphans(args.prefix, timedelta(hours=args.min_age_hours)):
+        orphans.append((resource_type, public_id))
+        total_bytes += size
+        print(f"[orphan] {resource_type:5} {public_id} ({size / (1024 * 1024):.1f} MB)")
+
+    print(f"[sweep] {len(orphans)} orphaned asset(s), {total_bytes / (1024 * 1024):.1f} MB")
+    if orphans and args.delete:
+        report = delete_assets(orphans)
+        print(f"[sweep] Deleted {report['deleted']}, already gone {report['not_found']}, "
+              f"failed {len(report['failed'])}")
+    elif orphans:
+        print("[sweep] Dry run — pass --delete to reclaim them.")
@@ -13,4 +13,7 @@ npm run build --prefix admin-frontend
 echo "Installing Backend Dependencies (Python/Flask)..."
 pip install -r backend/requirements.txt
 
+echo "Precompressing frontend assets (.br/.gz)..."
+python backend/compress_static.py
+
 echo "Build complete."
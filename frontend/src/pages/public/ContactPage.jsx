@@ -46,7 +46,7 @@ export default function ContactPage() {
         } catch (err) {
             const msg = err.response?.data?.errors
                 ? Object.values(err.response.data.errors).join(' ')
-                : 'Something went wrong. Please try again.';
+                : err.response?.data?.error || 'Something went wrong. Please try again.';
             setServerError(msg);
         } finally {
             setSubmitting(false);
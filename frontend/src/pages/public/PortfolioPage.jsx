@@ -5,7 +5,7 @@ import { Film, Instagram, Youtube } from 'lucide-react';
 import Navbar from '../../components/Navbar';
 import Footer from '../../components/Footer';
 import LoadingSpinner from '../../components/LoadingSpinner';
-import { fetchProjects, fetchSiteSettings } from '../../services/api';
+import { fetchCategories, fetchProjects, fetchSiteSettings } from '../../services/api';
 
 /* ─── Shared: Section Tab Strip ─────────────────────────────────── */
 function TabStrip({ active }) {
@@ -41,19 +41,25 @@ function SkillChip({ label, color, border }) {
 /* ─── Main Page ──────────────────────────────────────────────────── */
 export default function PortfolioPage() {
     const [projects, setProjects] = useState([]);
+    const [categoryNames, setCategoryNames] = useState([]);
     const [settings, setSettings] = useState({});
     const [loading, setLoading] = useState(true);
     const [activeCategory, setActiveCategory] = useState('All');
     const cloudName = import.meta.env.VITE_CLOUDINARY_CLOUD_NAME || '';
 
     useEffect(() => {
-        Promise.all([fetchProjects(), fetchSiteSettings()])
-            .then(([p, s]) => { setProjects(p.data); setSettings(s.data); })
+        Promise.all([fetchProjects(), fetchCategories(), fetchSiteSettings()])
+            .then(([p, c, s]) => {
+                setProjects(p.data);
+                setCategoryNames(c.data.map((f) => f.category));
+                setSettings(s.data);
+            })
             .catch(console.error)
             .finally(() => setLoading(false));
     }, []);
 
-    const categories = ['All', ...Array.from(new Set(projects.map((p) => p.category).filter(Boolean)))];
+    // Chips come from /api/categories (most projects first)
+    const categories = ['All', ...categoryNames];
     const filtered = activeCategory === 'All' ? projects : projects.filter((p) => p.category === activeCategory);
 
     const name = settings.editor_name || 'Bhuvan Bhaskar';
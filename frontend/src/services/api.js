@@ -15,8 +15,15 @@ api.interceptors.request.use((config) => {
 });
 
 // ── Public ────────────────────────────────────────────────────────────────────
-export const fetchProjects = (category) =>
-    api.get('/projects', { params: category ? { category } : {} });
+// Everything ProjectCard and the portfolio grid read; skips media and long text
+export const PROJECT_CARD_FIELDS = 'title,category,release_date,is_featured,thumbnail_url';
+
+export const fetchProjects = (category, params = {}) =>
+    api.get('/projects', {
+        params: { fields: PROJECT_CARD_FIELDS, ...(category ? { category } : {}), ...params },
+    });
+
+export const fetchCategories = () => api.get('/categories');
 
 export const fetchProject = (id) => api.get(`/projects/${id}`);
 
@@ -71,4 +78,28 @@ export const uploadFile = (file, resourceType = 'image', folder = '', onProgress
     return api.post('/admin/upload', form, config);
 };
 
+// Direct-to-Cloudinary upload: the file bytes skip the Flask server entirely
+export const directUpload = async (file, resourceType = 'image', folder = '', onProgress = null) => {
+    const { data: sig } = await api.post('/admin/upload/signature', {
+        resource_type: resourceType,
+        ...(folder ? { folder } : {}),
+    });
+    if (file.size > sig.max_file_size) {
+        throw new Error('File exceeds the maximum upload size');
+    }
+
+    const form = new FormData();
+    form.append('file', file);
+    form.append('api_key', sig.api_key);
+    form.append('signature', sig.signature);
+    Object.entries(sig.params).forEach(([key, value]) => form.append(key, value));
+
+    const { data: result } = await axios.post(sig.upload_url, form, {
+        onUploadProgress: onProgress
+            ? (evt) => onProgress(Math.round((evt.loaded * 100) / evt.total))
+            : undefined,
+    });
+    return api.post('/admin/upload/complete', result);
+};
+
 export default api;